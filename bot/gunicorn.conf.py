@@ -0,0 +1,22 @@
+"""letsTrade - Gunicorn 설정 (gunicorn main:app -c gunicorn.conf.py)"""
+
+import multiprocessing
+import os
+
+# 바인딩
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# 워커: 프로세스마다 uvloop + httptools 이벤트 루프 하나씩 실행 (uvicorn[standard])
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def _default_workers() -> int:
+    """기본 워커 수 (Railway 컨테이너는 작으므로 2개, 그 외 2 * 코어 + 1)"""
+    if os.getenv("RAILWAY_ENVIRONMENT"):
+        return 2
+    return multiprocessing.cpu_count() * 2 + 1
+
+
+workers = int(os.getenv("WEB_CONCURRENCY", _default_workers()))
+worker_connections = 1000
+keepalive = 5
@@ -3,30 +3,41 @@
 import os
 import sys
 
-# src 폴더를 모듈 경로에 추가
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
-
+# lets_trade 패키지는 설치된 상태로 사용 (pip install -e . / requirements.txt)
 import uvicorn
+from fastapi.responses import ORJSONResponse
 from lets_trade import __version__
 from lets_trade.api_server import create_app
 
 # API 서버 앱 생성
 app = create_app()
 
+# 고정 응답은 모듈 로드 시 한 번만 생성
+_ROOT_INFO = {
+    "name": "letsTrade",
+    "version": __version__,
+    "status": "running",
+    "docs": "/docs",
+    "api": "/api/v1",
+}
+
 
 # 기존 루트 엔드포인트 유지 (하위 호환성)
 @app.get("/")
 async def root():
     """헬스체크 및 기본 정보"""
-    return {
-        "name": "letsTrade",
-        "version": __version__,
-        "status": "running",
-        "docs": "/docs",
-        "api": "/api/v1",
-    }
+    return ORJSONResponse(_ROOT_INFO)
 
 
+# 운영 환경은 Procfile의 gunicorn + UvicornWorker로 실행 (gunicorn.conf.py 참고)
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=False,  # autoreload은 uvloop 고속 경로를 비활성화
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
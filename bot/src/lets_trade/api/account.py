@@ -1,15 +1,15 @@
 """계좌 정보 조회 API"""
 
-from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
+import msgspec
+
 from .client import LSApiClient
 
 
-@dataclass
-class Position:
+class Position(msgspec.Struct, frozen=True, gc=False):
     """보유 종목 정보"""
     symbol: str          # 종목코드
     name: str            # 종목명
@@ -21,9 +21,22 @@ class Position:
     profit_loss: float   # 평가손익
     profit_rate: float   # 수익률(%)
 
+    def to_dict(self) -> dict:
+        """dict 변환 (asdict의 재귀 복사 없이)"""
+        return {
+            "symbol": self.symbol,
+            "name": self.name,
+            "quantity": self.quantity,
+            "avg_price": self.avg_price,
+            "current_price": self.current_price,
+            "total_cost": self.total_cost,
+            "market_value": self.market_value,
+            "profit_loss": self.profit_loss,
+            "profit_rate": self.profit_rate,
+        }
+
 
-@dataclass
-class Balance:
+class Balance(msgspec.Struct, frozen=True):
     """계좌 잔고 정보"""
     deposit: int         # 예수금
     available: int       # 주문가능금액
@@ -32,6 +45,17 @@ class Balance:
     profit_rate: float   # 총수익률(%)
     positions: list[Position]  # 보유종목 리스트
 
+    def to_dict(self) -> dict:
+        """dict 변환 (asdict의 재귀 복사 없이)"""
+        return {
+            "deposit": self.deposit,
+            "available": self.available,
+            "total_eval": self.total_eval,
+            "total_profit": self.total_profit,
+            "profit_rate": self.profit_rate,
+            "positions": [p.to_dict() for p in self.positions],
+        }
+
 
 class AccountApi:
     """계좌 정보 조회 API"""
@@ -39,7 +63,13 @@ class AccountApi:
     def __init__(self, client: LSApiClient):
         self.client = client
 
-    def get_balance(self, account_no: Optional[str] = None) -> Balance:
+    def _split_account(self, account_no: Optional[str]) -> tuple[str, str]:
+        """계좌번호 분리 (미입력시 클라이언트에 미리 계산된 값 사용)"""
+        if account_no:
+            return LSApiClient.split_account_no(account_no)
+        return self.client.account_prefix, self.client.account_suffix
+
+    async def get_balance(self, account_no: Optional[str] = None) -> Balance:
         """
         계좌 잔고 조회 (CSPAQ12300)
 
@@ -49,11 +79,9 @@ class AccountApi:
         Returns:
             Balance: 잔고 정보
         """
-        acct = account_no or self.client.account_no
-        acct_prefix = acct[:8] if len(acct) >= 8 else acct
-        acct_suffix = acct[8:10] if len(acct) >= 10 else "01"
+        acct_prefix, acct_suffix = self._split_account(account_no)
 
-        response = self.client.post(
+        response = await self.client.post(
             path="/stock/accno",
             tr_cd="CSPAQ12300",
             data={
@@ -75,16 +103,13 @@ class AccountApi:
         profit_rate = float(summary.get("EvalPnlRat", 0))
 
         # 보유종목
-        positions = []
         items = response.get("CSPAQ12300OutBlock3", [])
         if isinstance(items, dict):
             items = [items]
 
-        for item in items:
-            if not item.get("IsuNo"):
-                continue
-            positions.append(Position(
-                symbol=item.get("IsuNo", "").replace("A", ""),
+        positions = [
+            Position(
+                symbol=item["IsuNo"].removeprefix("A"),  # 종목코드 앞의 A 제거
                 name=item.get("IsuNm", ""),
                 quantity=int(item.get("BalQty", 0)),
                 avg_price=float(item.get("PchsPrc", 0)),
@@ -93,7 +118,10 @@ class AccountApi:
                 market_value=int(item.get("BalEvalAmt", 0)),
                 profit_loss=float(item.get("EvalPnl", 0)),
                 profit_rate=float(item.get("EvalPnlRat", 0)),
-            ))
+            )
+            for item in items
+            if item.get("IsuNo")
+        ]
 
         return Balance(
             deposit=deposit,
@@ -104,7 +132,7 @@ class AccountApi:
             positions=positions,
         )
 
-    def get_deposit(self, account_no: Optional[str] = None) -> dict:
+    async def get_deposit(self, account_no: Optional[str] = None) -> dict:
         """
         예수금 상세 조회 (CSPAQ22200)
 
@@ -114,11 +142,9 @@ class AccountApi:
         Returns:
             dict: 예수금 상세 정보
         """
-        acct = account_no or self.client.account_no
-        acct_prefix = acct[:8] if len(acct) >= 8 else acct
-        acct_suffix = acct[8:10] if len(acct) >= 10 else "01"
+        acct_prefix, acct_suffix = self._split_account(account_no)
 
-        response = self.client.post(
+        response = await self.client.post(
             path="/stock/accno",
             tr_cd="CSPAQ22200",
             data={
@@ -140,7 +166,7 @@ class AccountApi:
             "substitute": int(block.get("SubstAmt", 0)),       # 대용금액
         }
 
-    def get_positions(self, account_no: Optional[str] = None) -> list[Position]:
+    async def get_positions(self, account_no: Optional[str] = None) -> list[Position]:
         """
         보유 종목만 조회
 
@@ -150,5 +176,5 @@ class AccountApi:
         Returns:
             list[Position]: 보유 종목 리스트
         """
-        balance = self.get_balance(account_no)
+        balance = await self.get_balance(account_no)
         return balance.positions
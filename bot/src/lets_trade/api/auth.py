@@ -1,45 +1,57 @@
 """LS증권 API 인증 모듈"""
 
+import asyncio
 import time
 from dataclasses import dataclass
 from typing import Optional
 
 import httpx
+import orjson
 
 from .config import LSApiConfig
 
 
-@dataclass
+# 네트워크 지연을 고려해 실제 만료 5분 전부터 만료로 간주
+EXPIRY_BUFFER_SECONDS = 300
+
+
+@dataclass(slots=True, frozen=True)
 class TokenInfo:
     """액세스 토큰 정보"""
     access_token: str
     token_type: str
-    expires_in: int  # 초 단위
-    issued_at: float  # timestamp
+    expires_at: float  # 만료로 간주하는 시각 (timestamp, 버퍼 반영)
 
     @property
     def is_expired(self) -> bool:
-        """토큰 만료 여부 (만료 1분 전에 갱신)"""
-        buffer_seconds = 60
-        return time.time() >= (self.issued_at + self.expires_in - buffer_seconds)
+        """토큰 만료 여부"""
+        return time.time() >= self.expires_at
 
 
 class LSAuthClient:
     """LS증권 API 인증 클라이언트"""
 
     TOKEN_ENDPOINT = "/oauth2/token"
+    REFRESH_AHEAD_SECONDS = 300  # 백그라운드 선갱신 시점 (expires_at 5분 전 = 실제 만료 10분 전)
+    REFRESH_RETRY_SECONDS = 30   # 선갱신 실패 시 재시도 간격
 
-    def __init__(self, config: LSApiConfig):
+    def __init__(self, config: LSApiConfig, client: Optional[httpx.AsyncClient] = None):
         self.config = config
         self._token: Optional[TokenInfo] = None
-        self._client = httpx.Client(
+        self._expires_at = 0.0  # 토큰 만료 시각 미러 (토큰 없으면 0 → 항상 만료)
+        self._auth_header = ""  # 토큰과 함께 갱신되는 "Bearer ..." 캐시
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        # 외부에서 주입된 클라이언트는 소유자가 정리
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
             base_url=config.base_url,
             timeout=30.0,
         )
 
-    def _request_token(self) -> TokenInfo:
+    async def _request_token(self) -> TokenInfo:
         """Access Token 발급 요청"""
-        response = self._client.post(
+        response = await self._client.post(
             self.TOKEN_ENDPOINT,
             data={
                 "grant_type": "client_credentials",
@@ -52,37 +64,81 @@ class LSAuthClient:
             },
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if "access_token" not in data:
             error_msg = data.get("error_description", data.get("message", "Unknown error"))
             raise AuthenticationError(f"토큰 발급 실패: {error_msg}")
 
+        expires_in = int(data.get("expires_in", 86400))  # 기본 24시간
         return TokenInfo(
             access_token=data["access_token"],
             token_type=data.get("token_type", "Bearer"),
-            expires_in=int(data.get("expires_in", 86400)),  # 기본 24시간
-            issued_at=time.time(),
+            expires_at=time.time() + expires_in - EXPIRY_BUFFER_SECONDS,
         )
 
-    def get_token(self) -> str:
+    def _set_token(self, token: Optional[TokenInfo]) -> None:
+        """토큰 및 Authorization 헤더 캐시 갱신"""
+        self._token = token
+        self._expires_at = token.expires_at if token else 0.0
+        self._auth_header = f"Bearer {token.access_token}" if token else ""
+        if token is not None and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._auto_refresh_loop())
+
+    async def _auto_refresh_loop(self) -> None:
+        """만료 전에 토큰을 미리 갱신 (요청 경로의 401 재시도를 예외 상황으로 만듦)"""
+        while self._token is not None:
+            token = self._token
+            delay = token.expires_at - self.REFRESH_AHEAD_SECONDS - time.time()
+            await asyncio.sleep(max(delay, self.REFRESH_RETRY_SECONDS))
+
+            # 대기 중 폐기되었거나 다른 경로에서 이미 갱신된 경우
+            if self._token is None:
+                return
+            if self._token is not token:
+                continue
+
+            try:
+                async with self._token_lock:
+                    if self._token is token:
+                        self._set_token(await self._request_token())
+            except (httpx.HTTPError, AuthenticationError):
+                # 실패 시 재시도 간격 후 다시 시도 (만료되면 get_token이 직접 발급)
+                continue
+
+    async def get_token(self) -> str:
         """유효한 Access Token 반환 (필요시 자동 갱신)"""
-        if self._token is None or self._token.is_expired:
-            self._token = self._request_token()
+        if time.time() >= self._expires_at:
+            # 동시 요청 시 토큰 중복 발급 방지
+            async with self._token_lock:
+                if time.time() >= self._expires_at:
+                    self._set_token(await self._request_token())
         return self._token.access_token
 
-    def refresh_token(self) -> str:
-        """토큰 강제 갱신"""
-        self._token = self._request_token()
+    async def get_auth_header(self) -> str:
+        """Authorization 헤더 값 반환 (토큰 갱신 시에만 새로 생성)"""
+        await self.get_token()
+        return self._auth_header
+
+    async def refresh_token(self, rejected_header: Optional[str] = None) -> str:
+        """토큰 강제 갱신
+
+        Args:
+            rejected_header: 401을 받은 요청의 Authorization 값. 주면 그 사이 다른 요청이
+                이미 갱신한 경우 새로 발급하지 않고 현재 토큰을 반환 (동시 401 시 한 번만 발급)
+        """
+        async with self._token_lock:
+            if self._token is None or rejected_header in (None, self._auth_header):
+                self._set_token(await self._request_token())
         return self._token.access_token
 
-    def revoke_token(self) -> bool:
+    async def revoke_token(self) -> bool:
         """토큰 폐기"""
         if self._token is None:
             return True
 
         try:
-            response = self._client.post(
+            response = await self._client.post(
                 "/oauth2/revoke",
                 data={
                     "token": self._token.access_token,
@@ -94,7 +150,7 @@ class LSAuthClient:
                 },
             )
             response.raise_for_status()
-            self._token = None
+            self._set_token(None)
             return True
         except httpx.HTTPError:
             return False
@@ -102,17 +158,21 @@ class LSAuthClient:
     @property
     def is_authenticated(self) -> bool:
         """인증 상태 확인"""
-        return self._token is not None and not self._token.is_expired
+        return time.time() < self._expires_at
 
-    def close(self):
+    async def aclose(self):
         """리소스 정리"""
-        self._client.close()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._owns_client:
+            await self._client.aclose()
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
 
 class AuthenticationError(Exception):
@@ -3,6 +3,7 @@
 from typing import Any, Optional
 
 import httpx
+import orjson
 
 from .auth import AuthenticationError, LSAuthClient
 from .config import LSApiConfig
@@ -13,24 +14,42 @@ class LSApiClient:
 
     def __init__(self, config: Optional[LSApiConfig] = None):
         self.config = config or LSApiConfig.from_env()
-        self._auth = LSAuthClient(self.config)
-        self._client = httpx.Client(
+        # 인증/조회/주문이 같은 호스트이므로 커넥션 풀 하나를 공유 (HTTP/2 멀티플렉싱)
+        self._client = httpx.AsyncClient(
             base_url=self.config.base_url,
-            timeout=30.0,
+            http2=True,
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=64,
+                max_connections=128,
+                keepalive_expiry=300,
+            ),
         )
-
-    def _get_headers(self, tr_cd: str, tr_cont: str = "N") -> dict[str, str]:
-        """API 호출 공통 헤더"""
-        return {
+        self._auth = LSAuthClient(self.config, client=self._client)
+        # 요청마다 바뀌지 않는 헤더 템플릿
+        self._base_headers = {
             "Content-Type": "application/json; charset=utf-8",
-            "Authorization": f"Bearer {self._auth.get_token()}",
-            "tr_cd": tr_cd,
-            "tr_cont": tr_cont,
             "tr_cont_key": "",
             "mac_address": "",
         }
+        self._acct_prefix, self._acct_suffix = self.split_account_no(self.config.account_no)
+
+    @staticmethod
+    def split_account_no(account_no: str) -> tuple[str, str]:
+        """계좌번호를 (계좌번호 8자리, 상품코드 2자리)로 분리"""
+        prefix = account_no[:8] if len(account_no) >= 8 else account_no
+        suffix = account_no[8:10] if len(account_no) >= 10 else "01"
+        return prefix, suffix
 
-    def request(
+    async def _get_headers(self, tr_cd: str, tr_cont: str = "N") -> dict[str, str]:
+        """API 호출 공통 헤더"""
+        headers = self._base_headers.copy()
+        headers["Authorization"] = await self._auth.get_auth_header()
+        headers["tr_cd"] = tr_cd
+        headers["tr_cont"] = tr_cont
+        return headers
+
+    async def request(
         self,
         method: str,
         path: str,
@@ -40,39 +59,40 @@ class LSApiClient:
         tr_cont: str = "N",
     ) -> dict[str, Any]:
         """API 요청 실행"""
-        headers = self._get_headers(tr_cd, tr_cont)
+        headers = await self._get_headers(tr_cd, tr_cont)
+        # 본문은 한 번만 직렬화해 401 재시도 시에도 그대로 재사용
+        # (content= 전달 시 Content-Type은 공통 헤더 템플릿에서 지정)
+        body = orjson.dumps(data) if data is not None else None
 
         try:
-            response = self._client.request(
+            response = await self._client.request(
                 method=method,
                 url=path,
                 headers=headers,
-                json=data,
+                content=body,
                 params=params,
             )
-            response.raise_for_status()
-            return response.json()
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                # 토큰 만료 시 갱신 후 재시도
-                self._auth.refresh_token()
-                headers = self._get_headers(tr_cd, tr_cont)
-                response = self._client.request(
+            if response.status_code == 401:
+                # 토큰 만료 시 갱신 후 재시도 (Authorization만 교체)
+                # 동시에 401을 받은 요청들은 먼저 갱신한 쪽의 새 토큰을 함께 사용
+                await self._auth.refresh_token(headers["Authorization"])
+                headers["Authorization"] = await self._auth.get_auth_header()
+                response = await self._client.request(
                     method=method,
                     url=path,
                     headers=headers,
-                    json=data,
+                    content=body,
                     params=params,
                 )
-                response.raise_for_status()
-                return response.json()
-            raise ApiError(f"API 요청 실패: {e.response.status_code} - {e.response.text}")
-
         except httpx.RequestError as e:
             raise ApiError(f"네트워크 오류: {str(e)}")
 
-    def get(
+        # 상태 코드는 예외 대신 정수 비교로 분기
+        if response.status_code >= 400:
+            raise ApiError(f"API 요청 실패: {response.status_code} - {response.text}")
+        return orjson.loads(response.content)
+
+    async def get(
         self,
         path: str,
         tr_cd: str,
@@ -80,9 +100,9 @@ class LSApiClient:
         tr_cont: str = "N",
     ) -> dict[str, Any]:
         """GET 요청"""
-        return self.request("GET", path, tr_cd, params=params, tr_cont=tr_cont)
+        return await self.request("GET", path, tr_cd, params=params, tr_cont=tr_cont)
 
-    def post(
+    async def post(
         self,
         path: str,
         tr_cd: str,
@@ -90,7 +110,7 @@ class LSApiClient:
         tr_cont: str = "N",
     ) -> dict[str, Any]:
         """POST 요청"""
-        return self.request("POST", path, tr_cd, data=data, tr_cont=tr_cont)
+        return await self.request("POST", path, tr_cd, data=data, tr_cont=tr_cont)
 
     @property
     def is_authenticated(self) -> bool:
@@ -102,16 +122,26 @@ class LSApiClient:
         """계좌번호"""
         return self.config.account_no
 
-    def close(self):
+    @property
+    def account_prefix(self) -> str:
+        """계좌번호 앞 8자리"""
+        return self._acct_prefix
+
+    @property
+    def account_suffix(self) -> str:
+        """계좌 상품코드 (뒤 2자리)"""
+        return self._acct_suffix
+
+    async def aclose(self):
         """리소스 정리"""
-        self._auth.close()
-        self._client.close()
+        await self._auth.aclose()
+        await self._client.aclose()
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
 
 class ApiError(Exception):
@@ -3,6 +3,10 @@
 import os
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+PRODUCTION_URL = "https://openapi.ls-sec.co.kr:9443"
+SIMULATION_URL = "https://openapi.ls-sec.co.kr:29443"
 
 
 class Environment(Enum):
@@ -23,12 +27,13 @@ class LSApiConfig:
     def base_url(self) -> str:
         """환경에 따른 API Base URL"""
         if self.environment == Environment.PRODUCTION:
-            return "https://openapi.ls-sec.co.kr:9443"
-        return "https://openapi.ls-sec.co.kr:29443"
+            return PRODUCTION_URL
+        return SIMULATION_URL
 
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> "LSApiConfig":
-        """환경 변수에서 설정 로드"""
+        """환경 변수에서 설정 로드 (프로세스당 한 번만 파싱)"""
         app_key = os.getenv("LS_APP_KEY")
         app_secret = os.getenv("LS_APP_SECRET")
         account_no = os.getenv("LS_ACCOUNT_NO", "")
@@ -38,7 +43,7 @@ class LSApiConfig:
             raise ValueError("LS_APP_KEY와 LS_APP_SECRET 환경 변수가 필요합니다.")
 
         # URL로 환경 판단
-        env = Environment.PRODUCTION if "9443" in api_url and "29443" not in api_url else Environment.SIMULATION
+        env = Environment.PRODUCTION if api_url.startswith(PRODUCTION_URL) else Environment.SIMULATION
 
         return cls(
             app_key=app_key,
@@ -1,13 +1,32 @@
 """주식 주문 API"""
 
-from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+import msgspec
 
 from .client import ApiError, LSApiClient
 
 
+# 출력 블록이 없을 때 반환하는 읽기 전용 빈 매핑 (매 호출 {} 생성 방지)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@cache
+def _out_block_keys(tr_cd: str) -> tuple[str, str]:
+    """TR 코드별 출력 블록 키 (OutBlock1, OutBlock2)"""
+    return f"{tr_cd}OutBlock1", f"{tr_cd}OutBlock2"
+
+
+def _out_block(response: dict, tr_cd: str) -> Mapping[str, Any]:
+    """응답에서 주문 출력 블록 추출 (OutBlock1 우선, 없으면 OutBlock2)"""
+    key1, key2 = _out_block_keys(tr_cd)
+    return response.get(key1) or response.get(key2) or _EMPTY
+
+
 class OrderType(Enum):
     """주문 유형"""
     LIMIT = "00"        # 지정가
@@ -26,8 +45,14 @@ class OrderSide(Enum):
     SELL = "1"  # 매도
 
 
-@dataclass
-class OrderRequest:
+# 주문 방향별 (TR 코드, 입력 블록명, 표시명)
+_SIDE_TR: dict[OrderSide, tuple[str, str, str]] = {
+    OrderSide.BUY: ("CSPAT00601", "CSPAT00601InBlock1", "매수"),
+    OrderSide.SELL: ("CSPAT00701", "CSPAT00701InBlock1", "매도"),
+}
+
+
+class OrderRequest(msgspec.Struct, frozen=True, gc=False):
     """주문 요청"""
     symbol: str                          # 종목코드
     side: OrderSide                      # 매수/매도
@@ -36,8 +61,7 @@ class OrderRequest:
     order_type: OrderType = OrderType.LIMIT  # 주문유형
 
 
-@dataclass
-class OrderResult:
+class OrderResult(msgspec.Struct, frozen=True, gc=False):
     """주문 결과"""
     order_no: str        # 주문번호
     symbol: str          # 종목코드
@@ -47,9 +71,20 @@ class OrderResult:
     order_time: str      # 주문시간
     status: str          # 상태
 
+    def to_dict(self) -> dict:
+        """dict 변환 (asdict의 재귀 복사 없이)"""
+        return {
+            "order_no": self.order_no,
+            "symbol": self.symbol,
+            "side": self.side,
+            "quantity": self.quantity,
+            "price": self.price,
+            "order_time": self.order_time,
+            "status": self.status,
+        }
+
 
-@dataclass
-class OrderHistory:
+class OrderHistory(msgspec.Struct, frozen=True, gc=False):
     """주문 내역"""
     order_no: str        # 주문번호
     symbol: str          # 종목코드
@@ -62,6 +97,21 @@ class OrderHistory:
     status: str          # 상태
     order_time: str      # 주문시간
 
+    def to_dict(self) -> dict:
+        """dict 변환 (asdict의 재귀 복사 없이)"""
+        return {
+            "order_no": self.order_no,
+            "symbol": self.symbol,
+            "name": self.name,
+            "side": self.side,
+            "order_qty": self.order_qty,
+            "exec_qty": self.exec_qty,
+            "order_price": self.order_price,
+            "exec_price": self.exec_price,
+            "status": self.status,
+            "order_time": self.order_time,
+        }
+
 
 class OrderApi:
     """주식 주문 API"""
@@ -73,6 +123,25 @@ class OrderApi:
         self.client = client
         self.max_amount = max_amount
 
+        # 주문마다 변하지 않는 입력 필드 템플릿 (요청 시 copy 후 가변 필드만 채움)
+        account_fields = {
+            "AcntNo": client.account_prefix,
+            "InptPwd": "",
+            "AcntTpCode": client.account_suffix,
+        }
+        self._order_template = {
+            **account_fields,
+            "MgntrnCode": "000",
+            "LoanDt": "",
+            "OrdCndiTpCode": "0",
+        }
+        self._modify_template = {
+            **account_fields,
+            "OrdprcPtnCode": "00",  # 지정가
+            "OrdCndiTpCode": "0",
+        }
+        self._cancel_template = account_fields
+
     def _validate_order(self, request: OrderRequest) -> None:
         """주문 유효성 검증"""
         if request.quantity <= 0:
@@ -88,7 +157,7 @@ class OrderApi:
                 f"주문 금액({order_amount:,}원)이 한도({self.max_amount:,}원)를 초과합니다."
             )
 
-    def buy(
+    async def buy(
         self,
         symbol: str,
         quantity: int,
@@ -114,9 +183,9 @@ class OrderApi:
             price=price,
             order_type=order_type,
         )
-        return self._place_order(request)
+        return await self._place_order(request)
 
-    def sell(
+    async def sell(
         self,
         symbol: str,
         quantity: int,
@@ -142,58 +211,42 @@ class OrderApi:
             price=price,
             order_type=order_type,
         )
-        return self._place_order(request)
+        return await self._place_order(request)
 
-    def _place_order(self, request: OrderRequest) -> OrderResult:
+    async def _place_order(self, request: OrderRequest) -> OrderResult:
         """주문 실행"""
         self._validate_order(request)
 
-        acct = self.client.account_no
-        acct_prefix = acct[:8] if len(acct) >= 8 else acct
-        acct_suffix = acct[8:10] if len(acct) >= 10 else "01"
-
         # 매수/매도에 따라 TR 코드 선택
-        if request.side == OrderSide.BUY:
-            tr_cd = "CSPAT00601"
-            block_name = "CSPAT00601InBlock1"
-        else:
-            tr_cd = "CSPAT00701"
-            block_name = "CSPAT00701InBlock1"
-
-        response = self.client.post(
+        tr_cd, block_name, side_name = _SIDE_TR[request.side]
+
+        payload = self._order_template.copy()
+        payload["IsuNo"] = f"A{request.symbol}"  # 종목코드 앞에 A 추가
+        payload["OrdQty"] = request.quantity
+        payload["OrdPrc"] = request.price
+        payload["BnsTpCode"] = request.side.value
+        payload["OrdprcPtnCode"] = request.order_type.value
+
+        response = await self.client.post(
             path="/stock/order",
             tr_cd=tr_cd,
-            data={
-                block_name: {
-                    "AcntNo": acct_prefix,
-                    "InptPwd": "",
-                    "AcntTpCode": acct_suffix,
-                    "IsuNo": f"A{request.symbol}",  # 종목코드 앞에 A 추가
-                    "OrdQty": request.quantity,
-                    "OrdPrc": request.price,
-                    "BnsTpCode": request.side.value,
-                    "OrdprcPtnCode": request.order_type.value,
-                    "MgntrnCode": "000",
-                    "LoanDt": "",
-                    "OrdCndiTpCode": "0",
-                }
-            },
+            data={block_name: payload},
         )
 
         # 응답 처리
-        out_block = response.get(f"{tr_cd}OutBlock1", {}) or response.get(f"{tr_cd}OutBlock2", {})
+        out_block = _out_block(response, tr_cd)
 
         return OrderResult(
             order_no=out_block.get("OrdNo", ""),
             symbol=request.symbol,
-            side="매수" if request.side == OrderSide.BUY else "매도",
+            side=side_name,
             quantity=request.quantity,
             price=request.price,
             order_time=out_block.get("OrdTime", ""),
             status="접수",
         )
 
-    def modify(
+    async def modify(
         self,
         order_no: str,
         symbol: str,
@@ -212,29 +265,19 @@ class OrderApi:
         Returns:
             OrderResult: 정정 결과
         """
-        acct = self.client.account_no
-        acct_prefix = acct[:8] if len(acct) >= 8 else acct
-        acct_suffix = acct[8:10] if len(acct) >= 10 else "01"
+        payload = self._modify_template.copy()
+        payload["OrgOrdNo"] = order_no
+        payload["IsuNo"] = f"A{symbol}"
+        payload["OrdQty"] = quantity
+        payload["OrdPrc"] = price
 
-        response = self.client.post(
+        response = await self.client.post(
             path="/stock/order",
             tr_cd="CSPAT00801",
-            data={
-                "CSPAT00801InBlock1": {
-                    "AcntNo": acct_prefix,
-                    "InptPwd": "",
-                    "AcntTpCode": acct_suffix,
-                    "OrgOrdNo": order_no,
-                    "IsuNo": f"A{symbol}",
-                    "OrdQty": quantity,
-                    "OrdprcPtnCode": "00",  # 지정가
-                    "OrdCndiTpCode": "0",
-                    "OrdPrc": price,
-                }
-            },
+            data={"CSPAT00801InBlock1": payload},
         )
 
-        out_block = response.get("CSPAT00801OutBlock1", {}) or response.get("CSPAT00801OutBlock2", {})
+        out_block = _out_block(response, "CSPAT00801")
 
         return OrderResult(
             order_no=out_block.get("OrdNo", ""),
@@ -246,7 +289,7 @@ class OrderApi:
             status="정정접수",
         )
 
-    def cancel(self, order_no: str, symbol: str, quantity: int) -> OrderResult:
+    async def cancel(self, order_no: str, symbol: str, quantity: int) -> OrderResult:
         """
         주문 취소 (CSPAT00901)
 
@@ -258,26 +301,18 @@ class OrderApi:
         Returns:
             OrderResult: 취소 결과
         """
-        acct = self.client.account_no
-        acct_prefix = acct[:8] if len(acct) >= 8 else acct
-        acct_suffix = acct[8:10] if len(acct) >= 10 else "01"
+        payload = self._cancel_template.copy()
+        payload["OrgOrdNo"] = order_no
+        payload["IsuNo"] = f"A{symbol}"
+        payload["OrdQty"] = quantity
 
-        response = self.client.post(
+        response = await self.client.post(
             path="/stock/order",
             tr_cd="CSPAT00901",
-            data={
-                "CSPAT00901InBlock1": {
-                    "AcntNo": acct_prefix,
-                    "InptPwd": "",
-                    "AcntTpCode": acct_suffix,
-                    "OrgOrdNo": order_no,
-                    "IsuNo": f"A{symbol}",
-                    "OrdQty": quantity,
-                }
-            },
+            data={"CSPAT00901InBlock1": payload},
         )
 
-        out_block = response.get("CSPAT00901OutBlock1", {}) or response.get("CSPAT00901OutBlock2", {})
+        out_block = _out_block(response, "CSPAT00901")
 
         return OrderResult(
             order_no=out_block.get("OrdNo", ""),
@@ -289,7 +324,7 @@ class OrderApi:
             status="취소접수",
         )
 
-    def get_orders(self, date: Optional[str] = None) -> list[OrderHistory]:
+    async def get_orders(self, date: Optional[str] = None) -> list[OrderHistory]:
         """
         당일 주문 내역 조회 (t0425)
 
@@ -302,11 +337,9 @@ class OrderApi:
         if date is None:
             date = datetime.now().strftime("%Y%m%d")
 
-        acct = self.client.account_no
-        acct_prefix = acct[:8] if len(acct) >= 8 else acct
-        acct_suffix = acct[8:10] if len(acct) >= 10 else "01"
+        acct_prefix = self.client.account_prefix
 
-        response = self.client.post(
+        response = await self.client.post(
             path="/stock/accno",
             tr_cd="t0425",
             data={
@@ -321,27 +354,25 @@ class OrderApi:
             },
         )
 
-        orders = []
         items = response.get("t0425OutBlock1", [])
         if isinstance(items, dict):
             items = [items]
 
-        for item in items:
-            side = "매수" if item.get("medession", "") == "2" else "매도"
-            orders.append(OrderHistory(
+        return [
+            OrderHistory(
                 order_no=item.get("ordno", ""),
                 symbol=item.get("expcode", ""),
                 name=item.get("hname", ""),
-                side=side,
+                side="매수" if item.get("medession", "") == "2" else "매도",
                 order_qty=int(item.get("qty", 0)),
                 exec_qty=int(item.get("cheqty", 0)),
                 order_price=int(item.get("price", 0)),
                 exec_price=int(item.get("cheprice", 0)),
                 status=item.get("ordermtd", ""),
                 order_time=item.get("ordtime", ""),
-            ))
-
-        return orders
+            )
+            for item in items
+        ]
 
 
 class OrderValidationError(Exception):
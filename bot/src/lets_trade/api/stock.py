@@ -1,12 +1,21 @@
 """주식 시세 조회 API"""
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
+import msgspec
+
 from .client import LSApiClient
 
+# t1101 호가 필드명 (1~10단계, 호출마다 f-string 생성 방지)
+_ASK_PRICE_KEYS = tuple(f"offerho{i}" for i in range(1, 11))
+_ASK_VOLUME_KEYS = tuple(f"offerrem{i}" for i in range(1, 11))
+_BID_PRICE_KEYS = tuple(f"bidho{i}" for i in range(1, 11))
+_BID_VOLUME_KEYS = tuple(f"bidrem{i}" for i in range(1, 11))
+
 
 @dataclass
 class StockPrice:
@@ -35,8 +44,7 @@ class OrderBook:
     timestamp: datetime
 
 
-@dataclass
-class Trade:
+class Trade(msgspec.Struct, frozen=True, gc=False):
     """체결 정보"""
     symbol: str
     price: int           # 체결가
@@ -48,20 +56,23 @@ class Trade:
 class StockApi:
     """주식 시세 조회 API"""
 
+    MAX_CONCURRENCY = 10  # 일괄 조회 시 동시 요청 수 상한
+
     def __init__(self, client: LSApiClient):
         self.client = client
 
-    def get_price(self, symbol: str) -> StockPrice:
+    async def get_price(self, symbol: str, timestamp: Optional[datetime] = None) -> StockPrice:
         """
         주식 현재가 조회 (t1102)
 
         Args:
             symbol: 종목코드 (예: "005930")
+            timestamp: 조회시간 (일괄 조회 시 공통 시각, 미입력시 현재 시각)
 
         Returns:
             StockPrice: 현재가 정보
         """
-        response = self.client.post(
+        response = await self.client.post(
             path="/stock/market-data",
             tr_cd="t1102",
             data={
@@ -84,10 +95,10 @@ class StockApi:
             high_price=int(block.get("high", 0)),
             low_price=int(block.get("low", 0)),
             prev_close=int(block.get("jnilclose", 0)),
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
         )
 
-    def get_orderbook(self, symbol: str) -> OrderBook:
+    async def get_orderbook(self, symbol: str) -> OrderBook:
         """
         주식 호가 조회 (t1101)
 
@@ -97,7 +108,7 @@ class StockApi:
         Returns:
             OrderBook: 호가 정보
         """
-        response = self.client.post(
+        response = await self.client.post(
             path="/stock/market-data",
             tr_cd="t1101",
             data={
@@ -110,18 +121,12 @@ class StockApi:
         block = response.get("t1101OutBlock", {})
 
         # 매도호가 (1~10)
-        ask_prices = []
-        ask_volumes = []
-        for i in range(1, 11):
-            ask_prices.append(int(block.get(f"offerho{i}", 0)))
-            ask_volumes.append(int(block.get(f"offerrem{i}", 0)))
+        ask_prices = [int(block.get(k, 0)) for k in _ASK_PRICE_KEYS]
+        ask_volumes = [int(block.get(k, 0)) for k in _ASK_VOLUME_KEYS]
 
         # 매수호가 (1~10)
-        bid_prices = []
-        bid_volumes = []
-        for i in range(1, 11):
-            bid_prices.append(int(block.get(f"bidho{i}", 0)))
-            bid_volumes.append(int(block.get(f"bidrem{i}", 0)))
+        bid_prices = [int(block.get(k, 0)) for k in _BID_PRICE_KEYS]
+        bid_volumes = [int(block.get(k, 0)) for k in _BID_VOLUME_KEYS]
 
         return OrderBook(
             symbol=symbol,
@@ -132,7 +137,7 @@ class StockApi:
             timestamp=datetime.now(),
         )
 
-    def get_trades(self, symbol: str, count: int = 20) -> list[Trade]:
+    async def get_trades(self, symbol: str, count: int = 20) -> list[Trade]:
         """
         주식 체결 내역 조회 (t1301)
 
@@ -143,7 +148,7 @@ class StockApi:
         Returns:
             list[Trade]: 체결 내역 리스트
         """
-        response = self.client.post(
+        response = await self.client.post(
             path="/stock/market-data",
             tr_cd="t1301",
             data={
@@ -154,22 +159,19 @@ class StockApi:
             },
         )
 
-        trades = []
-        blocks = response.get("t1301OutBlock1", [])
-
-        for block in blocks:
-            trade_type = "매수" if block.get("sign", "") == "2" else "매도"
-            trades.append(Trade(
+        # 행 단위 파싱은 컴프리헨션 한 번으로 처리 (sign "2" = 매수)
+        return [
+            Trade(
                 symbol=symbol,
                 price=int(block.get("price", 0)),
                 volume=int(block.get("cvolume", 0)),
-                trade_type=trade_type,
+                trade_type="매수" if block.get("sign") == "2" else "매도",
                 time=block.get("chetime", ""),
-            ))
-
-        return trades
+            )
+            for block in response.get("t1301OutBlock1", [])
+        ]
 
-    def get_multiple_prices(self, symbols: list[str]) -> dict[str, StockPrice]:
+    async def get_multiple_prices(self, symbols: list[str]) -> dict[str, StockPrice]:
         """
         여러 종목 현재가 일괄 조회
 
@@ -179,10 +181,19 @@ class StockApi:
         Returns:
             dict[str, StockPrice]: 종목코드별 현재가 정보
         """
-        result = {}
-        for symbol in symbols:
-            try:
-                result[symbol] = self.get_price(symbol)
-            except Exception:
-                continue
-        return result
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        now = datetime.now()  # 일괄 조회 결과는 같은 조회시간 공유
+
+        async def fetch(symbol: str) -> StockPrice:
+            async with semaphore:
+                return await self.get_price(symbol, now)
+
+        # 공유 커넥션 풀 위에서 동시 요청 → 지연시간이 합이 아닌 최대 RTT 수준
+        results = await asyncio.gather(
+            *(fetch(symbol) for symbol in symbols), return_exceptions=True
+        )
+        return {
+            symbol: price
+            for symbol, price in zip(symbols, results)
+            if not isinstance(price, Exception)
+        }
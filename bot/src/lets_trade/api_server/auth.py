@@ -1,17 +1,26 @@
 """Supabase 인증 모듈"""
 
+import hashlib
 import os
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
 from supabase import create_client, Client
 
+from .cache import AsyncTTLCache
+
 
 # Bearer 토큰 스키마
 security = HTTPBearer(auto_error=False)
 
+# 검증된 토큰 → 사용자 캐시 (폴링 요청마다 Supabase 왕복 방지)
+USER_CACHE_TTL_SECONDS = 60
+_user_cache = AsyncTTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+
 
 class User(BaseModel):
     """인증된 사용자 정보"""
@@ -21,8 +30,9 @@ class User(BaseModel):
     role: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
-    """Supabase 클라이언트 생성"""
+    """Supabase 클라이언트 싱글톤 (환경변수 조회/클라이언트 생성은 프로세스당 1회)"""
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
@@ -51,11 +61,19 @@ async def get_current_user(
         )
 
     token = credentials.credentials
+    # 원문 토큰 대신 해시를 키로 보관
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    # supabase-py 클라이언트는 동기식이므로 스레드풀에서 실행
+    return await _user_cache.get_or_fetch(
+        key, lambda: run_in_threadpool(_verify_token, token)
+    )
 
+
+def _verify_token(token: str) -> User:
+    """Supabase에서 토큰 검증 및 사용자 정보 조회"""
     try:
         supabase = get_supabase_client()
-
-        # Supabase에서 토큰 검증 및 사용자 정보 조회
         response = supabase.auth.get_user(token)
 
         if response.user is None:
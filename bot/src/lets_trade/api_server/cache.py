@@ -0,0 +1,50 @@
+"""프로세스 내 TTL 캐시"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+from cachetools import TTLCache
+
+
+class AsyncTTLCache:
+    """비동기 조회 결과 TTL 캐시
+
+    미스 시 같은 키의 동시 요청은 키별 락으로 합쳐
+    첫 요청만 실제 조회하고 나머지는 그 결과를 공유합니다 (single-flight).
+    예외는 캐시하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        # 키별 락을 기다리거나 잡고 있는 요청 수 (0이 되면 락 제거)
+        self._waiters: dict[Hashable, int] = {}
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 조회 (미스 시 fetch() 결과 저장 후 반환)"""
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+
+        # release() 직후에는 깨어난 대기자가 아직 락을 다시 잡지 않아 locked()가 False이므로,
+        # 락 상태 대신 대기자 수로 제거 시점을 판단 (fetch 실패 시에도 대기자와 새 요청이 같은 락 사용)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                value = self._cache.get(key)
+                if value is None:
+                    value = await fetch()
+                    self._cache[key] = value
+        finally:
+            remaining = self._waiters[key] - 1
+            if remaining:
+                self._waiters[key] = remaining
+            else:
+                del self._waiters[key]
+                del self._locks[key]
+        return value
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self._cache.clear()
@@ -7,12 +7,13 @@ from sqlalchemy.orm import Session
 from supabase import Client
 
 from ..api import LSApiClient, AccountApi, StockApi, OrderApi
+from ..api.config import LSApiConfig
 from ..db.connection import db, get_sqlite_session, get_supabase
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_ls_client() -> LSApiClient:
-    """LS API 클라이언트 싱글톤"""
+    """LS API 클라이언트 싱글톤 (HTTP 연결 풀 재사용)"""
     return LSApiClient()
 
 
@@ -36,6 +37,21 @@ def get_db() -> Generator[Session, None, None]:
     yield from get_sqlite_session()
 
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
-    """Supabase 클라이언트 의존성"""
+    """Supabase 클라이언트 싱글톤 (HTTP 연결 풀 재사용)"""
     return get_supabase()
+
+
+async def clear_clients() -> None:
+    """클라이언트 싱글톤 초기화 (설정 변경 반영/종료 시 사용)
+
+    LS 클라이언트는 연결 풀을 닫은 뒤 버리고, 다음 호출 때 환경 변수부터 다시 읽습니다.
+    """
+    if get_ls_client.cache_info().currsize:
+        await get_ls_client().aclose()
+    get_ls_client.cache_clear()
+    LSApiConfig.from_env.cache_clear()
+
+    get_supabase_client.cache_clear()
+    db.reset_supabase()
@@ -1,14 +1,19 @@
 """API 서버 메인 모듈"""
 
+import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
+from datetime import datetime
 
+from brotli_asgi import BrotliMiddleware
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .. import __version__
-from .schemas.common import ErrorResponse, ErrorCode
+from .dependencies import clear_clients
+from .schemas.common import ErrorCode
 from .routers import (
     system_router,
     account_router,
@@ -20,13 +25,19 @@ from .routers import (
     orders_router,
 )
 
+logger = logging.getLogger("uvicorn.error")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 라이프사이클 관리"""
     # 시작 시 초기화
+    # uvloop 미설치 시 조용히 asyncio 기본 루프로 대체되므로 실제 루프를 기록
+    loop = asyncio.get_running_loop()
+    logger.info("Event loop: %s.%s", type(loop).__module__, type(loop).__name__)
     yield
     # 종료 시 정리
+    await clear_clients()
 
 
 def create_app() -> FastAPI:
@@ -36,6 +47,7 @@ def create_app() -> FastAPI:
         description="LS증권 API 기반 주식 자동매매 백엔드",
         version=__version__,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS 설정
@@ -57,16 +69,28 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # 응답 압축 (br 지원 클라이언트는 Brotli, 나머지는 gzip으로 대체)
+    # 작은 응답(/health 등)은 minimum_size 미만이라 압축하지 않음
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=4,
+        minimum_size=512,
+        gzip_fallback=True,
+    )
+
     # 전역 예외 핸들러
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
-        return JSONResponse(
+        # ErrorResponse와 같은 형태의 dict를 직접 구성 (모델 생성/덤프 생략)
+        return ORJSONResponse(
             status_code=500,
-            content=ErrorResponse(
-                error_code=ErrorCode.INTERNAL_ERROR,
-                message=str(exc),
-                details={"path": str(request.url.path)},
-            ).model_dump(mode="json"),
+            content={
+                "success": False,
+                "error_code": ErrorCode.INTERNAL_ERROR,
+                "message": str(exc),
+                "details": {"path": request.url.path},
+                "timestamp": datetime.now(),
+            },
         )
 
     # 라우터 마운트
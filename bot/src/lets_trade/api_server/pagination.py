@@ -0,0 +1,77 @@
+"""키셋(seek) 페이지네이션 유틸리티"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query
+
+from .schemas.common import ErrorCode
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """마지막 행의 (created_at, id)를 커서 문자열로 변환"""
+    return f"{created_at.isoformat()}_{row_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """커서 문자열을 (created_at, id)로 변환 (형식 오류 시 400)"""
+    try:
+        created_at, _, row_id = cursor.rpartition("_")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error_code": ErrorCode.VALIDATION_ERROR,
+                "message": "잘못된 커서입니다.",
+            },
+        )
+
+
+def next_cursor(items: list, has_more: bool) -> Optional[str]:
+    """다음 페이지 커서 (다음 페이지가 있을 때만)"""
+    if not has_more or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+def fetch_page(
+    query: Query, model, limit: int, offset: int, cursor: Optional[str]
+) -> tuple[list, Optional[int], bool]:
+    """최신순 목록 한 페이지 조회 -> (items, total, has_more)
+
+    별도 COUNT 쿼리 없이 limit+1건을 가져와 has_more를 판단합니다.
+    offset 조회는 total을 COUNT(*) OVER () 윈도우로 같은 SELECT에서 받고,
+    커서 조회는 total을 계산하지 않습니다 (None).
+    """
+    # 정렬 (최신순, 같은 시각은 id 역순)
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+
+    # 커서가 있으면 (created_at, id) 기준으로 이어서 조회 (깊은 페이지도 OFFSET 스캔 없음)
+    if cursor:
+        cursor_at, cursor_id = decode_cursor(cursor)
+        items = (
+            query.filter(tuple_(model.created_at, model.id) < (cursor_at, cursor_id))
+            .limit(limit + 1)
+            .all()
+        )
+        total = None
+    else:
+        rows = (
+            query.add_columns(func.count().over().label("total_count"))
+            .offset(offset)
+            .limit(limit + 1)
+            .all()
+        )
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total_count
+        else:
+            # 범위를 벗어난 offset일 때만 건수를 따로 조회
+            total = query.order_by(None).count() if offset else 0
+
+    has_more = len(items) > limit
+    return items[:limit], total, has_more
@@ -0,0 +1,64 @@
+"""커스텀 응답 클래스"""
+
+from typing import Any, Iterable, Iterator
+
+import msgspec
+import pydantic_core
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+# 모듈 단위로 재사용하는 인코더
+_ENCODER = msgspec.json.Encoder()
+
+
+class MsgspecResponse(JSONResponse):
+    """msgspec 기반 JSON 응답
+
+    dataclass/datetime을 중간 dict 생성 없이 바로 인코딩합니다.
+    브로커 API 결과를 그대로 내려주는 엔드포인트에서 사용합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _ENCODER.encode(content)
+
+
+class ModelResponse(JSONResponse):
+    """Pydantic 모델 JSON 응답
+
+    response_model 재검증과 jsonable_encoder 순회 없이 pydantic-core로 바로 직렬화합니다.
+    (Decimal은 문자열, datetime은 ISO 8601 - 기본 응답과 동일한 형식)
+    목록 엔드포인트처럼 응답 모델을 직접 만들어 반환하는 곳에서 사용합니다.
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+def ndjson_response(rows: Iterable[BaseModel]) -> StreamingResponse:
+    """모델을 한 줄씩 직렬화해 내려보내는 NDJSON 스트리밍 응답
+
+    전체 결과를 메모리에 올리지 않으므로 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    return StreamingResponse(
+        (pydantic_core.to_json(row) + b"\n" for row in rows),
+        media_type="application/x-ndjson",
+    )
+
+
+def _json_array_chunks(rows: Iterable[BaseModel]) -> Iterator[bytes]:
+    """{"items": [...], "count": N} 형태를 행 단위 조각으로 생성"""
+    yield b'{"items":['
+    count = 0
+    for row in rows:
+        yield (b"," if count else b"") + pydantic_core.to_json(row)
+        count += 1
+    yield b'],"count":%d}' % count
+
+
+def json_array_response(rows: Iterable[BaseModel]) -> StreamingResponse:
+    """모델 목록을 하나의 JSON 객체로 스트리밍하는 응답
+
+    NDJSON을 다루기 어려운 클라이언트용으로, 형식은 일반 JSON이지만
+    ndjson_response와 같이 행 단위로 직렬화하므로 메모리 사용량이 일정합니다.
+    """
+    return StreamingResponse(_json_array_chunks(rows), media_type="application/json")
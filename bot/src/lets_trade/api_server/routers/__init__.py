@@ -1,13 +1,6 @@
 """API 라우터 패키지"""
 
-from .system import router as system_router
-from .account import router as account_router
-from .portfolio import router as portfolio_router
-from .trades import router as trades_router
-from .signals import router as signals_router
-from .strategies import router as strategies_router
-from .stocks import router as stocks_router
-from .orders import router as orders_router
+import importlib
 
 __all__ = [
     "system_router",
@@ -19,3 +12,13 @@ __all__ = [
     "stocks_router",
     "orders_router",
 ]
+
+
+def __getattr__(name: str):
+    """라우터 지연 로딩 (PEP 562) - 실제로 접근한 라우터 모듈만 import"""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{name.removesuffix('_router')}", __name__)
+    router = module.router
+    globals()[name] = router  # 이후 접근은 일반 속성 조회
+    return router
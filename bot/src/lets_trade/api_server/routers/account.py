@@ -1,17 +1,24 @@
 """계좌 관련 라우터"""
 
+import asyncio
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException
 
 from ..auth import User, get_current_user
+from ..cache import AsyncTTLCache
 from ..dependencies import get_account_api
-from ..schemas.account import BalanceResponse, PositionsListResponse, PositionSchema
+from ..responses import MsgspecResponse
+from ..schemas.account import BalanceResponse, PositionsListResponse
 from ..schemas.common import ErrorCode
 from ...api import AccountApi
 
 router = APIRouter()
 
+# 대시보드 폴링(수 초 간격)마다 브로커를 호출하지 않도록 짧게 캐시
+ACCOUNT_CACHE_TTL_SECONDS = 2.0
+_account_cache = AsyncTTLCache(maxsize=16, ttl=ACCOUNT_CACHE_TTL_SECONDS)
+
 
 @router.get("/balance", response_model=BalanceResponse)
 async def get_balance(
@@ -20,21 +27,25 @@ async def get_balance(
 ):
     """계좌 잔고 조회 (인증 필요)"""
     try:
-        balance = account_api.get_balance()
-
-        # 예수금 상세 정보 추가
-        deposit_info = account_api.get_deposit()
+        # 잔고와 예수금 상세는 서로 독립적이므로 동시에 조회
+        balance, deposit_info = await asyncio.gather(
+            _account_cache.get_or_fetch(("balance", current_user.id), account_api.get_balance),
+            _account_cache.get_or_fetch(("deposit", current_user.id), account_api.get_deposit),
+        )
 
-        return BalanceResponse(
-            deposit=balance.deposit,
-            available=balance.available,
-            total_eval=balance.total_eval,
-            total_profit=balance.total_profit,
-            profit_rate=balance.profit_rate,
-            d1_deposit=deposit_info.get("d1_deposit"),
-            d2_deposit=deposit_info.get("d2_deposit"),
-            substitute=deposit_info.get("substitute"),
-            timestamp=datetime.now(),
+        # 브로커 응답에서 바로 만든 값이므로 BalanceResponse 검증 없이 인코딩
+        return MsgspecResponse(
+            {
+                "deposit": balance.deposit,
+                "available": balance.available,
+                "total_eval": balance.total_eval,
+                "total_profit": balance.total_profit,
+                "profit_rate": balance.profit_rate,
+                "d1_deposit": deposit_info.get("d1_deposit"),
+                "d2_deposit": deposit_info.get("d2_deposit"),
+                "substitute": deposit_info.get("substitute"),
+                "timestamp": datetime.now(),
+            }
         )
     except Exception as e:
         raise HTTPException(
@@ -53,27 +64,17 @@ async def get_positions(
 ):
     """보유 종목 조회 (인증 필요)"""
     try:
-        positions = account_api.get_positions()
-
-        position_schemas = [
-            PositionSchema(
-                symbol=p.symbol,
-                name=p.name,
-                quantity=p.quantity,
-                avg_price=p.avg_price,
-                current_price=p.current_price,
-                total_cost=p.total_cost,
-                market_value=p.market_value,
-                profit_loss=p.profit_loss,
-                profit_rate=p.profit_rate,
-            )
-            for p in positions
-        ]
+        # 보유 종목은 잔고 조회 결과에 포함되므로 /balance와 같은 캐시 항목 사용
+        balance = await _account_cache.get_or_fetch(("balance", current_user.id), account_api.get_balance)
+        positions = balance.positions
 
-        return PositionsListResponse(
-            positions=position_schemas,
-            count=len(position_schemas),
-            timestamp=datetime.now(),
+        # Position dataclass는 PositionSchema와 필드가 동일하므로 그대로 인코딩
+        return MsgspecResponse(
+            {
+                "positions": positions,
+                "count": len(positions),
+                "timestamp": datetime.now(),
+            }
         )
     except Exception as e:
         raise HTTPException(
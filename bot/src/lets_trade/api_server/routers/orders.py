@@ -3,18 +3,19 @@
 from datetime import datetime
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from ..auth import User, get_current_user
 from ..dependencies import get_order_api, get_db, get_supabase_client
+from ..responses import MsgspecResponse
 from ..schemas.order import (
     BuyOrderRequest,
     SellOrderRequest,
     ModifyOrderRequest,
     CancelOrderRequest,
     OrderResultResponse,
-    BrokerOrderSchema,
     BrokerOrderListResponse,
 )
 from ..schemas.common import ErrorCode
@@ -29,6 +30,7 @@ router = APIRouter()
 
 def _create_trade_record(
     db: Session,
+    background_tasks: BackgroundTasks,
     order_result,
     order_type: str,
     symbol: str,
@@ -56,20 +58,34 @@ def _create_trade_record(
     db.commit()
     db.refresh(trade)
 
-    # Supabase 동기화
+    # Supabase 동기화는 응답 이후 백그라운드에서 처리 (주문 응답 지연 방지)
+    background_tasks.add_task(_sync_trade_to_supabase, trade.id)
+
+    return trade
+
+
+def _sync_trade_to_supabase(trade_id: int) -> None:
+    """거래 기록 Supabase 동기화 (백그라운드, 자체 세션 사용, 실패 시 무시)
+
+    응답 이후 실행되므로 이미 닫힌 요청 세션 대신 새 세션으로 행을 다시 읽습니다.
+    """
+    sessions = get_db()
+    session = next(sessions)
     try:
-        supabase = get_supabase_client()
-        repo = BaseRepository(Trade, db, supabase, "trades")
-        repo.sync_to_remote(trade)
+        trade = session.get(Trade, trade_id)
+        if trade is not None:
+            repo = BaseRepository(Trade, session, get_supabase_client(), "trades")
+            repo.sync_to_remote(trade)
     except Exception:
         pass
-
-    return trade
+    finally:
+        sessions.close()
 
 
 @router.post("/buy", response_model=OrderResultResponse)
 async def buy_order(
     request: BuyOrderRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     order_api: OrderApi = Depends(get_order_api),
     db: Session = Depends(get_db),
@@ -89,7 +105,7 @@ async def buy_order(
                 },
             )
 
-        result = order_api.buy(
+        result = await order_api.buy(
             symbol=request.symbol,
             quantity=request.quantity,
             price=request.price,
@@ -97,8 +113,11 @@ async def buy_order(
         )
 
         # 거래 기록 생성
-        trade = _create_trade_record(
+        # 로컬 DB 기록은 동기식이므로 스레드풀에서 실행
+        trade = await run_in_threadpool(
+            _create_trade_record,
             db=db,
+            background_tasks=background_tasks,
             order_result=result,
             order_type=TradeOrderType.BUY.value,
             symbol=request.symbol,
@@ -109,16 +128,7 @@ async def buy_order(
             notes=request.notes,
         )
 
-        return OrderResultResponse(
-            order_no=result.order_no,
-            symbol=result.symbol,
-            side=result.side,
-            quantity=result.quantity,
-            price=result.price,
-            order_time=result.order_time,
-            status=result.status,
-            trade_id=trade.id,
-        )
+        return OrderResultResponse(**result.to_dict(), trade_id=trade.id)
 
     except OrderValidationError as e:
         raise HTTPException(
@@ -141,6 +151,7 @@ async def buy_order(
 @router.post("/sell", response_model=OrderResultResponse)
 async def sell_order(
     request: SellOrderRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     order_api: OrderApi = Depends(get_order_api),
     db: Session = Depends(get_db),
@@ -158,7 +169,7 @@ async def sell_order(
                 },
             )
 
-        result = order_api.sell(
+        result = await order_api.sell(
             symbol=request.symbol,
             quantity=request.quantity,
             price=request.price,
@@ -166,8 +177,11 @@ async def sell_order(
         )
 
         # 거래 기록 생성
-        trade = _create_trade_record(
+        # 로컬 DB 기록은 동기식이므로 스레드풀에서 실행
+        trade = await run_in_threadpool(
+            _create_trade_record,
             db=db,
+            background_tasks=background_tasks,
             order_result=result,
             order_type=TradeOrderType.SELL.value,
             symbol=request.symbol,
@@ -178,16 +192,7 @@ async def sell_order(
             notes=request.notes,
         )
 
-        return OrderResultResponse(
-            order_no=result.order_no,
-            symbol=result.symbol,
-            side=result.side,
-            quantity=result.quantity,
-            price=result.price,
-            order_time=result.order_time,
-            status=result.status,
-            trade_id=trade.id,
-        )
+        return OrderResultResponse(**result.to_dict(), trade_id=trade.id)
 
     except OrderValidationError as e:
         raise HTTPException(
@@ -216,22 +221,14 @@ async def modify_order(
 ):
     """주문 정정 (인증 필요)"""
     try:
-        result = order_api.modify(
+        result = await order_api.modify(
             order_no=order_no,
             symbol=request.symbol,
             quantity=request.quantity,
             price=request.price,
         )
 
-        return OrderResultResponse(
-            order_no=result.order_no,
-            symbol=result.symbol,
-            side=result.side,
-            quantity=result.quantity,
-            price=result.price,
-            order_time=result.order_time,
-            status=result.status,
-        )
+        return OrderResultResponse(**result.to_dict())
 
     except Exception as e:
         raise HTTPException(
@@ -252,21 +249,13 @@ async def cancel_order(
 ):
     """주문 취소 (인증 필요)"""
     try:
-        result = order_api.cancel(
+        result = await order_api.cancel(
             order_no=order_no,
             symbol=request.symbol,
             quantity=request.quantity,
         )
 
-        return OrderResultResponse(
-            order_no=result.order_no,
-            symbol=result.symbol,
-            side=result.side,
-            quantity=result.quantity,
-            price=result.price,
-            order_time=result.order_time,
-            status=result.status,
-        )
+        return OrderResultResponse(**result.to_dict())
 
     except Exception as e:
         raise HTTPException(
@@ -285,26 +274,15 @@ async def get_broker_orders(
 ):
     """오늘 브로커 주문 내역 조회 (인증 필요)"""
     try:
-        orders = order_api.get_orders()
-
-        return BrokerOrderListResponse(
-            items=[
-                BrokerOrderSchema(
-                    order_no=o.order_no,
-                    symbol=o.symbol,
-                    name=o.name,
-                    side=o.side,
-                    order_qty=o.order_qty,
-                    exec_qty=o.exec_qty,
-                    order_price=o.order_price,
-                    exec_price=o.exec_price,
-                    status=o.status,
-                    order_time=o.order_time,
-                )
-                for o in orders
-            ],
-            count=len(orders),
-            timestamp=datetime.now(),
+        orders = await order_api.get_orders()
+
+        # OrderHistory Struct는 BrokerOrderSchema와 필드가 동일하므로 검증 없이 그대로 인코딩
+        return MsgspecResponse(
+            {
+                "items": orders,
+                "count": len(orders),
+                "timestamp": datetime.now(),
+            }
         )
 
     except Exception as e:
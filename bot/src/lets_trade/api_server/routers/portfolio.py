@@ -1,15 +1,18 @@
 """포트폴리오 관련 라우터"""
 
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy import func
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+from supabase import Client
 
 from ..auth import User, get_current_user
 from ..dependencies import get_db, get_supabase_client, get_account_api
+from ..responses import MsgspecResponse
 from ..schemas.portfolio import (
     PortfolioPositionSchema,
     PortfolioListResponse,
@@ -17,14 +20,36 @@ from ..schemas.portfolio import (
     SyncResultResponse,
 )
 from ..schemas.common import ErrorCode
+from ...api import Position
 from ...models import Portfolio, Trade
 from ...db.repository import BaseRepository
 
 router = APIRouter()
 
+# Portfolio 금액(Numeric(*, 2)) / 손익률(Numeric(8, 4)) 자릿수
+TWOPLACES = Decimal("0.01")
+FOURPLACES = Decimal("0.0001")
+
+# GET /portfolio 응답에 필요한 컬럼 (PortfolioPositionSchema 필드 순서)
+_POSITION_FIELDS = tuple(PortfolioPositionSchema.model_fields)
+_POSITION_COLUMNS = tuple(Portfolio.__table__.c[name] for name in _POSITION_FIELDS)
+
+# 정렬 허용 컬럼 (고정된 문장 구조로 컴파일 캐시 재사용, 미지원 값은 평가금액순)
+_ORDER_COLUMNS = {
+    "market_value": Portfolio.market_value,
+    "profit_loss": Portfolio.profit_loss,
+    "profit_loss_rate": Portfolio.profit_loss_rate,
+    "total_cost": Portfolio.total_cost,
+    "quantity": Portfolio.quantity,
+    "stock_code": Portfolio.stock_code,
+    "stock_name": Portfolio.stock_name,
+    "created_at": Portfolio.created_at,
+    "updated_at": Portfolio.updated_at,
+}
+
 
 @router.get("", response_model=PortfolioListResponse)
-async def get_portfolio(
+def get_portfolio(
     current_user: User = Depends(get_current_user),
     limit: int = Query(default=100, le=500),
     offset: int = Query(default=0, ge=0),
@@ -33,39 +58,69 @@ async def get_portfolio(
     db: Session = Depends(get_db),
 ):
     """포트폴리오 목록 조회"""
-    query = db.query(Portfolio)
+    # ORM 객체 대신 스키마 필드에 해당하는 컬럼만 Core 수준으로 조회
+    stmt = select(
+        *_POSITION_COLUMNS,
+        func.count().over().label("total_count"),  # 별도 COUNT 쿼리 없이 전체 건수
+    )
 
     # 정렬
-    order_column = getattr(Portfolio, order_by, Portfolio.market_value)
+    order_column = _ORDER_COLUMNS.get(order_by, Portfolio.market_value)
     if ascending:
-        query = query.order_by(order_column.asc())
+        stmt = stmt.order_by(order_column.asc())
     else:
-        query = query.order_by(order_column.desc())
+        stmt = stmt.order_by(order_column.desc())
 
-    total = query.count()
-    items = query.offset(offset).limit(limit).all()
+    rows = db.execute(stmt.offset(offset).limit(limit)).all()
 
-    return PortfolioListResponse(
-        items=[PortfolioPositionSchema.model_validate(item) for item in items],
-        total=total,
-        limit=limit,
-        offset=offset,
+    if rows:
+        total = rows[0].total_count
+    else:
+        # offset이 범위를 벗어나면 윈도우 결과가 없으므로 건수만 따로 조회
+        total = db.execute(select(func.count(Portfolio.id))).scalar_one()
+
+    # DB 컬럼 타입이 스키마와 일치하므로 모델 생성 없이 행을 바로 인코딩
+    # (Decimal은 문자열, datetime은 ISO 형식으로 Pydantic 직렬화 결과와 동일)
+    return MsgspecResponse(
+        {
+            "items": [
+                dict(zip(_POSITION_FIELDS, row))  # 마지막 total_count는 zip에서 제외
+                for row in rows
+            ],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
     )
 
 
 @router.get("/summary", response_model=PortfolioSummaryResponse)
-async def get_portfolio_summary(
+def get_portfolio_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """포트폴리오 요약 조회"""
-    # 집계 쿼리
-    result = db.query(
+    now = datetime.now()
+
+    # 오늘 거래 수 조건 (created_at 인덱스를 타도록 반열린 구간으로 비교)
+    today_start = datetime.combine(now.date(), time.min)
+    today_end = today_start + timedelta(days=1)
+
+    # 포트폴리오 집계 + 오늘 거래 수를 한 번의 SELECT로 조회
+    portfolio_totals = select(
         func.sum(Portfolio.market_value).label("total_value"),
         func.sum(Portfolio.total_cost).label("total_cost"),
         func.sum(Portfolio.profit_loss).label("total_profit"),
         func.count(Portfolio.id).label("position_count"),
-    ).first()
+    ).subquery()
+    today_trades = (
+        select(func.count(Trade.id))
+        .where(Trade.created_at >= today_start, Trade.created_at < today_end)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        select(portfolio_totals, today_trades.label("today_trade_count"))
+    ).one()
 
     total_value = result.total_value or Decimal(0)
     total_cost = result.total_cost or Decimal(0)
@@ -76,14 +131,7 @@ async def get_portfolio_summary(
     if total_cost > 0:
         profit_rate = (total_profit / total_cost) * 100
 
-    # 오늘 거래 수
-    today = datetime.now().date()
-    today_trade_count = (
-        db.query(func.count(Trade.id))
-        .filter(func.date(Trade.created_at) == today)
-        .scalar()
-        or 0
-    )
+    today_trade_count = result.today_trade_count or 0
 
     return PortfolioSummaryResponse(
         total_value=total_value,
@@ -92,7 +140,7 @@ async def get_portfolio_summary(
         profit_rate=profit_rate,
         position_count=result.position_count or 0,
         today_trade_count=today_trade_count,
-        timestamp=datetime.now(),
+        timestamp=now,
     )
 
 
@@ -107,71 +155,10 @@ async def sync_portfolio(
         supabase = get_supabase_client()
 
         # 브로커에서 보유 종목 조회
-        positions = account_api.get_positions()
-
-        added = 0
-        updated = 0
-        removed = 0
-
-        # 현재 DB의 종목 코드 목록
-        existing_codes = {p.stock_code for p in db.query(Portfolio.stock_code).all()}
-        broker_codes = {p.symbol for p in positions}
-
-        # 삭제할 종목 (DB에는 있지만 브로커에는 없음)
-        to_remove = existing_codes - broker_codes
-        if to_remove:
-            db.query(Portfolio).filter(Portfolio.stock_code.in_(to_remove)).delete(
-                synchronize_session=False
-            )
-            removed = len(to_remove)
-
-        # 추가/업데이트
-        for pos in positions:
-            existing = (
-                db.query(Portfolio).filter(Portfolio.stock_code == pos.symbol).first()
-            )
-
-            if existing:
-                # 업데이트
-                existing.stock_name = pos.name
-                existing.quantity = pos.quantity
-                existing.avg_price = Decimal(str(pos.avg_price))
-                existing.current_price = Decimal(str(pos.current_price))
-                existing.total_cost = Decimal(str(pos.total_cost))
-                existing.market_value = Decimal(str(pos.market_value))
-                existing.profit_loss = Decimal(str(pos.profit_loss))
-                existing.profit_loss_rate = Decimal(str(pos.profit_rate))
-                updated += 1
-            else:
-                # 새로 추가
-                new_portfolio = Portfolio(
-                    stock_code=pos.symbol,
-                    stock_name=pos.name,
-                    quantity=pos.quantity,
-                    avg_price=Decimal(str(pos.avg_price)),
-                    current_price=Decimal(str(pos.current_price)),
-                    total_cost=Decimal(str(pos.total_cost)),
-                    market_value=Decimal(str(pos.market_value)),
-                    profit_loss=Decimal(str(pos.profit_loss)),
-                    profit_loss_rate=Decimal(str(pos.profit_rate)),
-                )
-                db.add(new_portfolio)
-                added += 1
-
-        db.commit()
-
-        # Supabase 동기화
-        repo = BaseRepository(Portfolio, db, supabase, "portfolio")
-        for item in db.query(Portfolio).all():
-            repo.sync_to_remote(item)
-
-        return SyncResultResponse(
-            synced_count=added + updated,
-            added=added,
-            updated=updated,
-            removed=removed,
-            timestamp=datetime.now(),
-        )
+        positions = await account_api.get_positions()
+
+        # DB/Supabase 작업은 동기식이므로 이벤트 루프를 막지 않도록 스레드풀에서 실행
+        return await run_in_threadpool(_apply_positions, db, supabase, positions)
 
     except Exception as e:
         db.rollback()
@@ -182,3 +169,64 @@ async def sync_portfolio(
                 "message": f"동기화 오류: {str(e)}",
             },
         )
+
+
+def _apply_positions(db: Session, supabase: Client, positions: list[Position]) -> SyncResultResponse:
+    """브로커 보유 종목을 DB에 반영하고 Supabase로 동기화"""
+    removed = 0
+
+    # 현재 DB의 종목 코드 → ID (한 번의 조회로 기존 종목 전체 확인)
+    existing_ids = dict(db.query(Portfolio.stock_code, Portfolio.id).all())
+    broker_codes = {p.symbol for p in positions}
+
+    # 삭제할 종목 (DB에는 있지만 브로커에는 없음)
+    to_remove = existing_ids.keys() - broker_codes
+    if to_remove:
+        db.query(Portfolio).filter(Portfolio.stock_code.in_(to_remove)).delete(
+            synchronize_session=False
+        )
+        removed = len(to_remove)
+
+    # 추가/업데이트 대상 분리 후 일괄 반영
+    updates = []
+    inserts = []
+    for pos in positions:
+        values = {
+            "stock_code": pos.symbol,
+            "stock_name": pos.name,
+            "quantity": pos.quantity,
+            # 정수 필드는 그대로, 실수 필드는 str() 경유 없이 컬럼 자릿수로 양자화
+            "avg_price": Decimal(pos.avg_price).quantize(TWOPLACES),
+            "current_price": Decimal(pos.current_price),
+            "total_cost": Decimal(pos.total_cost).quantize(TWOPLACES),
+            "market_value": Decimal(pos.market_value),
+            "profit_loss": Decimal(pos.profit_loss).quantize(TWOPLACES),
+            "profit_loss_rate": Decimal(pos.profit_rate).quantize(FOURPLACES),
+        }
+        portfolio_id = existing_ids.get(pos.symbol)
+        if portfolio_id is not None:
+            values["id"] = portfolio_id
+            updates.append(values)
+        else:
+            inserts.append(values)
+
+    if updates:
+        db.bulk_update_mappings(Portfolio, updates)
+    if inserts:
+        db.bulk_insert_mappings(Portfolio, inserts)
+    updated = len(updates)
+    added = len(inserts)
+
+    db.commit()
+
+    # Supabase 동기화
+    repo = BaseRepository(Portfolio, db, supabase, "portfolio")
+    repo.bulk_sync_to_remote(db.query(Portfolio).all())
+
+    return SyncResultResponse(
+        synced_count=added + updated,
+        added=added,
+        updated=updated,
+        removed=removed,
+        timestamp=datetime.now(),
+    )
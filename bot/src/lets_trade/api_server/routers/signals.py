@@ -1,70 +1,162 @@
 """시그널 관련 라우터"""
 
-from datetime import datetime, date, timedelta
-from typing import Optional
+from datetime import datetime, date, time, timedelta
+from typing import Iterator, Literal, Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, case, func, type_coerce
+from sqlalchemy.orm import Session, load_only, raiseload
 
 from ..auth import User, get_current_user
 from ..dependencies import get_db
+from ..pagination import fetch_page, next_cursor
+from ..responses import ModelResponse, json_array_response, ndjson_response
 from ..schemas.signal import SignalSchema, SignalListResponse, SignalStatsResponse
 from ...models import Signal, Strategy
 from ...models.signal import SignalType, SignalStatus
 
 router = APIRouter()
 
+# 상태/유형 문자열 상수 (Enum 속성 조회 생략)
+EXECUTED = SignalStatus.EXECUTED.value
+BUY = SignalType.BUY.value
+SELL = SignalType.SELL.value
+
+# 목록 기본 조회에서 제외하는 무거운 컬럼 (expand=true일 때만 로드)
+_HEAVY_FIELDS = frozenset({"analysis_data"})
+_LIST_COLUMNS = load_only(
+    *(getattr(Signal, name) for name in SignalSchema.model_fields if name not in _HEAVY_FIELDS)
+)
+
+# 전략별 통계 집계 컬럼 (요청마다 식을 다시 만들지 않도록 한 번만 구성)
+_STATS_COLUMNS = (
+    func.count(Signal.id).label("total"),
+    func.sum(case((Signal.status == EXECUTED, 1), else_=0)).label("executed"),
+    func.sum(case((Signal.signal_type == BUY, 1), else_=0)).label("buy"),
+    func.sum(case((Signal.signal_type == SELL, 1), else_=0)).label("sell"),
+    # 평균은 Decimal 변환 없이 float로 받음 (응답 스키마가 float)
+    type_coerce(func.avg(Signal.strength), Float).label("avg_strength"),
+    type_coerce(func.avg(Signal.confidence), Float).label("avg_confidence"),
+)
+
+# 스트리밍 조회 시 한 번에 가져오는 행 수
+STREAM_BATCH_SIZE = 500
+
+
+def _signal_filters(
+    strategy_id: Optional[int],
+    signal_type: Optional[SignalType],
+    status: Optional[SignalStatus],
+    stock_code: Optional[str],
+    from_date: Optional[date],
+    to_date: Optional[date],
+    min_strength: Optional[float],
+) -> list:
+    """목록 필터 조건 (날짜는 created_at 인덱스를 타도록 반열린 구간으로 비교)"""
+    criteria = []
+    if strategy_id:
+        criteria.append(Signal.strategy_id == strategy_id)
+    if signal_type:
+        criteria.append(Signal.signal_type == signal_type)
+    if status:
+        criteria.append(Signal.status == status)
+    if stock_code:
+        criteria.append(Signal.stock_code == stock_code)
+    if from_date:
+        criteria.append(Signal.created_at >= datetime.combine(from_date, time.min))
+    if to_date:
+        criteria.append(Signal.created_at < datetime.combine(to_date + timedelta(days=1), time.min))
+    if min_strength is not None:
+        criteria.append(Signal.strength >= min_strength)
+    return criteria
+
+
+def _iter_signals(criteria: list, expand: bool) -> Iterator[SignalSchema]:
+    """조건에 맞는 시그널을 배치 단위로 순회 (스트리밍 중 실행되므로 자체 세션 사용)"""
+    exclude = frozenset() if expand else _HEAVY_FIELDS
+    sessions = get_db()
+    session = next(sessions)
+    try:
+        query = session.query(Signal).options(raiseload("*"))
+        if not expand:
+            query = query.options(_LIST_COLUMNS)
+        query = (
+            query.filter(*criteria)
+            .order_by(Signal.created_at.desc(), Signal.id.desc())
+            .yield_per(STREAM_BATCH_SIZE)
+        )
+        for row in query:
+            yield SignalSchema.from_orm_fast(row, exclude)
+    finally:
+        sessions.close()
+
 
 @router.get("", response_model=SignalListResponse)
-async def get_signals(
+def get_signals(
     current_user: User = Depends(get_current_user),
     limit: int = Query(default=100, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None),  # 키셋 페이지네이션 (offset보다 권장)
     strategy_id: Optional[int] = Query(default=None),
-    signal_type: Optional[str] = Query(default=None),
-    status: Optional[str] = Query(default=None),
+    signal_type: Optional[SignalType] = Query(default=None),
+    status: Optional[SignalStatus] = Query(default=None),
     stock_code: Optional[str] = Query(default=None),
     from_date: Optional[date] = Query(default=None),
     to_date: Optional[date] = Query(default=None),
     min_strength: Optional[float] = Query(default=None, ge=0, le=100),
+    expand: bool = Query(default=False),  # True면 analysis_data 포함
     db: Session = Depends(get_db),
 ):
     """시그널 목록 조회"""
-    query = db.query(Signal)
+    # 목록 직렬화 중 지연 로딩(N+1)이 생기면 조용히 쿼리하지 않고 즉시 오류
+    query = db.query(Signal).options(raiseload("*"))
+    exclude = frozenset() if expand else _HEAVY_FIELDS
+    if not expand:
+        query = query.options(_LIST_COLUMNS)
+
+    query = query.filter(
+        *_signal_filters(strategy_id, signal_type, status, stock_code, from_date, to_date, min_strength)
+    )
 
-    # 필터링
-    if strategy_id:
-        query = query.filter(Signal.strategy_id == strategy_id)
-    if signal_type:
-        query = query.filter(Signal.signal_type == signal_type)
-    if status:
-        query = query.filter(Signal.status == status)
-    if stock_code:
-        query = query.filter(Signal.stock_code == stock_code)
-    if from_date:
-        query = query.filter(func.date(Signal.created_at) >= from_date)
-    if to_date:
-        query = query.filter(func.date(Signal.created_at) <= to_date)
-    if min_strength is not None:
-        query = query.filter(Signal.strength >= min_strength)
+    items, total, has_more = fetch_page(query, Signal, limit, offset, cursor)
 
-    # 정렬 (최신순)
-    query = query.order_by(Signal.created_at.desc())
+    return ModelResponse(
+        SignalListResponse(
+            items=[SignalSchema.from_orm_fast(item, exclude) for item in items],
+            total=total,
+            limit=limit,
+            offset=offset,
+            has_more=has_more,
+            next_cursor=next_cursor(items, has_more),
+        )
+    )
 
-    total = query.count()
-    items = query.offset(offset).limit(limit).all()
 
-    return SignalListResponse(
-        items=[SignalSchema.model_validate(item) for item in items],
-        total=total,
-        limit=limit,
-        offset=offset,
+@router.get("/stream")
+def stream_signals(
+    current_user: User = Depends(get_current_user),
+    strategy_id: Optional[int] = Query(default=None),
+    signal_type: Optional[SignalType] = Query(default=None),
+    status: Optional[SignalStatus] = Query(default=None),
+    stock_code: Optional[str] = Query(default=None),
+    from_date: Optional[date] = Query(default=None),
+    to_date: Optional[date] = Query(default=None),
+    min_strength: Optional[float] = Query(default=None, ge=0, le=100),
+    expand: bool = Query(default=False),  # True면 analysis_data 포함
+    fmt: Literal["ndjson", "json"] = Query(default="ndjson", alias="format"),
+):
+    """시그널 전체 내보내기 (기본 NDJSON - 한 줄에 시그널 하나, format=json이면 {"items": [...], "count": N})"""
+    criteria = _signal_filters(
+        strategy_id, signal_type, status, stock_code, from_date, to_date, min_strength
     )
+    rows = _iter_signals(criteria, expand)
+    if fmt == "json":
+        return json_array_response(rows)
+    return ndjson_response(rows)
 
 
 @router.get("/stats", response_model=list[SignalStatsResponse])
-async def get_signal_stats(
+def get_signal_stats(
     current_user: User = Depends(get_current_user),
     period_days: int = Query(default=30, ge=1, le=365),
     db: Session = Depends(get_db),
@@ -72,42 +164,31 @@ async def get_signal_stats(
     """전략별 시그널 통계"""
     from_date = datetime.now() - timedelta(days=period_days)
 
-    # 전략별 통계 집계
-    strategies = db.query(Strategy).all()
-    stats = []
-
-    for strategy in strategies:
-        signals = (
-            db.query(Signal)
-            .filter(
-                Signal.strategy_id == strategy.id,
-                Signal.created_at >= from_date,
-            )
-            .all()
+    # 전략별 통계를 GROUP BY 한 번으로 집계 (시그널 없는 전략은 조인에서 제외)
+    rows = (
+        db.query(
+            Strategy.id,
+            Strategy.name,
+            *_STATS_COLUMNS,
         )
+        .join(Signal, Signal.strategy_id == Strategy.id)
+        .filter(Signal.created_at >= from_date)
+        .group_by(Strategy.id, Strategy.name)
+        .order_by(Strategy.id)
+        .all()
+    )
 
-        total = len(signals)
-        if total == 0:
-            continue
-
-        executed = sum(1 for s in signals if s.status == SignalStatus.EXECUTED.value)
-        buy = sum(1 for s in signals if s.signal_type == SignalType.BUY.value)
-        sell = sum(1 for s in signals if s.signal_type == SignalType.SELL.value)
-        avg_strength = sum(float(s.strength) for s in signals) / total
-        avg_confidence = sum(float(s.confidence) for s in signals) / total
-
-        stats.append(
-            SignalStatsResponse(
-                strategy_id=strategy.id,
-                strategy_name=strategy.name,
-                total_signals=total,
-                executed_signals=executed,
-                buy_signals=buy,
-                sell_signals=sell,
-                avg_strength=round(avg_strength, 2),
-                avg_confidence=round(avg_confidence, 2),
-                period_days=period_days,
-            )
+    return [
+        SignalStatsResponse(
+            strategy_id=row.id,
+            strategy_name=row.name,
+            total_signals=row.total,
+            executed_signals=row.executed or 0,
+            buy_signals=row.buy or 0,
+            sell_signals=row.sell or 0,
+            avg_strength=round(row.avg_strength or 0.0, 2),
+            avg_confidence=round(row.avg_confidence or 0.0, 2),
+            period_days=period_days,
         )
-
-    return stats
+        for row in rows
+    ]
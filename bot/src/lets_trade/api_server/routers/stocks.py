@@ -1,23 +1,36 @@
 """주식 시세 관련 라우터"""
 
+import asyncio
 from datetime import datetime
+from functools import partial
 
 from fastapi import APIRouter, Depends, Query, HTTPException
 
+from ..cache import AsyncTTLCache
 from ..dependencies import get_stock_api
+from ..responses import MsgspecResponse
 from ..schemas.stock import (
     StockPriceResponse,
     OrderBookResponse,
-    StockTradeResponse,
     StockTradeListResponse,
     MultiPriceRequest,
     MultiPriceResponse,
 )
+from ..schemas import _fast
 from ..schemas.common import ErrorCode
 from ...api import StockApi
 
 router = APIRouter()
 
+# 같은 종목을 고빈도로 폴링할 때 브로커 호출/레이트리밋을 줄이기 위한 짧은 캐시
+PRICE_CACHE_TTL_SECONDS = 1.0
+ORDERBOOK_CACHE_TTL_SECONDS = 1.0
+_price_cache = AsyncTTLCache(maxsize=1024, ttl=PRICE_CACHE_TTL_SECONDS)
+_orderbook_cache = AsyncTTLCache(maxsize=1024, ttl=ORDERBOOK_CACHE_TTL_SECONDS)
+
+# 복수 종목 조회 시 브로커 동시 호출 상한
+MULTI_PRICE_CONCURRENCY = 8
+
 
 @router.get("/{symbol}/price", response_model=StockPriceResponse)
 async def get_stock_price(
@@ -26,21 +39,10 @@ async def get_stock_price(
 ):
     """주식 현재가 조회"""
     try:
-        price = stock_api.get_price(symbol)
-
-        return StockPriceResponse(
-            symbol=price.symbol,
-            name=price.name,
-            price=price.price,
-            change=price.change,
-            change_rate=price.change_rate,
-            volume=price.volume,
-            open_price=price.open_price,
-            high_price=price.high_price,
-            low_price=price.low_price,
-            prev_close=price.prev_close,
-            timestamp=price.timestamp,
-        )
+        price = await _price_cache.get_or_fetch(symbol, lambda: stock_api.get_price(symbol))
+
+        # StockPrice dataclass는 StockPriceResponse와 필드가 동일하므로 그대로 인코딩
+        return MsgspecResponse(price)
     except Exception as e:
         raise HTTPException(
             status_code=502,
@@ -58,16 +60,12 @@ async def get_orderbook(
 ):
     """호가 정보 조회"""
     try:
-        orderbook = stock_api.get_orderbook(symbol)
-
-        return OrderBookResponse(
-            symbol=orderbook.symbol,
-            ask_prices=orderbook.ask_prices,
-            ask_volumes=orderbook.ask_volumes,
-            bid_prices=orderbook.bid_prices,
-            bid_volumes=orderbook.bid_volumes,
-            timestamp=orderbook.timestamp,
+        orderbook = await _orderbook_cache.get_or_fetch(
+            symbol, lambda: stock_api.get_orderbook(symbol)
         )
+
+        # OrderBook dataclass는 OrderBookResponse와 필드가 동일하므로 그대로 인코딩
+        return MsgspecResponse(orderbook)
     except Exception as e:
         raise HTTPException(
             status_code=502,
@@ -86,21 +84,10 @@ async def get_stock_trades(
 ):
     """체결 내역 조회"""
     try:
-        trades = stock_api.get_trades(symbol, count)
-
-        return StockTradeListResponse(
-            items=[
-                StockTradeResponse(
-                    symbol=t.symbol,
-                    price=t.price,
-                    volume=t.volume,
-                    trade_type=t.trade_type,
-                    time=t.time,
-                )
-                for t in trades
-            ],
-            count=len(trades),
-        )
+        trades = await stock_api.get_trades(symbol, count)
+
+        # Trade Struct는 StockTradeResponse와 필드가 동일하므로 그대로 인코딩
+        return MsgspecResponse(_fast.StockTradeListResponse(items=trades, count=len(trades)))
     except Exception as e:
         raise HTTPException(
             status_code=502,
@@ -128,28 +115,24 @@ async def get_multiple_prices(
 
     prices = {}
     errors = {}
+    now = datetime.now()  # 종목별 조회시간과 응답 시각에 공통 사용
+
+    # 브로커 레이트리밋을 고려해 실제 호출(캐시 미스)만 동시 요청 수 제한
+    semaphore = asyncio.Semaphore(MULTI_PRICE_CONCURRENCY)
+
+    async def fetch(symbol: str):
+        async with semaphore:
+            return await stock_api.get_price(symbol, now)
 
-    for symbol in request.symbols:
-        try:
-            price = stock_api.get_price(symbol)
-            prices[symbol] = StockPriceResponse(
-                symbol=price.symbol,
-                name=price.name,
-                price=price.price,
-                change=price.change,
-                change_rate=price.change_rate,
-                volume=price.volume,
-                open_price=price.open_price,
-                high_price=price.high_price,
-                low_price=price.low_price,
-                prev_close=price.prev_close,
-                timestamp=price.timestamp,
-            )
-        except Exception as e:
-            errors[symbol] = str(e)
-
-    return MultiPriceResponse(
-        prices=prices,
-        errors=errors,
-        timestamp=datetime.now(),
+    results = await asyncio.gather(
+        *(_price_cache.get_or_fetch(symbol, partial(fetch, symbol)) for symbol in request.symbols),
+        return_exceptions=True,
     )
+    for symbol, price in zip(request.symbols, results):
+        if isinstance(price, Exception):
+            errors[symbol] = str(price)
+            continue
+        # 캐시된 StockPrice는 StockPriceResponse와 필드가 동일하므로 변환 없이 담음
+        prices[symbol] = price
+
+    return MsgspecResponse(_fast.MultiPriceResponse(prices=prices, errors=errors, timestamp=now))
@@ -1,13 +1,16 @@
 """전략 관련 라우터"""
 
+import threading
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from ..auth import User, get_current_user
 from ..dependencies import get_db, get_supabase_client
+from ..responses import ModelResponse
 from ..schemas.strategy import (
     StrategySchema,
     StrategyListResponse,
@@ -21,9 +24,40 @@ from ...db.repository import BaseRepository
 
 router = APIRouter()
 
+# 목록 검증은 행마다 model_validate 대신 한 번의 호출로 처리
+_STRATEGY_LIST_ADAPTER = TypeAdapter(list[StrategySchema])
+
+# Supabase 동기화에 실패한 전략 ID (다음 동기화 때 함께 재시도)
+_pending_sync_ids: set[int] = set()
+_pending_sync_lock = threading.Lock()
+
+
+def _sync_strategy_to_supabase(strategy_id: int) -> None:
+    """전략 Supabase 동기화 (백그라운드, 자체 세션 사용)
+
+    응답 이후 실행되므로 요청 세션 대신 새 세션으로 최신 행을 다시 읽고,
+    이전에 실패한 ID와 묶어 한 번의 upsert로 전송합니다.
+    """
+    with _pending_sync_lock:
+        ids = _pending_sync_ids | {strategy_id}
+        _pending_sync_ids.clear()
+
+    sessions = get_db()
+    session = next(sessions)
+    try:
+        # 그 사이 삭제된 전략은 조회되지 않으므로 재시도 대상에서도 빠짐
+        strategies = session.query(Strategy).filter(Strategy.id.in_(ids)).all()
+        repo = BaseRepository(Strategy, session, get_supabase_client(), "strategies")
+        repo.bulk_sync_to_remote(strategies)
+    except Exception:
+        with _pending_sync_lock:
+            _pending_sync_ids.update(ids)
+    finally:
+        sessions.close()
+
 
 @router.get("", response_model=StrategyListResponse)
-async def get_strategies(
+def get_strategies(
     current_user: User = Depends(get_current_user),
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
@@ -47,17 +81,19 @@ async def get_strategies(
     active_count = db.query(Strategy).filter(Strategy.is_active == True).count()
     items = query.offset(offset).limit(limit).all()
 
-    return StrategyListResponse(
-        items=[StrategySchema.model_validate(item) for item in items],
-        total=total,
-        active_count=active_count,
-        limit=limit,
-        offset=offset,
+    return ModelResponse(
+        StrategyListResponse(
+            items=_STRATEGY_LIST_ADAPTER.validate_python(items, from_attributes=True),
+            total=total,
+            active_count=active_count,
+            limit=limit,
+            offset=offset,
+        )
     )
 
 
 @router.get("/{strategy_id}", response_model=StrategySchema)
-async def get_strategy(
+def get_strategy(
     strategy_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -78,8 +114,9 @@ async def get_strategy(
 
 
 @router.post("", response_model=StrategySchema)
-async def create_strategy(
+def create_strategy(
     request: StrategyCreateRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -102,13 +139,8 @@ async def create_strategy(
         db.commit()
         db.refresh(strategy)
 
-        # Supabase 동기화
-        try:
-            supabase = get_supabase_client()
-            repo = BaseRepository(Strategy, db, supabase, "strategies")
-            repo.sync_to_remote(strategy)
-        except Exception:
-            pass  # Supabase 동기화 실패는 무시
+        # Supabase 동기화 (응답 후 백그라운드에서 실행)
+        background_tasks.add_task(_sync_strategy_to_supabase, strategy.id)
 
         return StrategySchema.model_validate(strategy)
 
@@ -124,9 +156,10 @@ async def create_strategy(
 
 
 @router.put("/{strategy_id}", response_model=StrategySchema)
-async def update_strategy(
+def update_strategy(
     strategy_id: int,
     request: StrategyUpdateRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -152,13 +185,8 @@ async def update_strategy(
         db.commit()
         db.refresh(strategy)
 
-        # Supabase 동기화
-        try:
-            supabase = get_supabase_client()
-            repo = BaseRepository(Strategy, db, supabase, "strategies")
-            repo.sync_to_remote(strategy)
-        except Exception:
-            pass
+        # Supabase 동기화 (응답 후 백그라운드에서 실행)
+        background_tasks.add_task(_sync_strategy_to_supabase, strategy.id)
 
         return StrategySchema.model_validate(strategy)
 
@@ -174,8 +202,9 @@ async def update_strategy(
 
 
 @router.patch("/{strategy_id}/toggle", response_model=StrategyToggleResponse)
-async def toggle_strategy(
+def toggle_strategy(
     strategy_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -196,13 +225,8 @@ async def toggle_strategy(
         db.commit()
         db.refresh(strategy)
 
-        # Supabase 동기화
-        try:
-            supabase = get_supabase_client()
-            repo = BaseRepository(Strategy, db, supabase, "strategies")
-            repo.sync_to_remote(strategy)
-        except Exception:
-            pass
+        # Supabase 동기화 (응답 후 백그라운드에서 실행)
+        background_tasks.add_task(_sync_strategy_to_supabase, strategy.id)
 
         return StrategyToggleResponse(
             id=strategy.id,
@@ -222,7 +246,7 @@ async def toggle_strategy(
 
 
 @router.delete("/{strategy_id}")
-async def delete_strategy(
+def delete_strategy(
     strategy_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -1,12 +1,16 @@
 """시스템 관련 라우터"""
 
+import asyncio
 import time
 from datetime import datetime
-from typing import Literal
+from typing import Awaitable, Literal
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from sqlalchemy import text
 
+from ..cache import AsyncTTLCache
 from ..dependencies import get_ls_client, get_db, get_supabase_client
 from ... import __version__
 
@@ -15,6 +19,13 @@ router = APIRouter()
 # 서버 시작 시간
 _start_time = time.time()
 
+# 의존성 확인 1건당 최대 대기 시간 (하나가 멈춰도 상태 조회 전체가 지연되지 않도록)
+PROBE_TIMEOUT_SECONDS = 1.0
+
+# /status 결과 캐시 (동시 요청은 한 번의 확인 결과를 공유)
+STATUS_CACHE_TTL_SECONDS = 2.0
+_status_cache = AsyncTTLCache(maxsize=1, ttl=STATUS_CACHE_TTL_SECONDS)
+
 
 class HealthResponse(BaseModel):
     """헬스체크 응답"""
@@ -38,44 +49,65 @@ class SystemStatusResponse(BaseModel):
     timestamp: datetime
 
 
+async def _check_broker() -> bool:
+    """브로커 연결 확인 (메모리 상태만 확인)"""
+    return get_ls_client().is_authenticated
+
+
+def _check_database() -> bool:
+    """DB 연결 확인"""
+    sessions = get_db()
+    session = next(sessions)
+    try:
+        session.execute(text("SELECT 1"))
+    finally:
+        sessions.close()
+    return True
+
+
+def _check_supabase() -> bool:
+    """Supabase 연결 확인"""
+    get_supabase_client().table("trades").select("id").limit(1).execute()
+    return True
+
+
+async def _probe(check: Awaitable[bool]) -> bool:
+    """의존성 확인 실행 (실패/시간 초과 시 False)"""
+    try:
+        return await asyncio.wait_for(check, PROBE_TIMEOUT_SECONDS)
+    except Exception:
+        return False
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """헬스체크 엔드포인트"""
-    return HealthResponse(
-        status="healthy",
-        version=__version__,
-        timestamp=datetime.now(),
+    # 고정 필드만 반환하므로 response_model 검증을 건너뛰고 바로 직렬화
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "version": __version__,
+            "timestamp": datetime.now(),
+        }
     )
 
 
 @router.get("/status", response_model=SystemStatusResponse)
 async def system_status():
     """시스템 상세 상태"""
-    # 브로커 연결 확인
-    broker_connected = False
-    try:
-        client = get_ls_client()
-        broker_connected = client.is_authenticated
-    except Exception:
-        pass
-
-    # DB 연결 확인
-    database_connected = False
-    try:
-        session = next(get_db())
-        session.execute("SELECT 1")
-        database_connected = True
-    except Exception:
-        pass
-
-    # Supabase 연결 확인
-    supabase_connected = False
-    try:
-        supabase = get_supabase_client()
-        supabase.table("trades").select("id").limit(1).execute()
-        supabase_connected = True
-    except Exception:
-        pass
+    # 프로브 폭주 시에도 의존성 확인은 STATUS_CACHE_TTL_SECONDS당 한 번만 수행
+    return await _status_cache.get_or_fetch("status", _collect_status)
+
+
+async def _collect_status() -> SystemStatusResponse:
+    """의존성 확인 후 시스템 상태 구성"""
+    # 세 의존성 확인은 서로 독립적이므로 동시에 실행 (지연시간 = 합이 아닌 최대값)
+    broker_connected, database_connected, supabase_connected = await asyncio.gather(
+        _probe(_check_broker()),
+        # DB/Supabase 클라이언트는 동기식이므로 스레드에서 실행
+        _probe(asyncio.to_thread(_check_database)),
+        _probe(asyncio.to_thread(_check_supabase)),
+    )
 
     return SystemStatusResponse(
         status="running",
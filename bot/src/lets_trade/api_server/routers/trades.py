@@ -1,14 +1,18 @@
 """거래 내역 라우터"""
 
-from datetime import datetime, date
-from typing import Optional
+import threading
+from datetime import datetime, date, time, timedelta
+from typing import Iterator, Literal, Optional
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy import func, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, raiseload
 
 from ..auth import User, get_current_user
 from ..dependencies import get_db
+from ..pagination import fetch_page, next_cursor
+from ..responses import ModelResponse, json_array_response, ndjson_response
 from ..schemas.trade import TradeSchema, TradeListResponse, TradeSummary
 from ..schemas.common import ErrorCode
 from ...models import Trade
@@ -16,14 +20,95 @@ from ...models.trade import OrderStatus, OrderType
 
 router = APIRouter()
 
+# 상태/유형 문자열 상수 (Enum 속성 조회 생략)
+BUY = OrderType.BUY.value
+SELL = OrderType.SELL.value
+EXECUTED = OrderStatus.EXECUTED.value
+PENDING = OrderStatus.PENDING.value
+
+# 요약 통계 집계 컬럼 (요청마다 식을 다시 만들지 않도록 한 번만 구성)
+# COUNT(...) FILTER (WHERE ...)는 대상 행이 없어도 NULL 대신 0
+_SUMMARY_COLUMNS = (
+    func.count(Trade.id).label("total"),
+    func.count(Trade.id).filter(Trade.order_type == BUY).label("buy"),
+    func.count(Trade.id).filter(Trade.order_type == SELL).label("sell"),
+    func.count(Trade.id).filter(Trade.status == EXECUTED).label("executed"),
+    func.count(Trade.id).filter(Trade.status == PENDING).label("pending"),
+)
+
+# 오늘 요약은 대시보드 폴링마다 다시 집계하지 않도록 짧게 캐시 (동기 라우터용 락)
+TODAY_SUMMARY_TTL_SECONDS = 2.0
+_today_summary_cache: TTLCache = TTLCache(maxsize=2, ttl=TODAY_SUMMARY_TTL_SECONDS)
+_today_summary_lock = threading.Lock()
+
+# 스트리밍 조회 시 한 번에 가져오는 행 수
+STREAM_BATCH_SIZE = 500
+
+
+def _summarize(query) -> TradeSummary:
+    """거래 요약 통계 (조건부 집계로 한 번에 계산)"""
+    row = query.with_entities(*_SUMMARY_COLUMNS).one()
+
+    return TradeSummary(
+        total_count=row.total,
+        buy_count=row.buy,
+        sell_count=row.sell,
+        executed_count=row.executed,
+        pending_count=row.pending,
+    )
+
+
+def _trade_filters(
+    status: Optional[OrderStatus],
+    order_type: Optional[OrderType],
+    stock_code: Optional[str],
+    strategy_id: Optional[int],
+    from_date: Optional[date],
+    to_date: Optional[date],
+) -> list:
+    """목록 필터 조건 (날짜는 created_at 인덱스를 타도록 반열린 구간으로 비교)"""
+    criteria = []
+    if status:
+        criteria.append(Trade.status == status)
+    if order_type:
+        criteria.append(Trade.order_type == order_type)
+    if stock_code:
+        criteria.append(Trade.stock_code == stock_code)
+    if strategy_id:
+        criteria.append(Trade.strategy_id == strategy_id)
+    if from_date:
+        criteria.append(Trade.created_at >= datetime.combine(from_date, time.min))
+    if to_date:
+        criteria.append(Trade.created_at < datetime.combine(to_date + timedelta(days=1), time.min))
+    return criteria
+
+
+def _iter_trades(criteria: list) -> Iterator[TradeSchema]:
+    """조건에 맞는 거래를 배치 단위로 순회 (스트리밍 중 실행되므로 자체 세션 사용)"""
+    sessions = get_db()
+    session = next(sessions)
+    try:
+        query = (
+            session.query(Trade)
+            .options(raiseload("*"))
+            .filter(*criteria)
+            .order_by(Trade.created_at.desc(), Trade.id.desc())
+            .yield_per(STREAM_BATCH_SIZE)
+        )
+        for row in query:
+            yield TradeSchema.from_orm_fast(row)
+    finally:
+        sessions.close()
+
 
 @router.get("", response_model=TradeListResponse)
-async def get_trades(
+def get_trades(
     current_user: User = Depends(get_current_user),
     limit: int = Query(default=100, le=500),
     offset: int = Query(default=0, ge=0),
-    status: Optional[str] = Query(default=None),
-    order_type: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),  # 키셋 페이지네이션 (offset보다 권장)
+    status: Optional[OrderStatus] = Query(default=None),
+    order_type: Optional[OrderType] = Query(default=None),
     stock_code: Optional[str] = Query(default=None),
     strategy_id: Optional[int] = Query(default=None),
     from_date: Optional[date] = Query(default=None),
@@ -31,135 +116,98 @@ async def get_trades(
     db: Session = Depends(get_db),
 ):
     """거래 내역 조회"""
-    query = db.query(Trade)
+    # 목록 직렬화 중 지연 로딩(N+1)이 생기면 조용히 쿼리하지 않고 즉시 오류
+    query = db.query(Trade).options(raiseload("*"))
 
-    # 필터링
-    if status:
-        query = query.filter(Trade.status == status)
-    if order_type:
-        query = query.filter(Trade.order_type == order_type)
-    if stock_code:
-        query = query.filter(Trade.stock_code == stock_code)
-    if strategy_id:
-        query = query.filter(Trade.strategy_id == strategy_id)
-    if from_date:
-        query = query.filter(func.date(Trade.created_at) >= from_date)
-    if to_date:
-        query = query.filter(func.date(Trade.created_at) <= to_date)
+    query = query.filter(
+        *_trade_filters(status, order_type, stock_code, strategy_id, from_date, to_date)
+    )
 
-    # 정렬 (최신순)
-    query = query.order_by(Trade.created_at.desc())
+    items, total, has_more = fetch_page(query, Trade, limit, offset, cursor)
 
-    total = query.count()
-    items = query.offset(offset).limit(limit).all()
+    # 요약 통계 (날짜 조건만 적용)
+    summary_query = db.query(Trade).filter(
+        *_trade_filters(None, None, None, None, from_date, to_date)
+    )
 
-    # 요약 통계
-    summary_query = db.query(Trade)
-    if from_date:
-        summary_query = summary_query.filter(func.date(Trade.created_at) >= from_date)
-    if to_date:
-        summary_query = summary_query.filter(func.date(Trade.created_at) <= to_date)
-
-    total_count = summary_query.count()
-    buy_count = summary_query.filter(Trade.order_type == OrderType.BUY.value).count()
-    sell_count = summary_query.filter(Trade.order_type == OrderType.SELL.value).count()
-    executed_count = summary_query.filter(
-        Trade.status == OrderStatus.EXECUTED.value
-    ).count()
-    pending_count = summary_query.filter(
-        Trade.status == OrderStatus.PENDING.value
-    ).count()
-
-    return TradeListResponse(
-        items=[TradeSchema.model_validate(item) for item in items],
-        total=total,
-        limit=limit,
-        offset=offset,
-        summary=TradeSummary(
-            total_count=total_count,
-            buy_count=buy_count,
-            sell_count=sell_count,
-            executed_count=executed_count,
-            pending_count=pending_count,
-        ),
+    summary = _summarize(summary_query)
+
+    return ModelResponse(
+        TradeListResponse(
+            items=[TradeSchema.from_orm_fast(item) for item in items],
+            total=total,
+            limit=limit,
+            offset=offset,
+            summary=summary,
+            has_more=has_more,
+            next_cursor=next_cursor(items, has_more),
+        )
     )
 
 
+@router.get("/stream")
+def stream_trades(
+    current_user: User = Depends(get_current_user),
+    status: Optional[OrderStatus] = Query(default=None),
+    order_type: Optional[OrderType] = Query(default=None),
+    stock_code: Optional[str] = Query(default=None),
+    strategy_id: Optional[int] = Query(default=None),
+    from_date: Optional[date] = Query(default=None),
+    to_date: Optional[date] = Query(default=None),
+    fmt: Literal["ndjson", "json"] = Query(default="ndjson", alias="format"),
+):
+    """거래 내역 전체 내보내기 (기본 NDJSON - 한 줄에 거래 하나, format=json이면 {"items": [...], "count": N})"""
+    criteria = _trade_filters(status, order_type, stock_code, strategy_id, from_date, to_date)
+    rows = _iter_trades(criteria)
+    if fmt == "json":
+        return json_array_response(rows)
+    return ndjson_response(rows)
+
+
 @router.get("/today", response_model=TradeListResponse)
-async def get_today_trades(
+def get_today_trades(
     current_user: User = Depends(get_current_user),
     limit: int = Query(default=100, le=500),
     offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
 ):
     """오늘 거래 내역 조회"""
-    today = datetime.now().date()
-
-    query = db.query(Trade).filter(func.date(Trade.created_at) == today)
-    query = query.order_by(Trade.created_at.desc())
-
-    total = query.count()
-    items = query.offset(offset).limit(limit).all()
-
-    # 오늘 요약
-    buy_count = (
-        db.query(Trade)
-        .filter(
-            and_(
-                func.date(Trade.created_at) == today,
-                Trade.order_type == OrderType.BUY.value,
-            )
-        )
-        .count()
-    )
-    sell_count = (
-        db.query(Trade)
-        .filter(
-            and_(
-                func.date(Trade.created_at) == today,
-                Trade.order_type == OrderType.SELL.value,
-            )
-        )
-        .count()
-    )
-    executed_count = (
-        db.query(Trade)
-        .filter(
-            and_(
-                func.date(Trade.created_at) == today,
-                Trade.status == OrderStatus.EXECUTED.value,
-            )
-        )
-        .count()
-    )
-    pending_count = (
-        db.query(Trade)
-        .filter(
-            and_(
-                func.date(Trade.created_at) == today,
-                Trade.status == OrderStatus.PENDING.value,
-            )
-        )
-        .count()
+    # 오늘 [00:00, 내일 00:00) 구간 (created_at 인덱스 사용)
+    today_start = datetime.combine(datetime.now().date(), time.min)
+    today_end = today_start + timedelta(days=1)
+    is_today = and_(Trade.created_at >= today_start, Trade.created_at < today_end)
+
+    query = db.query(Trade).filter(is_today)
+
+    # 오늘 요약 (전체 건수도 같은 집계에서 사용)
+    with _today_summary_lock:
+        summary = _today_summary_cache.get(today_start)
+        if summary is None:
+            summary = _summarize(query)
+            _today_summary_cache[today_start] = summary
+
+    items = (
+        query.options(raiseload("*"))
+        .order_by(Trade.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
     )
 
-    return TradeListResponse(
-        items=[TradeSchema.model_validate(item) for item in items],
-        total=total,
-        limit=limit,
-        offset=offset,
-        summary=TradeSummary(
-            total_count=total,
-            buy_count=buy_count,
-            sell_count=sell_count,
-            executed_count=executed_count,
-            pending_count=pending_count,
-        ),
+    return ModelResponse(
+        TradeListResponse(
+            items=[TradeSchema.from_orm_fast(item) for item in items],
+            total=summary.total_count,
+            limit=limit,
+            offset=offset,
+            summary=summary,
+            has_more=offset + len(items) < summary.total_count,
+        )
     )
 
 
 @router.get("/{trade_id}", response_model=TradeSchema)
-async def get_trade(
+def get_trade(
     trade_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
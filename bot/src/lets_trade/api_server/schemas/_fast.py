@@ -0,0 +1,26 @@
+"""핫패스 응답용 msgspec Struct
+
+응답 생성 시 Pydantic 검증 없이 바로 인코딩하기 위한 구조체입니다 (MsgspecResponse와 함께 사용).
+OpenAPI 문서는 schemas.stock의 Pydantic 모델(response_model)이 그대로 담당합니다.
+"""
+
+from datetime import datetime
+
+import msgspec
+
+from ...api import StockPrice, Trade
+
+
+class StockTradeListResponse(msgspec.Struct, frozen=True, gc=False):
+    """체결 목록 응답"""
+
+    items: list[Trade]
+    count: int
+
+
+class MultiPriceResponse(msgspec.Struct, frozen=True, gc=False):
+    """복수 종목 시세 응답"""
+
+    prices: dict[str, StockPrice]  # StockPriceResponse와 필드 동일
+    errors: dict[str, str]  # 종목코드 -> 에러 메시지
+    timestamp: datetime
@@ -1,13 +1,40 @@
 """공통 스키마 정의"""
 
 from datetime import datetime
-from typing import Generic, TypeVar, Optional
+from typing import Any, Callable, ClassVar, Generic, TypeVar, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 T = TypeVar("T")
 
+# 생성 후 변경하지 않는 스키마 공통 설정 (불변 + 추가 필드 무시)
+FROZEN_CONFIG = ConfigDict(frozen=True, extra="ignore")
+# ORM 행에서 만드는 스키마용 (속성 읽기 허용)
+FROZEN_ORM_CONFIG = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+
+class OrmSchema(BaseModel):
+    """ORM 행에서 만드는 응답 스키마 기반 클래스"""
+
+    # 컬럼 타입과 스키마 타입이 다른 필드의 변환 함수 (필드명 -> 변환, None은 그대로)
+    fast_casts: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+
+    @classmethod
+    def from_orm_fast(cls, row: Any, exclude: frozenset[str] = frozenset()):
+        """신뢰할 수 있는 DB 행을 검증 없이 변환 (목록 조회 전용)
+
+        필드 강제 변환을 건너뛰고 속성만 복사합니다 (fast_casts에 지정한 필드만 변환).
+        exclude 필드는 읽지 않고 기본값으로 둡니다 (load_only로 제외한 컬럼의 지연 로딩 방지).
+        사용자 입력에는 model_validate를 사용하세요.
+        """
+        data = {name: getattr(row, name) for name in cls.model_fields if name not in exclude}
+        for name, cast in cls.fast_casts.items():
+            value = data.get(name)
+            if value is not None:
+                data[name] = cast(value)
+        return cls.model_construct(**data)
+
 
 class BaseResponse(BaseModel):
     """기본 응답 래퍼"""
@@ -6,8 +6,10 @@ from typing import Optional, Literal
 
 from pydantic import BaseModel
 
+from .common import OrmSchema
 
-class SignalSchema(BaseModel):
+
+class SignalSchema(OrmSchema):
     """시그널 정보"""
 
     id: int
@@ -35,9 +37,11 @@ class SignalListResponse(BaseModel):
     """시그널 목록 응답"""
 
     items: list[SignalSchema]
-    total: int
+    total: Optional[int]  # 커서 조회 시 None (첫 페이지의 total 사용)
     limit: int
     offset: int
+    has_more: bool = False  # 다음 페이지 존재 여부
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 
 class SignalStatsResponse(BaseModel):
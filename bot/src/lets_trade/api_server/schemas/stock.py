@@ -5,10 +5,14 @@ from typing import Literal
 
 from pydantic import BaseModel
 
+from .common import FROZEN_CONFIG
+
 
 class StockPriceResponse(BaseModel):
     """주식 현재가 응답"""
 
+    model_config = FROZEN_CONFIG
+
     symbol: str
     name: str
     price: int
@@ -25,6 +29,8 @@ class StockPriceResponse(BaseModel):
 class OrderBookResponse(BaseModel):
     """호가 정보 응답"""
 
+    model_config = FROZEN_CONFIG
+
     symbol: str
     ask_prices: list[int]  # 매도호가 (10단계)
     ask_volumes: list[int]  # 매도잔량
@@ -36,6 +42,8 @@ class OrderBookResponse(BaseModel):
 class StockTradeResponse(BaseModel):
     """체결 정보 응답"""
 
+    model_config = FROZEN_CONFIG
+
     symbol: str
     price: int
     volume: int
@@ -46,6 +54,8 @@ class StockTradeResponse(BaseModel):
 class StockTradeListResponse(BaseModel):
     """체결 목록 응답"""
 
+    model_config = FROZEN_CONFIG
+
     items: list[StockTradeResponse]
     count: int
 
@@ -53,12 +63,16 @@ class StockTradeListResponse(BaseModel):
 class MultiPriceRequest(BaseModel):
     """복수 종목 시세 요청"""
 
+    model_config = FROZEN_CONFIG
+
     symbols: list[str]  # 최대 20종목
 
 
 class MultiPriceResponse(BaseModel):
     """복수 종목 시세 응답"""
 
+    model_config = FROZEN_CONFIG
+
     prices: dict[str, StockPriceResponse]
     errors: dict[str, str]  # 종목코드 -> 에러 메시지
     timestamp: datetime
@@ -5,10 +5,14 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from .common import FROZEN_CONFIG, FROZEN_ORM_CONFIG
+
 
 class StrategySchema(BaseModel):
     """전략 정보"""
 
+    model_config = FROZEN_ORM_CONFIG
+
     id: int
     name: str
     description: Optional[str] = None
@@ -23,13 +27,12 @@ class StrategySchema(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class StrategyListResponse(BaseModel):
     """전략 목록 응답"""
 
+    model_config = FROZEN_CONFIG
+
     items: list[StrategySchema]
     total: int
     active_count: int
@@ -40,6 +43,8 @@ class StrategyListResponse(BaseModel):
 class StrategyCreateRequest(BaseModel):
     """전략 생성 요청"""
 
+    model_config = FROZEN_CONFIG
+
     name: str
     description: Optional[str] = None
     strategy_type: str
@@ -55,6 +60,8 @@ class StrategyCreateRequest(BaseModel):
 class StrategyUpdateRequest(BaseModel):
     """전략 수정 요청"""
 
+    model_config = FROZEN_CONFIG
+
     name: Optional[str] = None
     description: Optional[str] = None
     parameters: Optional[dict] = None
@@ -69,6 +76,8 @@ class StrategyUpdateRequest(BaseModel):
 class StrategyToggleResponse(BaseModel):
     """전략 토글 응답"""
 
+    model_config = FROZEN_CONFIG
+
     id: int
     is_active: bool
     updated_at: datetime
@@ -1,15 +1,21 @@
 """거래 관련 스키마"""
 
 from datetime import datetime
-from decimal import Decimal
-from typing import Optional, Literal
+from typing import ClassVar, Optional, Literal
 
 from pydantic import BaseModel
 
+from .common import FROZEN_CONFIG, FROZEN_ORM_CONFIG, OrmSchema
 
-class TradeSchema(BaseModel):
+
+class TradeSchema(OrmSchema):
     """거래 내역"""
 
+    model_config = FROZEN_ORM_CONFIG
+
+    # 국내 주식 가격은 항상 원 단위 정수 (DB 컬럼은 NUMERIC이므로 목록 변환 시 int로)
+    fast_casts: ClassVar[dict] = {"price": int, "executed_price": int}
+
     id: int
     order_no: str
     stock_code: str
@@ -17,9 +23,9 @@ class TradeSchema(BaseModel):
     order_type: Literal["buy", "sell"]
     status: Literal["pending", "executed", "partial", "cancelled", "rejected"]
     quantity: int
-    price: Decimal
+    price: int  # 원
     executed_quantity: int
-    executed_price: Optional[Decimal] = None
+    executed_price: Optional[int] = None  # 원
     strategy_id: Optional[int] = None
     signal_id: Optional[int] = None
     notes: Optional[str] = None
@@ -27,13 +33,12 @@ class TradeSchema(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class TradeSummary(BaseModel):
     """거래 요약"""
 
+    model_config = FROZEN_CONFIG
+
     total_count: int
     buy_count: int
     sell_count: int
@@ -44,8 +49,12 @@ class TradeSummary(BaseModel):
 class TradeListResponse(BaseModel):
     """거래 목록 응답"""
 
+    model_config = FROZEN_CONFIG
+
     items: list[TradeSchema]
-    total: int
+    total: Optional[int]  # 커서 조회 시 None (첫 페이지의 total 사용)
     limit: int
     offset: int
     summary: TradeSummary
+    has_more: bool = False  # 다음 페이지 존재 여부
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
@@ -1,19 +1,18 @@
 """letsTrade CLI - Typer 기반 명령줄 인터페이스"""
 
-import sys
-from typing import Optional
+import asyncio
+import functools
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-from .api.client import ApiError, LSApiClient
-from .api.stock import StockApi
-from .api.account import AccountApi
-from .api.order import OrderApi, OrderType
-from .strategies.base import StrategyRegistry
+# rich/API/전략 모듈은 명령 실행 시점에 import (--help, --version은 typer만 로드)
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+    from .api.client import LSApiClient
+    from .api.order import OrderType
 
 # Typer 앱 초기화
 app = typer.Typer(
@@ -22,16 +21,70 @@ app = typer.Typer(
     add_completion=False,
 )
 
-# Rich Console 초기화
-console = Console()
 
+@functools.cache
+def get_console() -> "Console":
+    """Rich Console (첫 출력 시 생성)"""
+    from rich.console import Console
+
+    return Console()
+
+
+# 주문 구분 표시 (행마다 색상 분기/마크업 조립 생략)
+SIDE_MARKUP = {"매수": "[cyan]매수[/cyan]", "매도": "[magenta]매도[/magenta]"}
+
+# 표 컬럼 정의 (헤더, add_column 옵션)
+_RIGHT = {"justify": "right"}
+_KV_COLUMNS = (("", {"justify": "right", "style": "dim"}), ("", _RIGHT))
+_ORDERBOOK_COLUMNS = (
+    ("매도잔량", {"justify": "right", "style": "blue"}),
+    ("매도호가", {"justify": "right", "style": "blue"}),
+    ("매수호가", {"justify": "right", "style": "red"}),
+    ("매수잔량", {"justify": "right", "style": "red"}),
+)
+_POSITION_COLUMNS = (
+    ("종목", {"style": "cyan"}),
+    ("수량", _RIGHT),
+    ("평균단가", _RIGHT),
+    ("현재가", _RIGHT),
+    ("평가금액", _RIGHT),
+    ("수익률", _RIGHT),
+)
+_ORDER_COLUMNS = (
+    ("시간", {"style": "dim"}),
+    ("종목", {}),
+    ("구분", {"justify": "center"}),
+    ("주문가", _RIGHT),
+    ("주문량", _RIGHT),
+    ("체결량", _RIGHT),
+    ("상태", {}),
+)
+_STRATEGY_COLUMNS = (("이름", {}), ("상태", {}))
+
+
+def _make_table(columns: tuple, **options) -> "Table":
+    """컬럼 정의로 표 생성"""
+    from rich.table import Table
+
+    table = Table(**options)
+    for header, column_options in columns:
+        table.add_column(header, **column_options)
+    return table
 
-def get_client() -> LSApiClient:
+
+def _make_kv_table() -> "Table":
+    """헤더 없는 항목-값 표 생성 (시세/잔고 요약용)"""
+    return _make_table(_KV_COLUMNS, show_header=False, box=None, padding=(0, 1))
+
+
+def get_client() -> "LSApiClient":
     """API 클라이언트 생성"""
+    from .api.client import LSApiClient
+
     try:
         return LSApiClient()
     except Exception as e:
-        console.print(f"[red]API 연결 실패:[/red] {e}")
+        get_console().print(f"[red]API 연결 실패:[/red] {e}")
         raise typer.Exit(1)
 
 
@@ -47,13 +100,23 @@ def quote(
 
     예시: lets-trade quote 005930
     """
-    with get_client() as client:
+    asyncio.run(_quote(symbol, orderbook))
+
+
+async def _quote(symbol: str, orderbook: bool) -> None:
+    """시세 조회 실행"""
+    from rich.panel import Panel
+
+    from .api.client import ApiError
+    from .api.stock import StockApi
+
+    async with get_client() as client:
         stock_api = StockApi(client)
 
         try:
-            price = stock_api.get_price(symbol)
+            price = await stock_api.get_price(symbol)
         except ApiError as e:
-            console.print(f"[red]조회 실패:[/red] {e}")
+            get_console().print(f"[red]조회 실패:[/red] {e}")
             raise typer.Exit(1)
 
         # 등락 색상 결정
@@ -68,9 +131,7 @@ def quote(
             sign = "-"
 
         # 시세 패널 출력
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column(justify="right", style="dim")
-        table.add_column(justify="right")
+        table = _make_kv_table()
 
         table.add_row("현재가", f"[bold {color}]{price.price:,}원[/bold {color}]")
         table.add_row("전일대비", f"[{color}]{sign} {abs(price.change):,} ({price.change_rate:+.2f}%)[/{color}]")
@@ -86,18 +147,14 @@ def quote(
             subtitle=price.timestamp.strftime("%H:%M:%S"),
             expand=False,
         )
-        console.print(panel)
+        get_console().print(panel)
 
         # 호가 정보 출력
         if orderbook:
             try:
-                ob = stock_api.get_orderbook(symbol)
+                ob = await stock_api.get_orderbook(symbol)
 
-                ob_table = Table(title="호가 정보")
-                ob_table.add_column("매도잔량", justify="right", style="blue")
-                ob_table.add_column("매도호가", justify="right", style="blue")
-                ob_table.add_column("매수호가", justify="right", style="red")
-                ob_table.add_column("매수잔량", justify="right", style="red")
+                ob_table = _make_table(_ORDERBOOK_COLUMNS, title="호가 정보")
 
                 for i in range(min(5, len(ob.ask_prices))):
                     ask_idx = 4 - i  # 매도호가는 역순
@@ -116,9 +173,9 @@ def quote(
                         f"{ob.bid_volumes[i]:,}",
                     )
 
-                console.print(ob_table)
+                get_console().print(ob_table)
             except ApiError as e:
-                console.print(f"[yellow]호가 조회 실패:[/yellow] {e}")
+                get_console().print(f"[yellow]호가 조회 실패:[/yellow] {e}")
 
 
 # ===== 잔고 조회 =====
@@ -132,22 +189,30 @@ def balance(
 
     예시: lets-trade balance
     """
-    with get_client() as client:
+    asyncio.run(_balance(detail))
+
+
+async def _balance(detail: bool) -> None:
+    """잔고 조회 실행"""
+    from rich.panel import Panel
+
+    from .api.account import AccountApi
+    from .api.client import ApiError
+
+    async with get_client() as client:
         account_api = AccountApi(client)
 
         try:
-            bal = account_api.get_balance()
+            bal = await account_api.get_balance()
         except ApiError as e:
-            console.print(f"[red]조회 실패:[/red] {e}")
+            get_console().print(f"[red]조회 실패:[/red] {e}")
             raise typer.Exit(1)
 
         # 총평가 색상
         profit_color = "red" if bal.total_profit >= 0 else "blue"
 
         # 요약 정보
-        summary_table = Table(show_header=False, box=None, padding=(0, 1))
-        summary_table.add_column(justify="right", style="dim")
-        summary_table.add_column(justify="right")
+        summary_table = _make_kv_table()
 
         summary_table.add_row("예수금", f"{bal.deposit:,}원")
         summary_table.add_row("주문가능", f"[green]{bal.available:,}원[/green]")
@@ -157,32 +222,27 @@ def balance(
             f"[{profit_color}]{bal.total_profit:+,.0f}원 ({bal.profit_rate:+.2f}%)[/{profit_color}]"
         )
 
-        console.print(Panel(summary_table, title="[bold]계좌 잔고[/bold]", expand=False))
+        get_console().print(Panel(summary_table, title="[bold]계좌 잔고[/bold]", expand=False))
 
         # 보유종목
         if bal.positions:
-            pos_table = Table(title="보유종목")
-            pos_table.add_column("종목", style="cyan")
-            pos_table.add_column("수량", justify="right")
-            pos_table.add_column("평균단가", justify="right")
-            pos_table.add_column("현재가", justify="right")
-            pos_table.add_column("평가금액", justify="right")
-            pos_table.add_column("수익률", justify="right")
+            pos_table = _make_table(_POSITION_COLUMNS, title="보유종목")
 
+            add_row = pos_table.add_row
             for pos in bal.positions:
-                pnl_color = "red" if pos.profit_rate >= 0 else "blue"
-                pos_table.add_row(
+                rate = pos.profit_rate
+                add_row(
                     f"{pos.name} ({pos.symbol})",
                     f"{pos.quantity:,}",
                     f"{pos.avg_price:,.0f}",
                     f"{pos.current_price:,}",
                     f"{pos.market_value:,}",
-                    f"[{pnl_color}]{pos.profit_rate:+.2f}%[/{pnl_color}]",
+                    f"[red]{rate:+.2f}%[/red]" if rate >= 0 else f"[blue]{rate:+.2f}%[/blue]",
                 )
 
-            console.print(pos_table)
+            get_console().print(pos_table)
         else:
-            console.print("[dim]보유 종목이 없습니다.[/dim]")
+            get_console().print("[dim]보유 종목이 없습니다.[/dim]")
 
 
 # ===== 매수 주문 =====
@@ -202,18 +262,36 @@ def buy(
       lets-trade buy 005930 -q 10 -p 72000  # 지정가 매수
       lets-trade buy 005930 -q 10 --market  # 시장가 매수
     """
+    from .api.order import OrderType
+
     order_type = OrderType.MARKET if market or price is None else OrderType.LIMIT
     order_price = 0 if order_type == OrderType.MARKET else (price or 0)
+    asyncio.run(_buy(symbol, quantity, order_price, order_type, confirm))
+
+
+async def _buy(
+    symbol: str,
+    quantity: int,
+    order_price: int,
+    order_type: "OrderType",
+    confirm: bool,
+) -> None:
+    """매수 주문 실행"""
+    from rich.panel import Panel
 
-    with get_client() as client:
+    from .api.client import ApiError
+    from .api.order import OrderApi, OrderType
+    from .api.stock import StockApi
+
+    async with get_client() as client:
         stock_api = StockApi(client)
         order_api = OrderApi(client)
 
         # 종목 정보 조회
         try:
-            stock_info = stock_api.get_price(symbol)
+            stock_info = await stock_api.get_price(symbol)
         except ApiError:
-            console.print(f"[red]종목 정보 조회 실패[/red]")
+            get_console().print(f"[red]종목 정보 조회 실패[/red]")
             raise typer.Exit(1)
 
         # 주문 확인
@@ -221,7 +299,7 @@ def buy(
         price_str = f"{order_price:,}원" if order_price > 0 else "시장가"
         estimated = quantity * (order_price or stock_info.price)
 
-        console.print(Panel(
+        get_console().print(Panel(
             f"종목: [bold]{stock_info.name}[/bold] ({symbol})\n"
             f"구분: [cyan]매수[/cyan] ({order_type_str})\n"
             f"수량: {quantity:,}주\n"
@@ -233,15 +311,15 @@ def buy(
 
         if not confirm:
             if not typer.confirm("주문을 실행하시겠습니까?"):
-                console.print("[dim]주문이 취소되었습니다.[/dim]")
+                get_console().print("[dim]주문이 취소되었습니다.[/dim]")
                 raise typer.Exit(0)
 
         # 주문 실행
         try:
-            result = order_api.buy(symbol, quantity, order_price, order_type)
-            console.print(f"[green]주문 완료![/green] 주문번호: {result.order_no}")
+            result = await order_api.buy(symbol, quantity, order_price, order_type)
+            get_console().print(f"[green]주문 완료![/green] 주문번호: {result.order_no}")
         except Exception as e:
-            console.print(f"[red]주문 실패:[/red] {e}")
+            get_console().print(f"[red]주문 실패:[/red] {e}")
             raise typer.Exit(1)
 
 
@@ -262,18 +340,36 @@ def sell(
       lets-trade sell 005930 -q 10 -p 73000  # 지정가 매도
       lets-trade sell 005930 -q 10 --market  # 시장가 매도
     """
+    from .api.order import OrderType
+
     order_type = OrderType.MARKET if market or price is None else OrderType.LIMIT
     order_price = 0 if order_type == OrderType.MARKET else (price or 0)
+    asyncio.run(_sell(symbol, quantity, order_price, order_type, confirm))
+
+
+async def _sell(
+    symbol: str,
+    quantity: int,
+    order_price: int,
+    order_type: "OrderType",
+    confirm: bool,
+) -> None:
+    """매도 주문 실행"""
+    from rich.panel import Panel
+
+    from .api.client import ApiError
+    from .api.order import OrderApi, OrderType
+    from .api.stock import StockApi
 
-    with get_client() as client:
+    async with get_client() as client:
         stock_api = StockApi(client)
         order_api = OrderApi(client)
 
         # 종목 정보 조회
         try:
-            stock_info = stock_api.get_price(symbol)
+            stock_info = await stock_api.get_price(symbol)
         except ApiError:
-            console.print(f"[red]종목 정보 조회 실패[/red]")
+            get_console().print(f"[red]종목 정보 조회 실패[/red]")
             raise typer.Exit(1)
 
         # 주문 확인
@@ -281,7 +377,7 @@ def sell(
         price_str = f"{order_price:,}원" if order_price > 0 else "시장가"
         estimated = quantity * (order_price or stock_info.price)
 
-        console.print(Panel(
+        get_console().print(Panel(
             f"종목: [bold]{stock_info.name}[/bold] ({symbol})\n"
             f"구분: [magenta]매도[/magenta] ({order_type_str})\n"
             f"수량: {quantity:,}주\n"
@@ -293,15 +389,15 @@ def sell(
 
         if not confirm:
             if not typer.confirm("주문을 실행하시겠습니까?"):
-                console.print("[dim]주문이 취소되었습니다.[/dim]")
+                get_console().print("[dim]주문이 취소되었습니다.[/dim]")
                 raise typer.Exit(0)
 
         # 주문 실행
         try:
-            result = order_api.sell(symbol, quantity, order_price, order_type)
-            console.print(f"[green]주문 완료![/green] 주문번호: {result.order_no}")
+            result = await order_api.sell(symbol, quantity, order_price, order_type)
+            get_console().print(f"[green]주문 완료![/green] 주문번호: {result.order_no}")
         except Exception as e:
-            console.print(f"[red]주문 실패:[/red] {e}")
+            get_console().print(f"[red]주문 실패:[/red] {e}")
             raise typer.Exit(1)
 
 
@@ -314,41 +410,43 @@ def orders():
 
     예시: lets-trade orders
     """
-    with get_client() as client:
+    asyncio.run(_orders())
+
+
+async def _orders() -> None:
+    """주문 내역 조회 실행"""
+    from .api.client import ApiError
+    from .api.order import OrderApi
+
+    async with get_client() as client:
         order_api = OrderApi(client)
 
         try:
-            order_list = order_api.get_orders()
+            order_list = await order_api.get_orders()
         except ApiError as e:
-            console.print(f"[red]조회 실패:[/red] {e}")
+            get_console().print(f"[red]조회 실패:[/red] {e}")
             raise typer.Exit(1)
 
         if not order_list:
-            console.print("[dim]당일 주문 내역이 없습니다.[/dim]")
+            get_console().print("[dim]당일 주문 내역이 없습니다.[/dim]")
             return
 
-        table = Table(title="당일 주문 내역")
-        table.add_column("시간", style="dim")
-        table.add_column("종목")
-        table.add_column("구분", justify="center")
-        table.add_column("주문가", justify="right")
-        table.add_column("주문량", justify="right")
-        table.add_column("체결량", justify="right")
-        table.add_column("상태")
+        table = _make_table(_ORDER_COLUMNS, title="당일 주문 내역")
 
+        add_row = table.add_row
         for order in order_list:
-            side_color = "cyan" if order.side == "매수" else "magenta"
-            table.add_row(
+            side = order.side
+            add_row(
                 order.order_time,
                 f"{order.name} ({order.symbol})",
-                f"[{side_color}]{order.side}[/{side_color}]",
+                SIDE_MARKUP.get(side) or f"[magenta]{side}[/magenta]",
                 f"{order.order_price:,}",
                 f"{order.order_qty:,}",
                 f"{order.exec_qty:,}",
                 order.status,
             )
 
-        console.print(table)
+        get_console().print(table)
 
 
 # ===== 전략 서브명령어 =====
@@ -357,6 +455,21 @@ strategy_app = typer.Typer(help="전략 관리")
 app.add_typer(strategy_app, name="strategy")
 
 
+@functools.lru_cache(maxsize=1)
+def _strategy_names(version: int) -> tuple[str, ...]:
+    """등록된 전략 이름 (레지스트리 버전별 캐시)"""
+    from .strategies.base import StrategyRegistry
+
+    return tuple(StrategyRegistry.list_strategies())
+
+
+def _list_strategies() -> tuple[str, ...]:
+    """등록된 전략 이름 (레지스트리가 바뀐 경우에만 다시 조회)"""
+    from .strategies.base import StrategyRegistry
+
+    return _strategy_names(StrategyRegistry.version())
+
+
 @strategy_app.command("list")
 def strategy_list():
     """
@@ -364,20 +477,18 @@ def strategy_list():
 
     예시: lets-trade strategy list
     """
-    strategies = StrategyRegistry.list_strategies()
+    strategies = _list_strategies()
 
     if not strategies:
-        console.print("[dim]등록된 전략이 없습니다.[/dim]")
+        get_console().print("[dim]등록된 전략이 없습니다.[/dim]")
         return
 
-    table = Table(title="등록된 전략")
-    table.add_column("이름")
-    table.add_column("상태")
+    table = _make_table(_STRATEGY_COLUMNS, title="등록된 전략")
 
     for name in strategies:
         table.add_row(name, "[dim]대기[/dim]")
 
-    console.print(table)
+    get_console().print(table)
 
 
 @strategy_app.command("start")
@@ -390,18 +501,20 @@ def strategy_start(
 
     예시: lets-trade strategy start ma_crossover -s 005930
     """
+    from .strategies.base import StrategyRegistry
+
     strategy_class = StrategyRegistry.get(name)
 
     if not strategy_class:
-        console.print(f"[red]전략을 찾을 수 없습니다:[/red] {name}")
-        console.print(f"[dim]사용 가능한 전략: {', '.join(StrategyRegistry.list_strategies()) or '없음'}[/dim]")
+        get_console().print(f"[red]전략을 찾을 수 없습니다:[/red] {name}")
+        get_console().print(f"[dim]사용 가능한 전략: {', '.join(_list_strategies()) or '없음'}[/dim]")
         raise typer.Exit(1)
 
     # TODO: 전략 인스턴스 생성 및 실행 로직 구현
-    console.print(f"[green]전략 시작:[/green] {name}")
+    get_console().print(f"[green]전략 시작:[/green] {name}")
     if symbol:
-        console.print(f"[dim]종목: {symbol}[/dim]")
-    console.print("[yellow]전략 실행 기능은 개발 중입니다.[/yellow]")
+        get_console().print(f"[dim]종목: {symbol}[/dim]")
+    get_console().print("[yellow]전략 실행 기능은 개발 중입니다.[/yellow]")
 
 
 @strategy_app.command("stop")
@@ -414,8 +527,8 @@ def strategy_stop(
     예시: lets-trade strategy stop ma_crossover
     """
     # TODO: 실행 중인 전략 중지 로직 구현
-    console.print(f"[yellow]전략 중지:[/yellow] {name}")
-    console.print("[yellow]전략 중지 기능은 개발 중입니다.[/yellow]")
+    get_console().print(f"[yellow]전략 중지:[/yellow] {name}")
+    get_console().print("[yellow]전략 중지 기능은 개발 중입니다.[/yellow]")
 
 
 # ===== 버전 및 정보 =====
@@ -423,7 +536,7 @@ def strategy_stop(
 def version_callback(value: bool):
     if value:
         from . import __version__
-        console.print(f"letsTrade CLI v{__version__}")
+        get_console().print(f"letsTrade CLI v{__version__}")
         raise typer.Exit()
 
 
@@ -2,13 +2,41 @@
 
 import os
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from supabase import create_client, Client
 
 from ..models import Base
+from ..models.base import BULK_INSERT_CHUNK_SIZE
+from .migrate import migrate_sqlite
+
+
+# 연결마다 적용할 PRAGMA
+# WAL + synchronous=NORMAL: 읽기와 쓰기가 서로 막지 않고, 커밋마다 fsync하지 않음
+# temp_store=MEMORY: 정렬/임시 테이블을 디스크 대신 메모리에서 처리
+# mmap_size: DB 파일을 메모리 매핑해 읽기 시 read() 시스템 콜/복사 생략 (256MB)
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _json_serializer(value: Any) -> str:
+    """JSON 컬럼 직렬화 (orjson, 정수 키는 표준 json처럼 문자열로)"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _set_sqlite_pragma(dbapi_connection, connection_record) -> None:
+    """SQLite 연결 설정"""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 
 class DatabaseManager:
@@ -33,11 +61,24 @@ class DatabaseManager:
         self._sqlite_engine = create_engine(
             f"sqlite:///{db_path}",
             echo=os.getenv("LOG_LEVEL", "INFO") == "DEBUG",
+            # 동기 라우터는 스레드풀(기본 40스레드)에서 동시에 실행되므로
+            # 기본 풀(5 + overflow 10)이 고갈되어 대기하지 않도록 여유 있게 설정
+            pool_size=10,
+            max_overflow=30,
+            # 세션 생성(의존성)과 사용(라우터)이 서로 다른 스레드에서 일어날 수 있음
+            connect_args={"check_same_thread": False},
+            # JSON 컬럼(analysis_data, parameters) 인코딩/디코딩은 표준 json 대신 orjson
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+            # 새 객체 여러 개를 flush할 때 INSERT ... RETURNING을 묶는 행 수 (bulk_insert chunk와 동일)
+            insertmanyvalues_page_size=BULK_INSERT_CHUNK_SIZE,
         )
+        event.listen(self._sqlite_engine, "connect", _set_sqlite_pragma)
         self._sqlite_session_factory = sessionmaker(bind=self._sqlite_engine)
 
-        # 테이블 생성
+        # 테이블 생성 후, 이전 버전 스키마로 만든 기존 테이블은 재구성
         Base.metadata.create_all(self._sqlite_engine)
+        migrate_sqlite(self._sqlite_engine)
 
     def get_sqlite_session(self) -> Generator[Session, None, None]:
         """SQLite 세션 제공 (컨텍스트 매니저)"""
@@ -74,6 +115,10 @@ class DatabaseManager:
 
         self._supabase_client = create_client(url, key)
 
+    def reset_supabase(self) -> None:
+        """Supabase 클라이언트 폐기 (다음 접근 시 환경 변수로 재생성)"""
+        self._supabase_client = None
+
     @property
     def supabase(self) -> Client:
         """Supabase 클라이언트 반환"""
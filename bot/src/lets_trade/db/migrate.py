@@ -0,0 +1,87 @@
+"""SQLite 캐시 스키마 마이그레이션
+
+create_all은 이미 있는 테이블을 변경하지 않으므로, 이전 버전으로 만든 cache.db는
+모델과 스키마가 어긋난 채 남습니다. SQLite는 컬럼 DEFAULT/타입을 ALTER로 바꿀 수 없어
+어긋난 테이블은 새 스키마로 다시 만들고 기존 행을 옮깁니다.
+"""
+
+from sqlalchemy import Column, Engine, Integer, Table, inspect
+from sqlalchemy.engine import Connection
+
+from ..models import Base
+from ..models.base import EnumCode
+
+
+def _needs_rebuild(table: Table, existing: dict[str, dict]) -> bool:
+    """기존 테이블이 모델 스키마와 어긋났는지 확인"""
+    for column in table.columns:
+        reflected = existing.get(column.name)
+        if reflected is None:
+            return True
+        # 모델은 server_default가 있는데 기존 컬럼에 DEFAULT가 없음 (Python default 시절 스키마)
+        if column.server_default is not None and reflected["default"] is None:
+            return True
+        # 문자열 컬럼 시절 스키마 (Enum 값을 VARCHAR로 저장)
+        if isinstance(column.type, EnumCode) and not isinstance(reflected["type"], Integer):
+            return True
+    return False
+
+
+def _select_expression(column: Column, connection: Connection) -> str:
+    """기존 테이블에서 새 컬럼 값을 읽어오는 SELECT 식"""
+    name = connection.dialect.identifier_preparer.quote(column.name)
+    if isinstance(column.type, EnumCode):
+        # 문자열로 저장된 Enum 값을 정수 코드로 변환 (이미 코드이거나 알 수 없는 값은 그대로)
+        cases = " ".join(f"WHEN '{value}' THEN {code}" for value, code in column.type.codes.items())
+        return f"CASE {name} {cases} ELSE {name} END"
+    if column.server_default is not None and not column.nullable:
+        # Python default 시절 NULL로 남은 값은 DB 기본값으로 채움
+        return f"COALESCE({name}, {column.server_default.arg.text})"
+    return name
+
+
+def _rebuild_table(connection: Connection, table: Table, existing: dict[str, dict]) -> None:
+    """테이블을 모델 스키마로 다시 만들고 기존 행 이동"""
+    preparer = connection.dialect.identifier_preparer
+    name = preparer.quote(table.name)
+    old_name = preparer.quote(f"_old_{table.name}")
+
+    # RENAME 후에도 인덱스 이름은 그대로 남아 새 테이블 인덱스와 충돌하므로 먼저 삭제
+    for index in inspect(connection).get_indexes(table.name):
+        connection.exec_driver_sql(f"DROP INDEX {preparer.quote(index['name'])}")
+    connection.exec_driver_sql(f"ALTER TABLE {name} RENAME TO {old_name}")
+    table.create(connection)
+
+    columns = [column for column in table.columns if column.name in existing]
+    targets = ", ".join(preparer.quote(column.name) for column in columns)
+    values = ", ".join(_select_expression(column, connection) for column in columns)
+    connection.exec_driver_sql(f"INSERT INTO {name} ({targets}) SELECT {values} FROM {old_name}")
+    connection.exec_driver_sql(f"DROP TABLE {old_name}")
+
+
+def migrate_sqlite(engine: Engine) -> list[str]:
+    """스키마가 어긋난 캐시 테이블 재구성 (create_all 이후 호출)
+
+    Returns:
+        재구성한 테이블 이름 목록
+    """
+    # DDL까지 한 트랜잭션으로 묶기 위해 드라이버 자동 트랜잭션을 끄고 직접 BEGIN/COMMIT
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        inspector = inspect(connection)
+        drifted = []
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"]: column for column in inspector.get_columns(table.name)}
+            if _needs_rebuild(table, existing):
+                drifted.append((table, existing))
+        if not drifted:
+            return []
+
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            for table, existing in drifted:
+                _rebuild_table(connection, table, existing)
+        except Exception:
+            connection.exec_driver_sql("ROLLBACK")
+            raise
+        connection.exec_driver_sql("COMMIT")
+        return [table.name for table, _ in drifted]
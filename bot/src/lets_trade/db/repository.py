@@ -1,6 +1,11 @@
 """데이터베이스 Repository 패턴"""
 
-from typing import Generic, TypeVar, Type, List, Optional
+import functools
+import re
+from datetime import datetime
+from typing import Any, Callable, Generic, TypeVar, Type, List, Optional
+from sqlalchemy import DateTime, Numeric
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from supabase import Client
 
@@ -8,6 +13,47 @@ from ..models import Base
 
 T = TypeVar("T", bound=Base)
 
+# Supabase 전체 조회 시 한 페이지 행 수
+REMOTE_PAGE_SIZE = 1000
+
+
+# PostgREST 타임스탬프의 소수 초 (자릿수가 잘려 오므로 6자리로 맞춤)
+_FRACTION_PATTERN = re.compile(r"\.(\d+)")
+
+
+def _isoformat(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _parse_remote_datetime(value: str) -> datetime:
+    """Supabase ISO 문자열을 datetime으로 변환
+
+    Python 3.10의 fromisoformat은 6자리가 아닌 소수 초(".12")와 "Z" 접미사를 받지 않으므로
+    먼저 정규화합니다.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    value = _FRACTION_PATTERN.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), value, count=1)
+    return datetime.fromisoformat(value)
+
+
+@functools.cache
+def _remote_column_specs(model: type) -> tuple[tuple[str, Optional[Callable[[Any], Any]]], ...]:
+    """모델별 (컬럼명, Supabase 전송용 변환 함수) 목록 (모델 클래스당 한 번만 계산)
+
+    DateTime은 ISO 문자열, Numeric(Decimal)은 문자열로 보내고 나머지는 그대로 보냅니다.
+    """
+    specs = []
+    for column in model.__table__.columns:
+        if isinstance(column.type, DateTime):
+            convert = _isoformat
+        elif isinstance(column.type, Numeric):
+            convert = str
+        else:
+            convert = None
+        specs.append((column.name, convert))
+    return tuple(specs)
+
 
 class BaseRepository(Generic[T]):
     """기본 Repository (SQLite + Supabase 동기화)"""
@@ -28,8 +74,8 @@ class BaseRepository(Generic[T]):
     # SQLite 로컬 작업
     # =============================================
     def get_local(self, id: int) -> Optional[T]:
-        """로컬에서 ID로 조회"""
-        return self.session.query(self.model).filter(self.model.id == id).first()
+        """로컬에서 ID로 조회 (identity map에 있으면 SQL 없이 반환)"""
+        return self.session.get(self.model, id)
 
     def get_all_local(self, limit: int = 100, offset: int = 0) -> List[T]:
         """로컬에서 전체 조회"""
@@ -68,6 +114,7 @@ class BaseRepository(Generic[T]):
         result = (
             self.supabase.table(self.table_name)
             .select("*")
+            .order("id")  # 페이지 경계가 흔들리지 않도록 고정 정렬
             .range(offset, offset + limit - 1)
             .execute()
         )
@@ -91,27 +138,82 @@ class BaseRepository(Generic[T]):
     # =============================================
     # 동기화 작업
     # =============================================
+    def _to_remote_dict(self, obj: T) -> dict:
+        """Supabase 전송용 dict 변환 (datetime/Decimal 직렬화)"""
+        data = {}
+        for name, convert in _remote_column_specs(type(obj)):
+            value = getattr(obj, name)
+            if value is None:
+                if name == "id":
+                    continue  # 신규 행은 원격에서 ID 발급
+            elif convert is not None:
+                value = convert(value)
+            data[name] = value
+        return data
+
     def sync_to_remote(self, obj: T) -> dict:
         """로컬 → Supabase 동기화"""
-        data = {
-            c.name: getattr(obj, c.name)
-            for c in obj.__table__.columns
-            if c.name != "id" or getattr(obj, "id") is not None
-        }
-
-        # datetime 직렬화
-        for key, value in data.items():
-            if hasattr(value, "isoformat"):
-                data[key] = value.isoformat()
-            elif hasattr(value, "__str__") and not isinstance(value, (str, int, float, bool, type(None))):
-                data[key] = str(value)
+        data = self._to_remote_dict(obj)
 
         if obj.id:
             return self.update_remote(obj.id, data)
         else:
             return self.create_remote(data)
 
+    def bulk_sync_to_remote(self, objs: List[T]) -> List[dict]:
+        """로컬 → Supabase 일괄 동기화 (배열 upsert 한 번으로 처리)"""
+        if not objs:
+            return []
+        payload = [self._to_remote_dict(obj) for obj in objs]
+        result = self.supabase.table(self.table_name).upsert(payload).execute()
+        return result.data
+
     def sync_from_remote(self, remote_data: dict) -> T:
         """Supabase → 로컬 동기화"""
         obj = self.model(**remote_data)
         return self.update_local(obj)
+
+    def sync_batch_from_remote(self, rows: List[dict]) -> int:
+        """Supabase → 로컬 일괄 동기화 (INSERT ... ON CONFLICT(id) DO UPDATE 한 번으로 처리)
+
+        Returns:
+            반영한 행 수
+        """
+        if not rows:
+            return 0
+
+        columns = self.model.__table__.columns
+        names = [c.name for c in columns]
+        # 원격 응답의 datetime은 ISO 문자열이므로 로컬 DateTime 컬럼용으로 변환
+        datetime_names = [c.name for c in columns if isinstance(c.type, DateTime)]
+
+        params = []
+        for row in rows:
+            data = {name: row.get(name) for name in names}
+            for name in datetime_names:
+                if isinstance(data[name], str):
+                    data[name] = _parse_remote_datetime(data[name])
+            params.append(data)
+
+        stmt = sqlite_insert(self.model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={name: stmt.excluded[name] for name in names if name != "id"},
+        )
+        self.session.execute(stmt, params)
+        return len(params)
+
+    def sync_all_from_remote(self, page_size: int = REMOTE_PAGE_SIZE) -> int:
+        """Supabase 전체 → 로컬 동기화 (페이지 단위 조회 후 일괄 반영)
+
+        Returns:
+            반영한 전체 행 수
+        """
+        total = 0
+        offset = 0
+        while True:
+            rows = self.get_all_remote(limit=page_size, offset=offset)
+            total += self.sync_batch_from_remote(rows)
+            if len(rows) < page_size:
+                return total
+            offset += page_size
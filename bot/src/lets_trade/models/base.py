@@ -1,20 +1,94 @@
 """SQLAlchemy Base 모델"""
 
 from datetime import datetime
-from sqlalchemy import DateTime
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from enum import Enum
+from itertools import islice
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import DateTime, SmallInteger, TypeDecorator, func, insert, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+# bulk_insert 한 번에 실행하는 행 수
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# SQLite가 직접 채우는 현재 시각 (UTC, SQLAlchemy DateTime 저장 형식과 같은 마이크로초 6자리)
+# CURRENT_TIMESTAMP는 초 단위라 (created_at, id) 커서 비교 시 기존 값과 자릿수가 어긋남
+_SQLITE_NOW_FORMAT = "%Y-%m-%d %H:%M:%f000"
+
+
+class EnumCode(TypeDecorator):
+    """문자열 Enum 값을 SmallInteger 코드로 저장하는 컬럼 타입
+
+    DB에는 1부터 시작하는 정수 코드(정의 순서)로 저장하고, 읽을 때는 문자열 값으로 돌려줍니다.
+    비교 조건(status == "executed")도 코드로 바인딩되므로 호출부는 문자열을 그대로 사용합니다.
+    코드가 정의 순서로 정해지므로 Enum 멤버는 끝에만 추가해야 합니다.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[Enum]):
+        super().__init__()
+        self.enum_cls = enum_cls
+        self.codes: dict[str, int] = {member.value: code for code, member in enumerate(enum_cls, 1)}
+        self._values: dict[int, str] = {code: value for value, code in self.codes.items()}
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        try:
+            return self.codes[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {self.enum_cls.__name__}") from None
+
+    def process_result_value(self, value, dialect) -> Optional[str]:
+        # 문자열 컬럼 시절 값은 migrate_sqlite가 코드로 바꾸며, 알 수 없는 문자열만 그대로 반환
+        if value is None or isinstance(value, str):
+            return value
+        return self._values[value]
 
 
 class Base(DeclarativeBase):
     """SQLAlchemy 기본 모델"""
-    pass
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        session: Session,
+        rows: Iterable[dict[str, Any]],
+        chunk: int = BULK_INSERT_CHUNK_SIZE,
+    ) -> int:
+        """여러 행 일괄 INSERT (ORM 객체를 만들지 않고 chunk 단위 executemany)
+
+        각 행은 컬럼명 -> 값 딕셔너리이며, 한 chunk 안의 행은 같은 키를 가져야 합니다.
+        커밋은 호출한 쪽에서 합니다.
+
+        Returns:
+            INSERT한 행 수
+        """
+        statement = insert(cls)
+        iterator = iter(rows)
+        inserted = 0
+        while batch := list(islice(iterator, chunk)):
+            session.execute(statement, batch)
+            inserted += len(batch)
+        return inserted
 
 
 class TimestampMixin:
-    """생성/수정 시간 자동 관리 Mixin"""
+    """생성/수정 시간 자동 관리 Mixin (DB에서 기록)"""
+
+    # INSERT/UPDATE 후 DB가 채운 시각을 RETURNING으로 바로 받아옴 (추가 SELECT 없음)
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime,
+        server_default=text(f"(strftime('{_SQLITE_NOW_FORMAT}', 'now'))"),
+        nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        server_default=text(f"(strftime('{_SQLITE_NOW_FORMAT}', 'now'))"),
+        onupdate=func.strftime(_SQLITE_NOW_FORMAT, "now"),
+        nullable=False,
     )
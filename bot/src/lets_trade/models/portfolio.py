@@ -1,8 +1,8 @@
 """포트폴리오 모델"""
 
 from decimal import Decimal
-from sqlalchemy import String, Integer, Numeric
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, Numeric, case, update
+from sqlalchemy.orm import Mapped, Session, mapped_column
 
 from .base import Base, TimestampMixin
 
@@ -39,3 +39,26 @@ class Portfolio(Base, TimestampMixin):
             self.profit_loss_rate = (self.profit_loss / self.total_cost) * 100
         else:
             self.profit_loss_rate = Decimal(0)
+
+    @classmethod
+    def recompute_all(cls, session: Session) -> int:
+        """전체 보유 종목 손익 일괄 재계산 (행을 읽지 않고 UPDATE 한 번으로 처리)
+
+        Returns:
+            갱신된 행 수
+        """
+        # SET 절의 식은 모두 갱신 전 값 기준으로 계산됨
+        market_value = cls.quantity * cls.current_price
+        profit_loss = market_value - cls.total_cost
+        result = session.execute(
+            update(cls).values(
+                market_value=market_value,
+                profit_loss=profit_loss,
+                # 정수 컬럼끼리 나눌 때 SQLite 정수 나눗셈이 되지 않도록 100.0 사용
+                profit_loss_rate=case(
+                    (cls.total_cost > 0, profit_loss * 100.0 / cls.total_cost),
+                    else_=0,
+                ),
+            )
+        )
+        return result.rowcount
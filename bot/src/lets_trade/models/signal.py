@@ -4,10 +4,10 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Optional
-from sqlalchemy import String, Integer, Numeric, DateTime, Text, JSON
+from sqlalchemy import String, Integer, Numeric, DateTime, Text, JSON, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from .base import Base, TimestampMixin
+from .base import Base, EnumCode, TimestampMixin
 
 
 class SignalType(str, Enum):
@@ -28,6 +28,19 @@ class SignalStatus(str, Enum):
 class Signal(Base, TimestampMixin):
     """시그널 로그 테이블"""
     __tablename__ = "signals"
+    __table_args__ = (
+        # 전략별 기간 통계 (strategy_id + created_at 범위 조건)
+        Index("ix_signals_strategy_id_created_at", "strategy_id", "created_at"),
+        # 기간 조회 (created_at 범위 조건)
+        Index("ix_signals_created_at", "created_at"),
+        # 전략별 미처리 시그널 조회 (pending 행만 담는 부분 인덱스라 작고 갱신 비용도 적음)
+        Index(
+            "ix_signals_pending_strategy_id_created_at",
+            "strategy_id",
+            "created_at",
+            sqlite_where=text(f"status = {EnumCode(SignalStatus).codes[SignalStatus.PENDING]}"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -39,8 +52,8 @@ class Signal(Base, TimestampMixin):
     stock_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # 시그널 정보
-    signal_type: Mapped[str] = mapped_column(String(10), nullable=False)  # buy/sell/hold
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default=SignalStatus.PENDING)
+    signal_type: Mapped[str] = mapped_column(EnumCode(SignalType), nullable=False)  # buy/sell/hold
+    status: Mapped[str] = mapped_column(EnumCode(SignalStatus), nullable=False, default=SignalStatus.PENDING)
 
     # 추천 가격/수량
     price: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False)
@@ -4,10 +4,10 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Optional
-from sqlalchemy import String, Integer, Numeric, DateTime, Text
+from sqlalchemy import String, Integer, Numeric, DateTime, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
-from .base import Base, TimestampMixin
+from .base import Base, EnumCode, TimestampMixin
 
 
 class OrderType(str, Enum):
@@ -28,6 +28,10 @@ class OrderStatus(str, Enum):
 class Trade(Base, TimestampMixin):
     """거래 내역 테이블"""
     __tablename__ = "trades"
+    __table_args__ = (
+        # 일자별 거래 집계용 (created_at 범위 조건)
+        Index("ix_trades_created_at", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -37,8 +41,8 @@ class Trade(Base, TimestampMixin):
     stock_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # 주문 유형 및 상태
-    order_type: Mapped[str] = mapped_column(String(10), nullable=False)  # buy/sell
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default=OrderStatus.PENDING)
+    order_type: Mapped[str] = mapped_column(EnumCode(OrderType), nullable=False)  # buy/sell
+    status: Mapped[str] = mapped_column(EnumCode(OrderStatus), nullable=False, default=OrderStatus.PENDING)
 
     # 수량 및 가격
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
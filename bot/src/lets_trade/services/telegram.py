@@ -2,15 +2,89 @@
 
 import asyncio
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from telegram import Bot
 from telegram.error import TelegramError
 
+# Telegram 봇 발송 한도 (초당 메시지 수)
+MESSAGES_PER_SECOND = 30
 
-@dataclass
+# 대기 메시지가 이 수 이상 밀리면 연속된 시그널 알림을 하나로 합쳐 발송
+GROUP_THRESHOLD = 5
+
+# Telegram 메시지 최대 길이
+MAX_MESSAGE_LENGTH = 4096
+
+# 알림 시각 표시 형식
+TIME_FORMAT = "%H:%M:%S"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# 시그널 강도 막대 (0~10칸, 강도 * 10으로 인덱싱)
+_STRENGTH_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+# 알림 메시지 템플릿 (format_map으로 채움)
+TRADE_TEMPLATE = """\
+{emoji} <b>[체결] {name} {side}</b>
+
+종목코드: {symbol}
+수량: {quantity:,}주
+가격: {price:,}원
+총금액: {total_amount:,}원
+시간: {now}"""
+
+SIGNAL_TEMPLATE = """\
+{emoji} <b>[시그널] {strategy_name} - {signal_type}</b>
+
+종목: {name} ({symbol})
+현재가: {current_price:,}원
+강도: [{strength_bar}] {strength_percent:.0f}%
+{reason_line}
+시간: {now}"""
+
+DAILY_REPORT_TEMPLATE = """\
+📊 <b>일일 리포트</b> ({date:%Y-%m-%d})
+
+<b>자산 현황</b>
+총자산: {total_asset:,}원
+일일 손익: {profit_sign}{daily_profit:,}원 ({profit_sign}{daily_profit_rate:.2f}%)
+
+<b>거래 현황</b>
+매수: {buy_count}건
+매도: {sell_count}건
+{positions_text}
+{profit_emoji} 오늘도 성공적인 투자 되세요!"""
+
+
+class _TemplateFields(dict):
+    """템플릿 치환용 매핑 (추가 값에 없는 키는 알림 데이터의 속성에서 조회)"""
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: object, **extras):
+        super().__init__(extras)
+        self._source = source
+
+    def __missing__(self, key: str):
+        return getattr(self._source, key)
+
+
+@lru_cache(maxsize=4)
+def _format_second(fmt: str, second: int) -> str:
+    return datetime.fromtimestamp(second).strftime(fmt)
+
+
+def _now_text(fmt: str) -> str:
+    """현재 시각 문자열 (같은 초에 몰린 알림은 포맷 결과를 재사용)"""
+    return _format_second(fmt, int(time.time()))
+
+
+@dataclass(slots=True)
 class TradeNotification:
     """체결 알림 데이터"""
     symbol: str
@@ -21,7 +95,7 @@ class TradeNotification:
     total_amount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalNotification:
     """시그널 알림 데이터"""
     strategy_name: str
@@ -33,7 +107,7 @@ class SignalNotification:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyReport:
     """일일 리포트 데이터"""
     date: datetime
@@ -46,7 +120,10 @@ class DailyReport:
 
 
 class TelegramNotifier:
-    """Telegram 알림 발송 서비스"""
+    """Telegram 알림 발송 서비스
+
+    메시지는 대기열에 넣고 백그라운드 작업 하나가 발송 한도(초당 30건)에 맞춰 순서대로 보냅니다.
+    """
 
     def __init__(
         self,
@@ -63,9 +140,38 @@ class TelegramNotifier:
 
         self.bot = Bot(token=self.token)
 
+        # 발송 대기열과 작업 (이벤트 루프에서 처음 발송할 때 생성)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # 동기 발송 전용 이벤트 루프와 Bot (HTTP 연결 풀은 루프에 묶이므로 분리, 첫 동기 발송 시 생성)
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_bot: Optional[Bot] = None
+
+    def enqueue(self, text: str, parse_mode: str = "HTML", groupable: bool = False) -> asyncio.Future:
+        """
+        메시지를 발송 대기열에 추가 (기다리지 않고 바로 반환)
+
+        Args:
+            text: 메시지 내용
+            parse_mode: 파싱 모드 (HTML or Markdown)
+            groupable: 대기열이 밀렸을 때 이웃한 groupable 메시지와 합쳐 보내도 되는지 여부
+
+        Returns:
+            asyncio.Future: 발송 성공 여부(bool)가 설정되는 Future
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._drain(self._queue))
+
+        future = loop.create_future()
+        self._queue.put_nowait((text, parse_mode, groupable, future))
+        return future
+
     async def send_message(self, text: str, parse_mode: str = "HTML") -> bool:
         """
-        메시지 발송
+        메시지 발송 (대기열을 거쳐 발송 한도에 맞춰 전송)
 
         Args:
             text: 메시지 내용
@@ -74,8 +180,67 @@ class TelegramNotifier:
         Returns:
             bool: 발송 성공 여부
         """
+        return await self.enqueue(text, parse_mode)
+
+    async def aclose(self) -> None:
+        """대기 중인 메시지를 모두 발송한 뒤 발송 작업 종료"""
+        if self._worker is None:
+            return
+        if not self._worker.done():
+            await self._queue.join()
+            self._worker.cancel()
+        self._queue = None
+        self._worker = None
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """대기열 메시지를 발송 간격을 지켜 순서대로 발송"""
+        loop = asyncio.get_running_loop()
+        interval = 1 / MESSAGES_PER_SECOND
+        next_send_at = 0.0
+        carry = None  # 합치지 못하고 꺼낸 다음 메시지
+
+        while True:
+            text, parse_mode, groupable, future = carry or await queue.get()
+            carry = None
+            futures = [future]
+
+            # 대기열이 밀려 있으면 같은 형식의 연속 시그널 알림만 길이 한도 안에서 합침
+            # (체결/오류/리포트는 한 메시지의 형식 오류가 다른 알림까지 실패시키지 않도록 따로 발송)
+            while groupable and queue.qsize() >= GROUP_THRESHOLD:
+                item = queue.get_nowait()
+                if (
+                    not item[2]
+                    or item[1] != parse_mode
+                    or len(text) + 2 + len(item[0]) > MAX_MESSAGE_LENGTH
+                ):
+                    carry = item
+                    break
+                text = f"{text}\n\n{item[0]}"
+                futures.append(item[3])
+
+            delay = next_send_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_send_at = loop.time() + interval
+
+            try:
+                result = await self._send(text, parse_mode)
+            except Exception as e:
+                for pending in futures:
+                    if not pending.done():
+                        pending.set_exception(e)
+            else:
+                for pending in futures:
+                    if not pending.done():
+                        pending.set_result(result)
+            finally:
+                for _ in futures:
+                    queue.task_done()
+
+    async def _send(self, text: str, parse_mode: str, bot: Optional[Bot] = None) -> bool:
+        """Telegram API로 메시지 한 건 발송"""
         try:
-            await self.bot.send_message(
+            await (bot or self.bot).send_message(
                 chat_id=self.chat_id,
                 text=text,
                 parse_mode=parse_mode,
@@ -86,8 +251,22 @@ class TelegramNotifier:
             return False
 
     def send_message_sync(self, text: str, parse_mode: str = "HTML") -> bool:
-        """동기 방식 메시지 발송"""
-        return asyncio.run(self.send_message(text, parse_mode))
+        """동기 방식 메시지 발송 (전용 루프에서 대기열 없이 바로 발송, 호출 간 연결 재사용)"""
+        if self._sync_loop is None or self._sync_loop.is_closed():
+            self._sync_loop = asyncio.new_event_loop()
+            self._sync_bot = Bot(token=self.token)
+        return self._sync_loop.run_until_complete(self._send(text, parse_mode, self._sync_bot))
+
+    def close_sync(self) -> None:
+        """동기 발송용 연결과 이벤트 루프 정리"""
+        if self._sync_loop is None or self._sync_loop.is_closed():
+            return
+        try:
+            self._sync_loop.run_until_complete(self._sync_bot.shutdown())
+        finally:
+            self._sync_loop.close()
+            self._sync_loop = None
+            self._sync_bot = None
 
     async def notify_trade(self, trade: TradeNotification) -> bool:
         """
@@ -100,15 +279,9 @@ class TelegramNotifier:
             bool: 발송 성공 여부
         """
         emoji = "🔵" if trade.side == "매수" else "🔴"
-        message = f"""
-{emoji} <b>[체결] {trade.name} {trade.side}</b>
-
-종목코드: {trade.symbol}
-수량: {trade.quantity:,}주
-가격: {trade.price:,}원
-총금액: {trade.total_amount:,}원
-시간: {datetime.now().strftime("%H:%M:%S")}
-        """.strip()
+        message = TRADE_TEMPLATE.format_map(
+            _TemplateFields(trade, emoji=emoji, now=_now_text(TIME_FORMAT))
+        )
 
         return await self.send_message(message)
 
@@ -129,19 +302,20 @@ class TelegramNotifier:
         else:
             emoji = "⏸"
 
-        strength_bar = "█" * int(signal.strength * 10) + "░" * (10 - int(signal.strength * 10))
+        strength_bar = _STRENGTH_BARS[max(0, min(10, int(signal.strength * 10)))]
 
-        message = f"""
-{emoji} <b>[시그널] {signal.strategy_name} - {signal.signal_type}</b>
+        message = SIGNAL_TEMPLATE.format_map(
+            _TemplateFields(
+                signal,
+                emoji=emoji,
+                strength_bar=strength_bar,
+                strength_percent=signal.strength * 100,
+                reason_line=f"사유: {signal.reason}" if signal.reason else "",
+                now=_now_text(TIME_FORMAT),
+            )
+        )
 
-종목: {signal.name} ({signal.symbol})
-현재가: {signal.current_price:,}원
-강도: [{strength_bar}] {signal.strength*100:.0f}%
-{f'사유: {signal.reason}' if signal.reason else ''}
-시간: {datetime.now().strftime("%H:%M:%S")}
-        """.strip()
-
-        return await self.send_message(message)
+        return await self.enqueue(message, groupable=True)
 
     async def notify_daily_report(self, report: DailyReport) -> bool:
         """
@@ -159,26 +333,23 @@ class TelegramNotifier:
         # 보유 종목 리스트
         positions_text = ""
         if report.positions:
-            positions_text = "\n<b>보유 종목:</b>\n"
+            lines = ["\n<b>보유 종목:</b>\n"]
             for pos in report.positions[:5]:  # 최대 5개
-                pos_emoji = "🟢" if pos.get("profit_rate", 0) >= 0 else "🔴"
-                positions_text += f"{pos_emoji} {pos['name']}: {pos.get('profit_rate', 0):+.1f}%\n"
+                profit_rate = pos.get("profit_rate", 0)
+                pos_emoji = "🟢" if profit_rate >= 0 else "🔴"
+                lines.append(f"{pos_emoji} {pos['name']}: {profit_rate:+.1f}%\n")
             if len(report.positions) > 5:
-                positions_text += f"... 외 {len(report.positions) - 5}종목\n"
-
-        message = f"""
-📊 <b>일일 리포트</b> ({report.date.strftime("%Y-%m-%d")})
-
-<b>자산 현황</b>
-총자산: {report.total_asset:,}원
-일일 손익: {profit_sign}{report.daily_profit:,}원 ({profit_sign}{report.daily_profit_rate:.2f}%)
-
-<b>거래 현황</b>
-매수: {report.buy_count}건
-매도: {report.sell_count}건
-{positions_text}
-{profit_emoji} 오늘도 성공적인 투자 되세요!
-        """.strip()
+                lines.append(f"... 외 {len(report.positions) - 5}종목\n")
+            positions_text = "".join(lines)
+
+        message = DAILY_REPORT_TEMPLATE.format_map(
+            _TemplateFields(
+                report,
+                profit_emoji=profit_emoji,
+                profit_sign=profit_sign,
+                positions_text=positions_text,
+            )
+        )
 
         return await self.send_message(message)
 
@@ -198,7 +369,7 @@ class TelegramNotifier:
 
 {f'컨텍스트: {context}' if context else ''}
 에러: {error_message}
-시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+시간: {_now_text(DATETIME_FORMAT)}
         """.strip()
 
         return await self.send_message(message)
@@ -208,7 +379,7 @@ class TelegramNotifier:
         message = f"""
 🚀 <b>letsTrade 봇 시작</b>
 
-시작 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+시작 시간: {_now_text(DATETIME_FORMAT)}
 상태: 정상 작동 중
         """.strip()
 
@@ -219,7 +390,7 @@ class TelegramNotifier:
         message = f"""
 🛑 <b>letsTrade 봇 종료</b>
 
-종료 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+종료 시간: {_now_text(DATETIME_FORMAT)}
         """.strip()
 
         return await self.send_message(message)
@@ -1,6 +1,9 @@
 """매매 전략 프레임워크"""
 
 from .base import (
+    SIGNAL_BUY,
+    SIGNAL_HOLD,
+    SIGNAL_SELL,
     Signal,
     SignalType,
     Strategy,
@@ -26,6 +29,9 @@ from .risk import (
 
 __all__ = [
     # Base
+    "SIGNAL_BUY",
+    "SIGNAL_HOLD",
+    "SIGNAL_SELL",
     "Signal",
     "SignalType",
     "Strategy",
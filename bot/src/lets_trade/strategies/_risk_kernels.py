@@ -0,0 +1,80 @@
+"""손절/익절 판정 커널
+
+numba가 설치되어 있으면 네이티브 코드로 컴파일하고, 없으면 일반 Python 함수로 실행합니다.
+fastmath는 NaN/Inf가 없다고 가정해 잘못된 시세에서 판정이 달라지므로 쓰지 않습니다.
+"""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:  # numba는 선택 의존성 (pip install lets-trade[fast])
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# eval_stops 반환 코드
+HOLD = 0
+STOP_LOSS = 1
+TAKE_PROFIT = 2
+TRAILING_STOP = 3
+
+
+@njit(cache=True)
+def eval_stops(
+    entry_price: float,
+    current_price: float,
+    highest_price: float,
+    neg_stop_loss_rate: float,
+    take_profit_rate: float,
+    trailing_stop_rate: float,
+    trailing: bool,
+) -> int:
+    """청산 판정 코드 계산 (수익률은 한 번만 계산, 손절 조건을 익절보다 먼저 확인)
+
+    highest_price는 현재가까지 반영된 최고가, neg_stop_loss_rate는 부호를 바꾼 손절선(%)입니다.
+    """
+    profit_rate = 0.0
+    if entry_price > 0:
+        profit_rate = (current_price - entry_price) / entry_price * 100
+
+    if trailing:
+        if highest_price > 0 and (highest_price - current_price) / highest_price * 100 >= trailing_stop_rate:
+            return TRAILING_STOP
+    elif profit_rate <= neg_stop_loss_rate:
+        return STOP_LOSS
+
+    if profit_rate >= take_profit_rate:
+        return TAKE_PROFIT
+    return HOLD
+
+
+# 컴파일된 커널과 Python 함수의 판정 비교용 입력 (비유한 가격, 손절/익절/트레일링 경계값)
+# (entry, current, highest, neg_stop_loss_rate, take_profit_rate, trailing_stop_rate, trailing)
+_PARITY_CASES = (
+    (70000.0, math.nan, 70000.0, -5.0, 10.0, 3.0, False),
+    (70000.0, math.nan, 70000.0, -5.0, 10.0, 3.0, True),
+    (math.nan, 70000.0, 70000.0, -5.0, 10.0, 3.0, False),
+    (70000.0, 70000.0, math.nan, -5.0, 10.0, 3.0, True),
+    (70000.0, math.inf, math.inf, -5.0, 10.0, 3.0, True),
+    (70000.0, -math.inf, 70000.0, -5.0, 10.0, 3.0, False),
+    (0.0, 70000.0, 0.0, -5.0, 10.0, 3.0, False),
+    (70400.0, 65472.0, 0.0, -7.0, 10.0, 3.0, False),
+    (100000.0, 110000.0, 0.0, -5.0, 10.0, 3.0, False),
+    (100000.0, 97000.0, 100000.0, -5.0, 10.0, 3.0, True),
+)
+
+
+def _matches_python(kernel) -> bool:
+    """컴파일된 커널이 모든 비교 입력에서 Python 함수와 같은 코드를 반환하는지 확인"""
+    py_func = getattr(kernel, "py_func", None)
+    if py_func is None:  # numba 미설치 - 이미 Python 함수
+        return True
+    return all(kernel(*case) == py_func(*case) for case in _PARITY_CASES)
+
+
+# 설치 환경(numba 유무)에 따라 청산 판정이 달라지지 않도록, 어긋나면 Python 함수로 대체
+if not _matches_python(eval_stops):
+    eval_stops = eval_stops.py_func
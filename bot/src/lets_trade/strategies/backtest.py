@@ -4,12 +4,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from .base import Signal, SignalType, Strategy
+from .base import SIGNAL_BUY, SIGNAL_SELL, Signal, SignalType, Strategy
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Trade:
     """백테스트 거래 기록"""
     entry_date: datetime
@@ -24,6 +25,15 @@ class Trade:
     holding_days: int = 0
 
 
+@dataclass(slots=True)
+class OpenPosition:
+    """백테스트 보유 포지션"""
+    entry_date: datetime
+    entry_price: float
+    quantity: int
+    symbol: str
+
+
 @dataclass
 class BacktestResult:
     """백테스트 결과"""
@@ -68,9 +78,9 @@ class Backtester:
 
         # 상태
         self.capital = initial_capital
-        self.position: Optional[dict] = None
+        self.position: Optional[OpenPosition] = None
         self.trades: list[Trade] = []
-        self.equity_history: list[float] = []
+        self.equity_history: np.ndarray = np.empty(0)
 
     def run(
         self,
@@ -102,34 +112,95 @@ class Backtester:
         self.capital = self.initial_capital
         self.position = None
         self.trades = []
-        self.equity_history = [self.initial_capital]
 
         # 전략 초기화
         self.strategy.initialize()
 
-        # 시뮬레이션
-        for i in range(len(data)):
-            current_data = data.iloc[:i+1]
-            current_price = data.iloc[i]["close"]
-            current_date = data.index[i]
+        # 봉마다 DataFrame 행을 조회하지 않도록 배열로 꺼내 둠
+        closes = data["close"].to_numpy(dtype=np.float64)
+        dates = data.index
 
-            # 시그널 생성
-            signal = self.strategy.generate_signal(current_data)
+        # 자산 기록 (0번은 초기 자본, i+1번은 i번째 봉 종료 시점)
+        self.equity_history = np.empty(len(closes) + 1, dtype=np.float64)
+        self.equity_history[0] = self.initial_capital
 
-            # 시그널 처리
-            self._process_signal(signal, current_price, current_date)
+        # 벡터화 시그널 (미지원 전략은 봉마다 generate_signal 호출)
+        codes = self.strategy.generate_signals_vectorized(data)
+        symbol = self.strategy.config.symbols[0] if self.strategy.config.symbols else ""
 
-            # 자산 기록
-            equity = self._calculate_equity(current_price)
-            self.equity_history.append(equity)
+        # 시뮬레이션
+        if codes is None:
+            self._simulate_bars(data, closes, dates)
+        else:
+            self._simulate_signals(codes, closes, dates, symbol)
 
         # 마지막 포지션 청산
         if self.position:
-            self._close_position(data.iloc[-1]["close"], data.index[-1])
+            self._close_position(closes[-1], dates[-1])
 
         # 결과 계산
         return self._calculate_result(data)
 
+    def _simulate_bars(self, data: pd.DataFrame, closes: np.ndarray, dates: pd.Index) -> None:
+        """봉마다 generate_signal()을 호출하는 시뮬레이션"""
+        for i in range(len(closes)):
+            current_price = closes[i]
+            self._process_signal(
+                self.strategy.generate_signal(data.iloc[:i+1]), current_price, dates[i]
+            )
+
+            # 자산 기록
+            self.equity_history[i + 1] = self._calculate_equity(current_price)
+
+    def _simulate_signals(
+        self,
+        codes: np.ndarray,
+        closes: np.ndarray,
+        dates: pd.Index,
+        symbol: str,
+    ) -> None:
+        """벡터화 시그널 시뮬레이션
+
+        HOLD가 아닌 봉만 순회하며 진입/청산을 처리하고,
+        자산 곡선은 상태가 바뀐 시점의 (현금, 보유 수량)을 봉 단위로 펼쳐 한 번에 계산합니다.
+        """
+        change_bars: list[int] = []
+        cash_after = [self.capital]
+        quantity_after = [0]
+
+        for i in np.flatnonzero(codes).tolist():
+            code = codes[i]
+            if code == SIGNAL_BUY and self.position is None:
+                signal_type = SignalType.BUY
+            elif code == SIGNAL_SELL and self.position is not None:
+                signal_type = SignalType.SELL
+            else:
+                continue
+
+            current_price = float(closes[i])
+            signal = Signal(
+                signal_type=signal_type,
+                symbol=symbol,
+                price=current_price,
+                timestamp=dates[i],
+            )
+            had_position = self.position is not None
+            self._process_signal(signal, current_price, dates[i])
+
+            # 검증 실패/수량 0 등으로 상태가 그대로면 기록하지 않음
+            if (self.position is not None) != had_position:
+                change_bars.append(i)
+                cash_after.append(self.capital)
+                quantity_after.append(self.position.quantity if self.position else 0)
+
+        # 각 봉 시점에 유효한 상태 번호 (0 = 첫 변경 전)
+        state = np.searchsorted(
+            np.asarray(change_bars, dtype=np.int64), np.arange(len(closes)), side="right"
+        )
+        self.equity_history[1:] = (
+            np.asarray(cash_after)[state] + np.asarray(quantity_after, dtype=np.float64)[state] * closes
+        )
+
     def _process_signal(
         self,
         signal: Signal,
@@ -176,50 +247,51 @@ class Backtester:
             commission = cost * self.commission
 
         # 포지션 기록
-        self.position = {
-            "entry_date": date,
-            "entry_price": entry_price,
-            "quantity": quantity,
-            "symbol": signal.symbol,
-        }
+        self.position = OpenPosition(
+            entry_date=date,
+            entry_price=entry_price,
+            quantity=quantity,
+            symbol=signal.symbol,
+        )
 
         # 자본 차감
         self.capital -= (cost + commission)
 
     def _close_position(self, price: float, date: datetime) -> None:
         """포지션 청산"""
-        if self.position is None:
+        position = self.position
+        if position is None:
             return
 
         # 슬리피지 적용
         exit_price = price * (1 - self.slippage)
 
         # 수익 계산
-        proceeds = exit_price * self.position["quantity"]
+        proceeds = exit_price * position.quantity
         commission = proceeds * self.commission
         net_proceeds = proceeds - commission
 
         profit_loss = net_proceeds - (
-            self.position["entry_price"] * self.position["quantity"]
+            position.entry_price * position.quantity
         )
         profit_rate = (
-            (exit_price - self.position["entry_price"])
-            / self.position["entry_price"]
+            (exit_price - position.entry_price)
+            / position.entry_price
             * 100
         )
 
         # 거래 기록
         trade = Trade(
-            entry_date=self.position["entry_date"],
+            entry_date=position.entry_date,
             exit_date=date,
-            symbol=self.position["symbol"],
+            symbol=position.symbol,
             side="long",
-            entry_price=self.position["entry_price"],
+            entry_price=position.entry_price,
             exit_price=exit_price,
-            quantity=self.position["quantity"],
+            quantity=position.quantity,
             profit_loss=profit_loss,
             profit_rate=profit_rate,
-            holding_days=(date - self.position["entry_date"]).days,
+            holding_days=(date - position.entry_date).days,
         )
         self.trades.append(trade)
 
@@ -231,15 +303,16 @@ class Backtester:
         """현재 자산 가치 계산"""
         equity = self.capital
         if self.position:
-            equity += current_price * self.position["quantity"]
+            equity += current_price * self.position.quantity
         return equity
 
     def _calculate_result(self, data: pd.DataFrame) -> BacktestResult:
         """결과 계산"""
-        equity_series = pd.Series(self.equity_history, index=list(data.index) + [data.index[-1]])
+        equity = self.equity_history
+        equity_series = pd.Series(equity, index=data.index.append(data.index[-1:]), copy=False)
 
         # 기본 지표
-        final_capital = self.equity_history[-1]
+        final_capital = float(equity[-1])
         total_return = (final_capital - self.initial_capital) / self.initial_capital * 100
 
         # 연간 수익률
@@ -248,22 +321,30 @@ class Backtester:
         annual_return = ((1 + total_return / 100) ** (1 / years) - 1) * 100 if years > 0 else 0
 
         # 최대 낙폭
-        rolling_max = equity_series.expanding().max()
-        drawdown = (equity_series - rolling_max) / rolling_max * 100
-        max_drawdown = drawdown.min()
-
-        # 승패 분석
-        winning_trades = [t for t in self.trades if t.profit_loss > 0]
-        losing_trades = [t for t in self.trades if t.profit_loss <= 0]
-
-        win_rate = len(winning_trades) / len(self.trades) * 100 if self.trades else 0
-        avg_profit = sum(t.profit_loss for t in winning_trades) / len(winning_trades) if winning_trades else 0
-        avg_loss = sum(t.profit_loss for t in losing_trades) / len(losing_trades) if losing_trades else 0
-        profit_factor = abs(sum(t.profit_loss for t in winning_trades) / sum(t.profit_loss for t in losing_trades)) if losing_trades and sum(t.profit_loss for t in losing_trades) != 0 else 0
-
-        # 샤프 비율 (단순 계산)
-        returns = equity_series.pct_change().dropna()
-        sharpe_ratio = (returns.mean() / returns.std() * (252 ** 0.5)) if returns.std() > 0 else 0
+        rolling_max = np.maximum.accumulate(equity)
+        max_drawdown = float(((equity - rolling_max) / rolling_max).min() * 100)
+
+        # 승패 분석 (한 번 순회로 합계/건수 집계)
+        win_sum = loss_sum = 0.0
+        win_count = loss_count = 0
+        for trade in self.trades:
+            profit_loss = trade.profit_loss
+            if profit_loss > 0:
+                win_sum += profit_loss
+                win_count += 1
+            else:
+                loss_sum += profit_loss
+                loss_count += 1
+
+        win_rate = win_count / len(self.trades) * 100 if self.trades else 0
+        avg_profit = win_sum / win_count if win_count else 0
+        avg_loss = loss_sum / loss_count if loss_count else 0
+        profit_factor = abs(win_sum / loss_sum) if loss_sum != 0 else 0
+
+        # 샤프 비율 (단순 계산, 표본 표준편차)
+        returns = np.diff(equity) / equity[:-1]
+        returns_std = returns.std(ddof=1) if len(returns) > 1 else 0.0
+        sharpe_ratio = float(returns.mean() / returns_std * (252 ** 0.5)) if returns_std > 0 else 0
 
         return BacktestResult(
             strategy_name=self.strategy.name,
@@ -277,8 +358,8 @@ class Backtester:
             sharpe_ratio=sharpe_ratio,
             win_rate=win_rate,
             total_trades=len(self.trades),
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
+            winning_trades=win_count,
+            losing_trades=loss_count,
             avg_profit=avg_profit,
             avg_loss=avg_loss,
             profit_factor=profit_factor,
@@ -1,11 +1,14 @@
 """전략 프레임워크 베이스 클래스"""
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from importlib.metadata import EntryPoint, entry_points
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -16,7 +19,13 @@ class SignalType(Enum):
     HOLD = "hold"
 
 
-@dataclass
+# 벡터화 시그널 배열(generate_signals_vectorized)의 코드 값
+SIGNAL_HOLD = 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+
+
+@dataclass(slots=True)
 class Signal:
     """매매 시그널"""
     signal_type: SignalType
@@ -29,20 +38,20 @@ class Signal:
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: dict = field(default_factory=dict)
 
-    @property
-    def is_buy(self) -> bool:
-        return self.signal_type == SignalType.BUY
-
-    @property
-    def is_sell(self) -> bool:
-        return self.signal_type == SignalType.SELL
+    # 시그널 유형 플래그 (signal_type을 지정할 때마다 함께 계산 - 생성 후 바꿔도 어긋나지 않음)
+    is_buy: bool = field(init=False, repr=False, compare=False)
+    is_sell: bool = field(init=False, repr=False, compare=False)
+    is_hold: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_hold(self) -> bool:
-        return self.signal_type == SignalType.HOLD
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "signal_type":
+            object.__setattr__(self, "is_buy", value is SignalType.BUY)
+            object.__setattr__(self, "is_sell", value is SignalType.SELL)
+            object.__setattr__(self, "is_hold", value is SignalType.HOLD)
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyConfig:
     """전략 설정"""
     name: str
@@ -60,8 +69,16 @@ class Strategy(ABC):
     전략 베이스 클래스
 
     모든 매매 전략은 이 클래스를 상속받아 구현합니다.
+    클래스 키워드로 이름을 주면 레지스트리에 자동 등록됩니다.
+
+        class MovingAverageCross(Strategy, name="ma_cross"): ...
     """
 
+    def __init_subclass__(cls, name: Optional[str] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if name is not None:
+            StrategyRegistry.add(name, cls)
+
     def __init__(self, config: StrategyConfig):
         self.config = config
         self._is_initialized = False
@@ -108,6 +125,22 @@ class Strategy(ABC):
         """
         pass
 
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        전체 구간 시그널 일괄 생성 (백테스트용)
+
+        각 봉까지의 데이터만 사용해 계산한 시그널 코드(SIGNAL_BUY/SIGNAL_SELL/SIGNAL_HOLD)를
+        data와 같은 길이의 정수 배열로 반환합니다.
+        기본 구현은 None을 반환하며, 이 경우 백테스터가 봉마다 generate_signal()을 호출합니다.
+
+        Args:
+            data: OHLCV 데이터 (columns: open, high, low, close, volume)
+
+        Returns:
+            Optional[np.ndarray]: 시그널 코드 배열 (미지원 시 None)
+        """
+        return None
+
     @abstractmethod
     def calculate_position_size(self, signal: Signal, available_cash: float) -> int:
         """
@@ -132,16 +165,9 @@ class Strategy(ABC):
         Returns:
             bool: 유효 여부
         """
-        if signal.is_hold:
+        if signal.signal_type is SignalType.HOLD:
             return True
-
-        if signal.price <= 0:
-            return False
-
-        if signal.strength < 0 or signal.strength > 1:
-            return False
-
-        return True
+        return signal.price > 0 and 0 <= signal.strength <= 1
 
     def on_order_executed(self, order_result: Any) -> None:
         """
@@ -165,34 +191,73 @@ class Strategy(ABC):
         return f"Strategy({self.name}, active={self.is_active})"
 
 
+# 외부 패키지 전략 등록용 entry point 그룹 (pyproject.toml의 [project.entry-points."lets_trade.strategies"])
+STRATEGY_ENTRY_POINT_GROUP = "lets_trade.strategies"
+
+
 class StrategyRegistry:
-    """전략 레지스트리 (싱글톤)"""
+    """전략 레지스트리 (싱글톤)
+
+    @register로 등록한 전략과 entry point로 선언된 전략을 함께 관리합니다.
+    entry point 전략은 목록 조회 시 import하지 않고, get()으로 처음 조회할 때 로드합니다.
+    """
 
     _instance = None
     _strategies: dict[str, type[Strategy]] = {}
+    _entry_points: Optional[dict[str, EntryPoint]] = None
+    _version = 0  # 등록 시마다 증가 (목록 캐시 무효화용)
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    @classmethod
+    def add(cls, name: str, strategy_class: type[Strategy]) -> None:
+        """전략 클래스 등록 (이름은 intern해 조회 시 동일 객체 비교)"""
+        cls._strategies[sys.intern(name)] = strategy_class
+        cls._version += 1
+
     @classmethod
     def register(cls, name: str):
-        """전략 등록 데코레이터"""
+        """전략 등록 데코레이터 (클래스 키워드 name=... 등록과 동일)"""
         def decorator(strategy_class: type[Strategy]):
-            cls._strategies[name] = strategy_class
+            cls.add(name, strategy_class)
             return strategy_class
         return decorator
 
+    @classmethod
+    def _discovered(cls) -> dict[str, EntryPoint]:
+        """entry point로 선언된 전략 (메타데이터만 읽음, 최초 1회)"""
+        if cls._entry_points is None:
+            cls._entry_points = {
+                ep.name: ep for ep in entry_points(group=STRATEGY_ENTRY_POINT_GROUP)
+            }
+        return cls._entry_points
+
     @classmethod
     def get(cls, name: str) -> Optional[type[Strategy]]:
-        """등록된 전략 클래스 조회"""
-        return cls._strategies.get(name)
+        """등록된 전략 클래스 조회 (entry point 전략은 첫 조회 시 로드 후 보관)"""
+        name = sys.intern(name)
+        strategy_class = cls._strategies.get(name)
+        if strategy_class is None:
+            entry_point = cls._discovered().get(name)
+            if entry_point is not None:
+                strategy_class = entry_point.load()
+                cls._strategies[name] = strategy_class
+        return strategy_class
+
+    @classmethod
+    def version(cls) -> int:
+        """레지스트리 변경 횟수"""
+        return cls._version
 
     @classmethod
     def list_strategies(cls) -> list[str]:
-        """등록된 전략 목록"""
-        return list(cls._strategies.keys())
+        """등록된 전략 목록 (entry point 전략은 import하지 않음)"""
+        names = list(cls._strategies)
+        names.extend(name for name in cls._discovered() if name not in cls._strategies)
+        return names
 
     @classmethod
     def create(cls, name: str, config: StrategyConfig) -> Optional[Strategy]:
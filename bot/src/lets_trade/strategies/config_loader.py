@@ -1,14 +1,25 @@
 """전략 설정 로더"""
 
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import yaml
 
 from .base import StrategyConfig
 
+# LibYAML 바인딩이 있으면 C 로더 사용 (없으면 순수 Python SafeLoader)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 지원하는 설정 파일 확장자
+_YAML_SUFFIXES = frozenset({".yaml", ".yml"})
+_JSON_SUFFIXES = frozenset({".json"})
+
+# 설정 파일 동시 로드 최대 스레드 수
+MAX_LOAD_WORKERS = 32
+
 
 class StrategyConfigLoader:
     """전략 설정 파일 로더"""
@@ -16,24 +27,25 @@ class StrategyConfigLoader:
     @staticmethod
     def load_yaml(path: str | Path) -> StrategyConfig:
         """YAML 파일에서 전략 설정 로드"""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # 바이너리로 열어 텍스트 디코딩 없이 로더가 직접 UTF-8 처리
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
         return StrategyConfigLoader._parse_config(data)
 
     @staticmethod
     def load_json(path: str | Path) -> StrategyConfig:
         """JSON 파일에서 전략 설정 로드"""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(Path(path).read_bytes())
         return StrategyConfigLoader._parse_config(data)
 
     @staticmethod
     def load(path: str | Path) -> StrategyConfig:
         """파일 확장자에 따라 자동으로 로드"""
         path = Path(path)
-        if path.suffix in [".yaml", ".yml"]:
+        suffix = path.suffix.lower()
+        if suffix in _YAML_SUFFIXES:
             return StrategyConfigLoader.load_yaml(path)
-        elif path.suffix == ".json":
+        elif suffix in _JSON_SUFFIXES:
             return StrategyConfigLoader.load_json(path)
         else:
             raise ValueError(f"지원하지 않는 파일 형식: {path.suffix}")
@@ -49,8 +61,8 @@ class StrategyConfigLoader:
     def save_json(config: StrategyConfig, path: str | Path) -> None:
         """전략 설정을 JSON 파일로 저장"""
         data = StrategyConfigLoader._config_to_dict(config)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson은 비ASCII 문자를 이스케이프하지 않고 UTF-8로 출력 (ensure_ascii=False와 동일)
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
     @staticmethod
     def _parse_config(data: dict) -> StrategyConfig:
@@ -95,22 +107,29 @@ class StrategyManager:
         if not self.config_dir.exists():
             return self.strategies
 
-        for path in self.config_dir.glob("*.yaml"):
-            try:
-                config = StrategyConfigLoader.load_yaml(path)
-                self.strategies[config.name] = config
-            except Exception as e:
-                print(f"전략 로드 실패 ({path}): {e}")
+        paths = [*self.config_dir.glob("*.yaml"), *self.config_dir.glob("*.json")]
+        if not paths:
+            return self.strategies
+
+        # 파일 읽기/파싱은 스레드로 동시에 하고, 등록은 기존 순서(YAML → JSON)대로
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(paths))) as executor:
+            configs = list(executor.map(self._load_file, paths))
 
-        for path in self.config_dir.glob("*.json"):
-            try:
-                config = StrategyConfigLoader.load_json(path)
+        for config in configs:
+            if config is not None:
                 self.strategies[config.name] = config
-            except Exception as e:
-                print(f"전략 로드 실패 ({path}): {e}")
 
         return self.strategies
 
+    @staticmethod
+    def _load_file(path: Path) -> Optional[StrategyConfig]:
+        """설정 파일 하나 로드 (실패 시 None)"""
+        try:
+            return StrategyConfigLoader.load(path)
+        except Exception as e:
+            print(f"전략 로드 실패 ({path}): {e}")
+            return None
+
     def get(self, name: str) -> Optional[StrategyConfig]:
         """전략 설정 조회"""
         return self.strategies.get(name)
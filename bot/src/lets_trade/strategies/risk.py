@@ -3,7 +3,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Optional
+
+from ._risk_kernels import HOLD, TAKE_PROFIT, eval_stops
 
 
 class StopType(Enum):
@@ -13,9 +16,18 @@ class StopType(Enum):
     ATR = "atr"               # ATR 기반
 
 
-@dataclass
+# 손절 유형 정수 코드 (판정 경로에서 Enum 비교 대신 사용)
+_STOP_CODES = {StopType.FIXED: 0, StopType.TRAILING: 1, StopType.ATR: 2}
+_STOP_TRAILING = _STOP_CODES[StopType.TRAILING]
+
+
+@dataclass(frozen=True, slots=True)
 class RiskConfig:
-    """리스크 관리 설정"""
+    """리스크 관리 설정
+
+    생성 후 변경할 수 없습니다. 설정을 바꾸려면 dataclasses.replace로 새로 만들어
+    RiskManager.config에 지정하세요 (파생 기준값과 청산 판정 함수가 함께 갱신됨).
+    """
     # 손절/익절
     stop_loss_rate: float = 3.0       # 손절선 (%)
     take_profit_rate: float = 5.0     # 익절선 (%)
@@ -31,8 +43,23 @@ class RiskConfig:
     daily_max_loss_rate: float = 5.0  # 일일 최대 손실 (%)
     daily_max_trades: int = 10        # 일일 최대 거래 횟수
 
+    # 판정용 파생 기준값 (생성 시 한 번 계산 - frozen이라 원본 값과 어긋나지 않음)
+    _neg_stop_loss_rate: float = field(init=False, repr=False, compare=False)
+    _neg_daily_max_loss_rate: float = field(init=False, repr=False, compare=False)
+    _max_stock_weight_frac: float = field(init=False, repr=False, compare=False)
+    _max_total_position_frac: float = field(init=False, repr=False, compare=False)
+    _stop_code: int = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        set_derived = object.__setattr__
+        set_derived(self, "_neg_stop_loss_rate", -self.stop_loss_rate)
+        set_derived(self, "_neg_daily_max_loss_rate", -self.daily_max_loss_rate)
+        set_derived(self, "_max_stock_weight_frac", self.max_stock_weight / 100)
+        set_derived(self, "_max_total_position_frac", self.max_total_position / 100)
+        set_derived(self, "_stop_code", _STOP_CODES[self.stop_type])
+
+
+@dataclass(slots=True)
 class PositionState:
     """포지션 상태"""
     symbol: str
@@ -40,7 +67,7 @@ class PositionState:
     current_price: float
     quantity: int
     highest_price: float = 0.0  # 트레일링 스탑용
-    entry_date: datetime = field(default_factory=datetime.now)
+    entry_date: Optional[datetime] = None  # 미지정 시 RiskManager.add_position에서 기록
 
     @property
     def profit_rate(self) -> float:
@@ -55,7 +82,7 @@ class PositionState:
         return self.current_price * self.quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
     """일일 통계"""
     date: date
@@ -64,12 +91,21 @@ class DailyStats:
     trade_count: int = 0
     profit_loss: float = 0.0
 
+    # daily_return 캐시 (계산 당시 current_capital과 함께 보관, 값이 바뀌면 다시 계산)
+    _return_capital: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _return_value: float = field(default=0.0, init=False, repr=False, compare=False)
+
     @property
     def daily_return(self) -> float:
         """일일 수익률 (%)"""
-        if self.start_capital <= 0:
-            return 0.0
-        return (self.current_capital - self.start_capital) / self.start_capital * 100
+        current_capital = self.current_capital
+        if current_capital != self._return_capital:
+            if self.start_capital <= 0:
+                self._return_value = 0.0
+            else:
+                self._return_value = (current_capital - self.start_capital) / self.start_capital * 100
+            self._return_capital = current_capital
+        return self._return_value
 
 
 class RiskManager:
@@ -80,11 +116,63 @@ class RiskManager:
     """
 
     def __init__(self, config: Optional[RiskConfig] = None):
-        self.config = config or RiskConfig()
-        self.positions: dict[str, PositionState] = {}
+        self.config = config or RiskConfig()  # setter에서 청산 판정 함수도 구성
+        # 포지션 추가/제거는 add_position/remove_position으로만 (스냅샷을 함께 교체)
+        self._positions: dict[str, PositionState] = {}
+        # 읽기용 포지션 스냅샷 (추가/제거 시 새 튜플로 교체 - 다른 스레드의 조회는 락 없이 순회)
+        self._positions_snapshot: tuple[PositionState, ...] = ()
         self.daily_stats: Optional[DailyStats] = None
         self._is_trading_halted = False
 
+    @property
+    def positions(self) -> MappingProxyType[str, PositionState]:
+        """보유 포지션 (읽기 전용 뷰)"""
+        return MappingProxyType(self._positions)
+
+    @property
+    def config(self) -> RiskConfig:
+        return self._config
+
+    @config.setter
+    def config(self, config: RiskConfig) -> None:
+        self._config = config
+        self._close_check = self._build_close_check(config)
+        self._can_trade_cache: Optional[tuple[bool, str]] = None
+
+    @staticmethod
+    def _build_close_check(config: RiskConfig) -> Callable[[PositionState], int]:
+        """손절 유형에 맞춘 청산 판정 함수 생성 (기준값은 클로저에 고정, 호출마다 유형 분기 없음)"""
+        neg_stop_loss_rate = config._neg_stop_loss_rate
+        take_profit_rate = config.take_profit_rate
+        trailing_stop_rate = config.trailing_stop_rate
+
+        if config._stop_code == _STOP_TRAILING:
+            def close_check(position: PositionState) -> int:
+                # 트레일링 스탑용 최고가 갱신 (_check_trailing_stop과 동일)
+                if position.current_price > position.highest_price:
+                    position.highest_price = position.current_price
+                return eval_stops(
+                    float(position.entry_price),
+                    float(position.current_price),
+                    float(position.highest_price),
+                    neg_stop_loss_rate,
+                    take_profit_rate,
+                    trailing_stop_rate,
+                    True,
+                )
+        else:
+            def close_check(position: PositionState) -> int:
+                return eval_stops(
+                    float(position.entry_price),
+                    float(position.current_price),
+                    0.0,
+                    neg_stop_loss_rate,
+                    take_profit_rate,
+                    trailing_stop_rate,
+                    False,
+                )
+        return close_check
+
     def initialize_daily(self, capital: float) -> None:
         """일일 통계 초기화 (매일 장 시작 전 호출)"""
         self.daily_stats = DailyStats(
@@ -93,12 +181,14 @@ class RiskManager:
             current_capital=capital,
         )
         self._is_trading_halted = False
+        self._can_trade_cache = None
 
     def update_capital(self, current_capital: float) -> None:
         """현재 자본 업데이트"""
         if self.daily_stats:
             self.daily_stats.current_capital = current_capital
             self.daily_stats.profit_loss = current_capital - self.daily_stats.start_capital
+            self._can_trade_cache = None
 
     # ==================== 손절/익절 ====================
 
@@ -112,10 +202,10 @@ class RiskManager:
         Returns:
             bool: 손절 필요 여부
         """
-        if self.config.stop_type == StopType.TRAILING:
+        if self.config._stop_code == _STOP_TRAILING:
             return self._check_trailing_stop(position)
 
-        return position.profit_rate <= -self.config.stop_loss_rate
+        return position.profit_rate <= self.config._neg_stop_loss_rate
 
     def check_take_profit(self, position: PositionState) -> bool:
         """
@@ -153,13 +243,10 @@ class RiskManager:
         Returns:
             tuple[bool, str]: (청산 필요 여부, 사유)
         """
-        if self.check_stop_loss(position):
-            return True, "손절"
-
-        if self.check_take_profit(position):
-            return True, "익절"
-
-        return False, ""
+        code = self._close_check(position)
+        if code == HOLD:
+            return False, ""
+        return True, "익절" if code == TAKE_PROFIT else "손절"
 
     # ==================== 포지션 사이징 ====================
 
@@ -211,11 +298,10 @@ class RiskManager:
         Returns:
             bool: 투자 가능 여부
         """
-        current_position = self.positions.get(symbol)
+        current_position = self._positions.get(symbol)
         current_amount = current_position.market_value if current_position else 0
 
-        new_weight = (current_amount + add_amount) / total_capital * 100
-        return new_weight <= self.config.max_stock_weight
+        return current_amount + add_amount <= total_capital * self.config._max_stock_weight_frac
 
     def check_total_exposure(
         self,
@@ -232,9 +318,8 @@ class RiskManager:
         Returns:
             bool: 투자 가능 여부
         """
-        current_exposure = sum(p.market_value for p in self.positions.values())
-        new_exposure = (current_exposure + add_amount) / total_capital * 100
-        return new_exposure <= self.config.max_total_position
+        current_total = sum(p.market_value for p in self._positions_snapshot)
+        return current_total + add_amount <= total_capital * self.config._max_total_position_frac
 
     # ==================== 일일 제한 ====================
 
@@ -248,7 +333,7 @@ class RiskManager:
         if self.daily_stats is None:
             return True
 
-        if self.daily_stats.daily_return <= -self.config.daily_max_loss_rate:
+        if self.daily_stats.daily_return <= self.config._neg_daily_max_loss_rate:
             self._is_trading_halted = True
             return False
 
@@ -270,6 +355,7 @@ class RiskManager:
         """거래 기록 (횟수 증가)"""
         if self.daily_stats:
             self.daily_stats.trade_count += 1
+            self._can_trade_cache = None
 
     # ==================== 통합 체크 ====================
 
@@ -277,19 +363,27 @@ class RiskManager:
         """
         거래 가능 여부 종합 확인
 
+        결과는 update_capital/record_trade/initialize_daily 호출 전까지 재사용합니다.
+
         Returns:
             tuple[bool, str]: (거래 가능 여부, 불가 사유)
         """
-        if self._is_trading_halted:
-            return False, "거래 중단됨 (일일 손실 한도 초과)"
+        cached = self._can_trade_cache
+        if cached is not None:
+            return cached
 
-        if not self.check_daily_loss_limit():
+        if self._is_trading_halted:
+            result = False, "거래 중단됨 (일일 손실 한도 초과)"
+        elif not self.check_daily_loss_limit():
+            # 이번 호출에서 거래가 중단됨 - 다음 호출부터는 중단 사유를 반환하도록 캐시하지 않음
             return False, "일일 최대 손실 한도 초과"
+        elif not self.check_daily_trade_limit():
+            result = False, "일일 최대 거래 횟수 초과"
+        else:
+            result = True, ""
 
-        if not self.check_daily_trade_limit():
-            return False, "일일 최대 거래 횟수 초과"
-
-        return True, ""
+        self._can_trade_cache = result
+        return result
 
     def can_open_position(
         self,
@@ -330,28 +424,35 @@ class RiskManager:
     # ==================== 포지션 관리 ====================
 
     def add_position(self, position: PositionState) -> None:
-        """포지션 추가"""
-        self.positions[position.symbol] = position
+        """포지션 추가 (같은 종목이 있으면 교체)"""
+        if position.entry_date is None:
+            position.entry_date = datetime.now()
+        self._positions[position.symbol] = position
+        self._positions_snapshot = tuple(self._positions.values())
 
     def remove_position(self, symbol: str) -> Optional[PositionState]:
         """포지션 제거"""
-        return self.positions.pop(symbol, None)
+        position = self._positions.pop(symbol, None)
+        if position is not None:
+            self._positions_snapshot = tuple(self._positions.values())
+        return position
 
     def update_position_price(self, symbol: str, current_price: float) -> None:
         """포지션 현재가 업데이트"""
-        if symbol in self.positions:
-            self.positions[symbol].current_price = current_price
+        position = self._positions.get(symbol)
+        if position is not None:
+            position.current_price = current_price
             # 트레일링 스탑용 최고가 업데이트
-            if current_price > self.positions[symbol].highest_price:
-                self.positions[symbol].highest_price = current_price
+            if current_price > position.highest_price:
+                position.highest_price = current_price
 
     def get_position(self, symbol: str) -> Optional[PositionState]:
         """포지션 조회"""
-        return self.positions.get(symbol)
+        return self._positions.get(symbol)
 
     def get_all_positions(self) -> list[PositionState]:
         """모든 포지션 조회"""
-        return list(self.positions.values())
+        return list(self._positions_snapshot)
 
     def get_positions_to_close(self) -> list[tuple[PositionState, str]]:
         """
@@ -360,9 +461,10 @@ class RiskManager:
         Returns:
             list[tuple[PositionState, str]]: (포지션, 청산 사유) 목록
         """
-        to_close = []
-        for position in self.positions.values():
-            should_close, reason = self.should_close_position(position)
-            if should_close:
-                to_close.append((position, reason))
-        return to_close
+        close_check = self._close_check
+        result = []
+        for position in self._positions_snapshot:
+            code = close_check(position)
+            if code != HOLD:
+                result.append((position, "익절" if code == TAKE_PROFIT else "손절"))
+        return result